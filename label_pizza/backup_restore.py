@@ -30,6 +30,7 @@ import os
 import sys
 import gzip
 import datetime
+import time
 import json
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
@@ -48,6 +49,25 @@ except ImportError:
     sys.exit(1)
 
 
+# Large write buffer so a dump reaches the disk in few, big writes
+BACKUP_WRITE_BUFFER = 4 * 1024 * 1024
+
+# Optional ISA-L accelerated gzip (pip install isal); writes standard .gz files.
+# Set LABEL_PIZZA_BACKUP_GZIP=gzip to force the standard library implementation.
+try:
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+
+def _open_gzip(path: str, mode: str, compresslevel: int = 6):
+    """Open a gzip text file, using ISA-L when it is installed"""
+    if igzip is not None and os.getenv("LABEL_PIZZA_BACKUP_GZIP", "isal").lower() != "gzip":
+        # ISA-L only supports levels 0-3
+        return igzip.open(path, mode, encoding='utf-8', compresslevel=min(compresslevel, 3))
+    return gzip.open(path, mode, encoding='utf-8', compresslevel=compresslevel)
+
+
 class DatabaseBackupRestore:
     """Handle database backup and restore operations using psycopg2"""
     
@@ -55,8 +75,9 @@ class DatabaseBackupRestore:
         self.db_url = db_url
         self.parsed_url = urlparse(db_url)
     
-    def create_backup(self, output_file: str, compress: bool = False, schema_only: bool = False, verbose: bool = False) -> bool:
-        """Create a database backup"""
+    def create_backup(self, output_file: str, compress: bool = False, schema_only: bool = False, verbose: bool = False,
+                      compresslevel: int = 6) -> bool:
+        """Create a database backup, streaming rows straight into the output file"""
         try:
             # Handle compression
             if compress and not output_file.endswith('.gz'):
@@ -74,9 +95,10 @@ class DatabaseBackupRestore:
             
             # Choose file handler based on compression
             if compress:
-                file_handle = gzip.open(output_file, 'wt', encoding='utf-8')
+                # gzip's default level 9 is much slower than 6 for a few percent smaller dumps
+                file_handle = _open_gzip(output_file, 'wt', compresslevel)
             else:
-                file_handle = open(output_file, 'w', encoding='utf-8')
+                file_handle = open(output_file, 'w', encoding='utf-8', buffering=BACKUP_WRITE_BUFFER)
             
             try:
                 # Write header
@@ -156,7 +178,7 @@ class DatabaseBackupRestore:
                         if verbose:
                             print("   📖 Reading backup file...")
                         if is_compressed:
-                            file_handle = gzip.open(input_file, 'rt', encoding='utf-8')
+                            file_handle = _open_gzip(input_file, 'rt')
                         else:
                             file_handle = open(input_file, 'r', encoding='utf-8')
                         
@@ -449,49 +471,18 @@ class DatabaseBackupRestore:
                 file_handle.write(f"-- DATA_START:{table}\n")
                 file_handle.write(f"-- COLUMNS:{json.dumps(columns)}\n")
                 
-                # Use RealDictCursor for data queries
-                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as data_cursor:
-                    # Fetch and write data in batches
-                    data_cursor.execute(f'SELECT * FROM "{table}";')
-                    
-                    batch_size = 1000
-                    rows_processed = 0
-                    
-                    while True:
-                        rows = data_cursor.fetchmany(batch_size)
-                        if not rows:
-                            break
-                        
-                        for row in rows:
-                            try:
-                                # Convert row to JSON-safe format
-                                json_row = {}
-                                for col in columns:
-                                    value = row[col]
-                                    
-                                    if value is None:
-                                        json_row[col] = None
-                                    elif isinstance(value, datetime.datetime):
-                                        json_row[col] = value.isoformat()
-                                    elif isinstance(value, datetime.date):
-                                        json_row[col] = value.isoformat()
-                                    elif isinstance(value, (dict, list)):
-                                        # Already JSON-serializable
-                                        json_row[col] = value
-                                    elif isinstance(value, (int, float, bool)):
-                                        json_row[col] = value
-                                    else:
-                                        # Convert to string for safety
-                                        json_row[col] = str(value)
-                                
-                                # Write as JSON line
-                                file_handle.write(f"-- ROW:{json.dumps(json_row, ensure_ascii=False)}\n")
-                                rows_processed += 1
-                                
-                            except Exception as e:
-                                if verbose:
-                                    print(f"     ⚠️  Error processing row {rows_processed} in {table}: {e}")
-                                continue
+                # Let PostgreSQL render every row as a "-- ROW:" JSON line and stream
+                # them straight into the file, instead of fetching rows and
+                # formatting each one in Python. row_to_json escapes control
+                # characters, so CSV with control-character delimiter and quote
+                # writes each line verbatim.
+                with conn.cursor() as data_cursor:
+                    data_cursor.copy_expert(
+                        f"""COPY (SELECT '-- ROW:' || row_to_json(t)::text FROM "{table}" t) """
+                        "TO STDOUT WITH (FORMAT csv, DELIMITER E'\\x01', QUOTE E'\\x02')",
+                        file_handle
+                    )
+                    rows_processed = data_cursor.rowcount
                 
                 file_handle.write(f"-- DATA_END:{table}\n\n")
                 if verbose:
@@ -859,7 +850,7 @@ class DatabaseBackupRestore:
 
 def create_timestamped_filename(prefix: str = "backup", extension: str = ".sql") -> str:
     """Create a timestamped filename"""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     return f"{prefix}_{timestamp}{extension}"
 
 
@@ -870,24 +861,32 @@ def list_backups(backup_dir: str = "./backups"):
         print(f"📁 Backup directory doesn't exist: {backup_dir}")
         return
     
+    # One directory scan; DirEntry caches its stat and the name set answers
+    # metadata-file lookups without extra syscalls
+    with os.scandir(backup_path) as it:
+        entries = [entry for entry in it if entry.is_file()]
+    names = {entry.name for entry in entries}
+    
     backups = []
-    for file in backup_path.glob("*.sql*"):
-        if file.suffix in ['.sql', '.gz'] and not file.name.endswith('.meta.json'):
-            metadata_file = file.with_suffix(file.suffix + '.meta.json')
+    for entry in entries:
+        file = Path(entry.path)
+        if not entry.name.startswith('.') and '.sql' in entry.name and file.suffix in ['.sql', '.gz'] and not entry.name.endswith('.meta.json'):
+            metadata_name = entry.name + '.meta.json'
             metadata = {}
             
-            if metadata_file.exists():
+            if metadata_name in names:
                 try:
-                    with open(metadata_file) as f:
+                    with open(backup_path / metadata_name) as f:
                         metadata = json.load(f)
                 except:
                     pass
             
+            stat = entry.stat()
             backups.append({
                 'file': file,
                 'metadata': metadata,
-                'size': file.stat().st_size,
-                'modified': datetime.datetime.fromtimestamp(file.stat().st_mtime)
+                'size': stat.st_size,
+                'modified': datetime.datetime.fromtimestamp(stat.st_mtime)
             })
     
     if not backups:
@@ -999,7 +998,7 @@ Dependencies:
             output_file = args.output
             
             # If output is just a filename (no path separator), combine with backup_dir
-            if not os.path.sep in output_file and not os.path.isabs(output_file):
+            if output_file == os.path.basename(output_file):
                 backup_dir = Path(args.backup_dir)
                 backup_dir.mkdir(exist_ok=True)
                 output_file = str(backup_dir / output_file)
@@ -1019,7 +1018,7 @@ Dependencies:
         input_file = args.input
         
         # If input is just a filename (no path separator), combine with backup_dir
-        if not os.path.sep in input_file and not os.path.isabs(input_file):
+        if input_file == os.path.basename(input_file):
             input_file = os.path.join(args.backup_dir, input_file)
         
         success = handler.restore_backup(
@@ -16,6 +16,7 @@ if label_pizza.db.SessionLocal is None:
 from label_pizza.ui_components import custom_info
 import functools
 import inspect
+from operator import itemgetter
 from typing import Callable, Any
 
 ###############################################################################
@@ -37,6 +38,19 @@ def get_db_session():
     finally:
         session.close()
 
+@contextmanager
+def get_db_read_session():
+    """Get a session for read-only loaders: no autoflush, and on PostgreSQL the
+    transaction is opened READ ONLY"""
+    if label_pizza.db.SessionLocal is None:
+        raise ValueError("SessionLocal is not initialized")
+    session = label_pizza.db.SessionLocal(autoflush=False)
+    try:
+        session.connection(execution_options={"postgresql_readonly": True})
+        yield session
+    finally:
+        session.close()
+
 def check_database_health() -> dict:
     """Check database connection health"""
     try:
@@ -84,7 +98,7 @@ def handle_database_errors(func):
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_cached_all_users(session_id: str) -> pd.DataFrame:
     """Cache all users data - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return AuthService.get_all_users(session=session)
         except Exception as e:
@@ -94,7 +108,7 @@ def get_cached_all_users(session_id: str) -> pd.DataFrame:
 @st.cache_data(ttl=3600)  # Cache for 1 hour  
 def get_cached_project_questions(project_id: int, session_id: str) -> List[Dict]:
     """Cache project questions - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return ProjectService.get_project_questions(project_id=project_id, session=session)
         except Exception as e:
@@ -109,7 +123,7 @@ def get_project_questions_cached(project_id: int) -> List[Dict]:
 @st.cache_data(ttl=1800)  # Cache for 30 minutes
 def get_cached_question_answers(project_id: int, session_id: str) -> pd.DataFrame:
     """Cache ALL annotator answers for a project - annotator answers rarely change"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             # Get all questions for the project first
             questions = ProjectService.get_project_questions(project_id=project_id, session=session)
@@ -139,7 +153,7 @@ def get_cached_question_answers(project_id: int, session_id: str) -> pd.DataFram
 @st.cache_data(ttl=1800)  # Cache for 30 minutes
 def get_cached_project_annotators(project_id: int, session_id: str) -> Dict[str, Dict]:
     """Cache project annotators info - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             # Get project assignments to determine project-specific roles
             assignments_df = AuthService.get_project_assignments(session=session)
@@ -190,17 +204,24 @@ def get_cached_project_annotators(project_id: int, session_id: str) -> Dict[str,
 @st.cache_data(ttl=1800)  # Cache for 30 minutes
 def get_cached_project_videos(project_id: int, session_id: str) -> List[Dict]:
     """Cache project videos - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return VideoService.get_project_videos(project_id=project_id, session=session)
         except Exception as e:
             print(f"Error in get_cached_project_videos: {e}")
             return []
 
+@st.cache_data(ttl=1800)  # Cache for 30 minutes
+def get_cached_default_sorted_project_videos(project_id: int, sort_order: str, session_id: str) -> List[Dict]:
+    """Cache project videos in default (ID) order so reruns don't re-sort them"""
+    videos = get_cached_project_videos(project_id, session_id)
+    videos.sort(key=itemgetter("id"), reverse=(sort_order == "Descending"))
+    return videos
+
 @st.cache_data(ttl=1800)  # Cache for 30 minutes
 def get_cached_bulk_reviewer_data(project_id: int, session_id: str) -> Dict:
     """Cache ALL reviewer data for entire project to minimize repeated queries"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             # 🚀 OPTIMIZED: Get all annotator answers using service method
             all_answers = AnnotatorService.get_all_project_answers(project_id=project_id, session=session)
@@ -378,7 +399,7 @@ def get_video_reviewer_data_from_bulk(video_id: int, project_id: int, annotator_
 @st.cache_data(ttl=600)  # Cache for 10 minutes
 def get_cached_video_reviewer_data(video_id: int, project_id: int, annotator_user_ids: List[int], session_id: str) -> Dict:
     """Cache ALL reviewer data for a specific video to minimize repeated queries"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             cache_data = {
                 "annotator_answers": {},
@@ -473,7 +494,7 @@ def get_cached_video_reviewer_data(video_id: int, project_id: int, annotator_use
 @st.cache_data(ttl=3600)  # Cache for 1 hour - questions rarely change
 def get_cached_questions_by_group(group_id: int, session_id: str) -> List[Dict]:
     """Cache questions by group - questions rarely change once project is running"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return QuestionService.get_questions_by_group_id(group_id=group_id, session=session)
         except Exception as e:
@@ -489,7 +510,7 @@ def get_questions_by_group_cached(group_id: int) -> List[Dict]:
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_cached_project_metadata(project_id: int, session_id: str) -> Dict:
     """Cache project metadata - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return ProjectService.get_project_dict_by_id(project_id=project_id, session=session)
         except Exception as e:
@@ -530,7 +551,7 @@ def get_cached_user_completion_progress(project_id: int) -> Dict[int, float]:
 @st.cache_data(ttl=3600)  # Cache for 1 hour - custom display changes rarely
 def get_cached_custom_display_data(project_id: int, session_id: str) -> Dict[str, Any]:
     """Cache all custom display data for a project to minimize database calls"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             # Check if project's schema has custom display enabled
             project = ProjectService.get_project_by_id(project_id=project_id, session=session)
@@ -648,7 +669,7 @@ def clear_custom_display_cache(project_id: int):
 @st.cache_data(ttl=3600)  # Cache for 1 hour - ground truth state changes infrequently
 def get_cached_project_has_full_ground_truth(project_id: int, session_id: str) -> bool:
     """Cache project full ground truth check - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return ProjectService.check_project_has_full_ground_truth(project_id=project_id, session=session)
         except Exception as e:
@@ -658,7 +679,7 @@ def get_cached_project_has_full_ground_truth(project_id: int, session_id: str) -
 @st.cache_data(ttl=1800)  # Cache for 30 minutes - accuracy data changes infrequently  
 def get_cached_annotator_accuracy(project_id: int, session_id: str) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Cache annotator accuracy data - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return GroundTruthService.get_annotator_accuracy(project_id=project_id, session=session)
         except Exception as e:
@@ -668,7 +689,7 @@ def get_cached_annotator_accuracy(project_id: int, session_id: str) -> Dict[int,
 @st.cache_data(ttl=1800)  # Cache for 30 minutes - reviewer accuracy data changes infrequently
 def get_cached_reviewer_accuracy(project_id: int, session_id: str) -> Dict[int, Dict[int, Dict[str, int]]]:
     """Cache reviewer accuracy data - changes infrequently"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return GroundTruthService.get_reviewer_accuracy(project_id=project_id, session=session)
         except Exception as e:
@@ -756,6 +777,11 @@ def get_project_videos(project_id: int) -> List[Dict]:
     session_id = get_session_cache_key()
     return get_cached_project_videos(project_id, session_id)
 
+def get_default_sorted_project_videos(project_id: int, sort_order: str) -> List[Dict]:
+    """Get videos in a project sorted by ID - with caching"""
+    session_id = get_session_cache_key()
+    return get_cached_default_sorted_project_videos(project_id, sort_order, session_id)
+
 def get_project_groups_with_projects(user_id: int, role: str) -> Dict:
     """Get project groups with their projects for a user - OPTIMIZED VERSION"""
     with get_db_session() as session:
@@ -917,7 +943,7 @@ def check_project_has_full_ground_truth(project_id: int) -> bool:
 
 def check_all_questions_have_ground_truth(video_id: int, project_id: int, question_group_id: int) -> bool:
     """Check if all questions have ground truth for a video and question group"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             return GroundTruthService.check_all_questions_have_ground_truth_for_group(video_id, project_id, question_group_id, session)
         except Exception as e:
@@ -927,7 +953,7 @@ def check_all_questions_have_ground_truth(video_id: int, project_id: int, questi
 
 def check_ground_truth_exists_for_group(video_id: int, project_id: int, question_group_id: int) -> bool:
     """Check if ground truth exists for a question group"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         try:
             questions = get_questions_by_group_cached(group_id=question_group_id)
             if not questions:
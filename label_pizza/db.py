@@ -1,17 +1,15 @@
 # db.py  – lives next to models.py and app.py
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import atexit
 
 load_dotenv(".env")  # loads DBURL
 
-# Base class for all models
-Base = declarative_base()
-
-# Import models to ensure they are registered with Base
-from label_pizza.models import *  # This ensures all models are registered with Base
+# Base class for all models; importing it loads models.py, which registers every table
+from label_pizza.models import Base
 
 # Placeholder variables that will be set by init_database()
 engine = None
@@ -33,27 +31,40 @@ def init_database(database_url_name="DBURL"):
     if not url:
         raise ValueError(f"Database URL '{database_url_name}' not found in environment variables")
     
+    # psycopg2 can send executemany() UPDATE/DELETE batches as pipelined pages
+    # instead of one round-trip per parameter set
+    driver_options = {}
+    if make_url(url).get_driver_name() == "psycopg2":
+        driver_options = {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+    
     engine = create_engine(
         url,
         echo=False,
         future=True,
         pool_pre_ping=True,
+        pool_use_lifo=True,  # reuse the most recently returned connection so idle ones can be recycled
         pool_recycle=3600,
         pool_size=20,
         max_overflow=30,
         pool_timeout=30,
-        pool_reset_on_return='commit'
+        pool_reset_on_return='commit',
+        query_cache_size=1200,  # services issue well over the default 500 distinct statements
+        **driver_options
     )
     
     SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
     
-    # Create tables if needed
-    Base.metadata.create_all(engine)
+    # Create tables if needed; one catalog query instead of create_all's per-table checks
+    existing_tables = set(inspect(engine).get_table_names())
+    if not existing_tables.issuperset(Base.metadata.tables):
+        Base.metadata.create_all(engine)
     
     print(f"Database initialized with URL: {database_url_name}")
 
 def cleanup_connections():
     """Clean up all database connections"""
+    if engine is None:
+        return
     try:
         engine.dispose()
         print("Database connections cleaned up")
@@ -1,6 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
 from typing import Dict, Optional, List, Any, Tuple
 from sqlalchemy.orm import Session
 from contextlib import contextmanager
@@ -26,7 +33,7 @@ from label_pizza.database_utils import (
     get_cached_user_completion_progress, get_optimized_all_project_annotators,
     get_project_custom_display_data, get_questions_by_group_with_custom_display_cached,
     clear_custom_display_cache, get_project_metadata_cached, get_project_questions_cached,
-    get_video_reviewer_data_from_bulk
+    get_video_reviewer_data_from_bulk, get_default_sorted_project_videos
 )
 from label_pizza.autosubmit_features import (
     display_manual_auto_submit_controls, run_project_wide_auto_submit_on_entry,
@@ -34,6 +41,47 @@ from label_pizza.autosubmit_features import (
 )
 from label_pizza.accuracy_analytics import display_user_accuracy_simple, display_accuracy_button_for_project
 
+@lru_cache(maxsize=256)
+def _project_view_keys(project_id: int, role: str) -> SimpleNamespace:
+    """Session-state keys used by the project view, built once per (project, role)"""
+    return SimpleNamespace(
+        pairs_per_row=f"{role}_pairs_per_row",
+        per_page=f"{role}_per_page",
+        page=f"{role}_current_page_{project_id}",
+        sort_by=f"video_sort_by_{project_id}",
+        sort_order=f"video_sort_order_{project_id}",
+        sort_applied=f"sort_applied_{project_id}",
+        filters=f"video_filters_{project_id}",
+        annotator_sort_by=f"annotator_video_sort_by_{project_id}",
+        annotator_sort_order=f"annotator_video_sort_order_{project_id}",
+        annotator_sort_applied=f"annotator_sort_applied_{project_id}",
+    )
+
+# Upper bound on threads (and DB sessions) used to score videos for annotator sorting
+ANNOTATOR_SORT_MAX_WORKERS = 8
+
+# Static HTML pieces reused on every render
+_PURPLE_CARD_STYLE = get_card_style('#B180FF')
+
+_PROJECT_CARD_TEMPLATE = """
+<div style="border: 2px solid {group_color}; border-radius: 12px; padding: 12px 18px; margin: 4px 0; background: linear-gradient(135deg, white, {group_color}05); min-height: 160px; position: relative;" title="Group: {group_name}">
+    <div style="position: absolute; top: -6px; right: 10px; background: {group_color}; color: white; padding: 2px 6px; border-radius: 6px; font-size: 0.7rem; font-weight: bold;" title="{group_name}">
+        {truncated_group_name}
+    </div>
+    <h4 style="margin: 6px 0 4px 0; color: black; font-size: 1.1rem; line-height: 1.2; word-wrap: break-word;" title="{project_name}">{highlighted_name}</h4>
+    <p style="margin: 4px 0; color: #666; font-size: 0.9rem; min-height: 35px; line-height: 1.3;">
+        {description}
+    </p>
+    <div style="margin: 6px 0;">
+        <p style="margin: 2px 0;"><strong>Mode:</strong> {mode}</p>
+        <p style="margin: 2px 0;"><strong>Progress:</strong> {progress_text}</p>
+        <p style="margin: 2px 0; color: #666; font-size: 0.85rem;">
+            <strong>Assigned:</strong> {assignment_date}
+        </p>
+    </div>
+</div>
+"""
+
 ###############################################################################
 # Video Display Functions
 ###############################################################################
@@ -82,7 +130,7 @@ def display_video_answer_pair(video: Dict, project_id: int, user_id: int, role:
         
         # Progress display format
         st.markdown(f"""
-        <div style="{get_card_style('#B180FF')}text-align: center;">
+        <div style="{_PURPLE_CARD_STYLE}text-align: center;">
             <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                 {video['uid']} - {' | '.join(completion_details)} - Progress: {completed_count}/{total_count} Complete
             </div>
@@ -547,8 +595,7 @@ def preload_gt_status_for_questions(video_id: int, project_id: int, question_ids
         user_info = {}
         if all_user_ids:
             users_query = select(User.id, User.user_id_str).where(User.id.in_(all_user_ids))
-            user_results = session.execute(users_query).all()
-            user_info = {r.id: r.user_id_str for r in user_results}
+            user_info = dict(session.execute(users_query).all())
         
         # Build status strings
         for result in results:
@@ -1560,7 +1607,7 @@ def display_enhanced_sort_tab(project_id: int, role: str):
     
     # Revert to original style to match other tabs
     st.markdown(f"""
-    <div style="{get_card_style('#B180FF')}text-align: center;">
+    <div style="{_PURPLE_CARD_STYLE}text-align: center;">
         <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
             📊 Sort videos by different criteria to optimize your review workflow
         </div>
@@ -1826,10 +1873,14 @@ def display_enhanced_sort_tab(project_id: int, role: str):
     
     custom_info("💡 Configure your sorting options above, then click <strong>Apply</strong> to sort the videos accordingly.")
 
-def get_cached_sorted_and_filtered_videos(project_id: int, role: str) -> List[Dict]:
-    """Get cached sorted and filtered videos if Apply was clicked"""
+def get_cached_sorted_and_filtered_videos(project_id: int, role: str, sort_order: Optional[str] = None) -> List[Dict]:
+    """Get cached sorted and filtered videos if Apply was clicked, otherwise the
+    cached default (ID) order when a sort_order is given"""
     cache_key = f"applied_sorted_and_filtered_videos_{project_id}_{role}"
-    return st.session_state.get(cache_key, None)
+    cached_videos = st.session_state.get(cache_key, None)
+    if cached_videos is None and sort_order is not None:
+        return get_default_sorted_project_videos(project_id=project_id, sort_order=sort_order)
+    return cached_videos
 
 def set_cached_sorted_and_filtered_videos(videos: List[Dict], project_id: int, role: str):
     """Cache sorted and filtered videos after Apply is clicked"""
@@ -1846,7 +1897,7 @@ def display_enhanced_sort_tab_annotator(project_id: int, user_id: int):
     
     if not is_training_mode:
         st.markdown(f"""
-        <div style="{get_card_style('#B180FF')}text-align: center;">
+        <div style="{_PURPLE_CARD_STYLE}text-align: center;">
             <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                 📝 Annotation Mode - Sort videos by your completion status
             </div>
@@ -1857,7 +1908,7 @@ def display_enhanced_sort_tab_annotator(project_id: int, user_id: int):
         sort_options = ["Default", "Completion Rate"]
     else:
         st.markdown(f"""
-        <div style="{get_card_style('#B180FF')}text-align: center;">
+        <div style="{_PURPLE_CARD_STYLE}text-align: center;">
             <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                 🎓 Training Mode - Sort videos by your completion status or accuracy
             </div>
@@ -2070,7 +2121,7 @@ def display_enhanced_filter_tab(project_id: int, role: str):
     st.markdown("#### 🔍 Video Filtering Options")
     
     st.markdown(f"""
-    <div style="{get_card_style('#B180FF')}text-align: center;">
+    <div style="{_PURPLE_CARD_STYLE}text-align: center;">
         <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
             🎯 Filter videos by specific ground truth answers to focus your review
         </div>
@@ -2280,7 +2331,7 @@ def display_order_tab(project_id: int, role: str, project: Dict):
     st.markdown("#### 📋 Question Group Display Order")
     
     st.markdown(f"""
-    <div style="{get_card_style('#B180FF')}text-align: center;">
+    <div style="{_PURPLE_CARD_STYLE}text-align: center;">
         <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
             🔄 Customize the order of question groups for this session
         </div>
@@ -2508,7 +2559,7 @@ def display_layout_tab_content(videos: List[Dict], role: str):
     st.markdown("#### 🎛️ Video Layout Settings")
     
     st.markdown(f"""
-    <div style="{get_card_style('#B180FF')}text-align: center;">
+    <div style="{_PURPLE_CARD_STYLE}text-align: center;">
         <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
             🎛️ Customize Your Video Display - Adjust how videos and questions are laid out
         </div>
@@ -2535,7 +2586,7 @@ def display_auto_submit_tab(project_id: int, user_id: int, role: str, videos: Li
         # Original annotator logic with auto-submit groups
         if is_training_mode:
             st.markdown(f"""
-            <div style="{get_card_style('#B180FF')}text-align: center;">
+            <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                 <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                     🎓 Training Mode - Auto-submit is disabled during training
                 </div>
@@ -2543,7 +2594,7 @@ def display_auto_submit_tab(project_id: int, user_id: int, role: str, videos: Li
             """, unsafe_allow_html=True)
         else:
             st.markdown(f"""
-            <div style="{get_card_style('#B180FF')}text-align: center;">
+            <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                 <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                     ⚡ Auto-submit using weighted majority voting with configurable thresholds
                 </div>
@@ -2663,7 +2714,7 @@ def display_auto_submit_tab(project_id: int, user_id: int, role: str, videos: Li
     
     else:  # reviewer role - NO AUTO-SUBMIT GROUPS
         st.markdown(f"""
-        <div style="{get_card_style('#B180FF')}text-align: center;">
+        <div style="{_PURPLE_CARD_STYLE}text-align: center;">
             <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                 🔍 Reviewer Auto-Submit - Create ground truth using weighted majority voting
             </div>
@@ -3307,167 +3358,128 @@ def apply_annotator_video_sorting(videos: List[Dict], sort_by: str, sort_order:
             try:
                 q_id = int(q_display.split("(ID: ")[1].split(")")[0])
                 question_ids.append(q_id)
-            except:
+            except (IndexError, ValueError):
                 continue
         
         if not question_ids:
             return videos
         
-        # Calculate scores for each video
-        video_scores = {}
-        with get_db_session() as session:
-            for video in videos:
-                video_id = video["id"]
+        answers_idx = None
+        if sort_by == "Accuracy Rate":
+            # Question types don't depend on the video, look them up once
+            with get_db_session() as session:
+                question_types = {
+                    question_id: QuestionService.get_question_by_id(question_id=question_id, session=session)["type"]
+                    for question_id in question_ids
+                }
+        else:
+            # Project-wide answers for the selected questions, indexed once for O(1) membership checks
+            with get_db_session() as session:
+                answer_frames = []
+                for question_id in question_ids:
+                    answers_df = AnnotatorService.get_question_answers(
+                        question_id=question_id, project_id=project_id, session=session
+                    )
+                    if not answers_df.empty:
+                        answer_frames.append(answers_df.assign(**{"Question ID": question_id}))
+            if answer_frames:
+                answers_idx = pd.concat(answer_frames, ignore_index=True).set_index(
+                    ["User ID", "Video ID", "Question ID"]
+                ).sort_index().index
+        
+        def score_completion(video_id: int) -> Tuple[int, int]:
+            """Return (completed questions, total questions) for one video from the prefetched index"""
+            completed_questions = 0
+            if answers_idx is not None:
+                completed_questions = sum(
+                    1 for question_id in question_ids if (user_id, video_id, question_id) in answers_idx
+                )
+            return completed_questions, len(question_ids)
+        
+        def score_accuracy(video_id: int, session: Session) -> Tuple[int, int]:
+            """Return (correct answers, reviewed answers) vs ground truth for one video"""
+            correct_count = 0
+            total_count = 0
+            
+            # Fetch this video's ground truth and answers once and index them by question
+            gt_df = GroundTruthService.get_ground_truth(
+                video_id=video_id, project_id=project_id, session=session
+            )
+            gt_by_question = gt_df.set_index("Question ID")["Answer Value"] if not gt_df.empty else None
+            
+            # get_answers() includes Answer ID, needed for description reviews
+            answers_df = AnnotatorService.get_answers(
+                video_id=video_id, project_id=project_id, session=session
+            )
+            if answers_df.empty:
+                return correct_count, total_count
+            user_answers = answers_df[answers_df["User ID"] == user_id].set_index("Question ID")
+            
+            for question_id in question_ids:
+                if question_id not in user_answers.index:
+                    continue
+                user_answer = user_answers.loc[question_id]
                 
-                if sort_by == "Completion Rate":
-                    # Calculate completion rate for this user
-                    completed_questions = 0
-                    for question_id in question_ids:
-                        try:
-                            answers_df = AnnotatorService.get_question_answers(
-                                question_id=question_id, project_id=project_id, session=session
-                            )
-                            if not answers_df.empty:
-                                user_answers = answers_df[
-                                    (answers_df["User ID"] == user_id) & 
-                                    (answers_df["Video ID"] == video_id)
-                                ]
-                                if not user_answers.empty:
-                                    completed_questions += 1
-                        except:
-                            continue
-                    
-                    video_scores[video_id] = (completed_questions / len(question_ids)) * 100 if question_ids else 0
-                    
-                # else:  # Accuracy Rate
-                #     # Calculate accuracy rate vs ground truth for this user
-                #     correct_count = 0
-                #     total_count = 0
-                    
-                #     try:
-                #         gt_df = GroundTruthService.get_ground_truth(
-                #             video_id=video_id, project_id=project_id, session=session
-                #         )
-                        
-                #         if not gt_df.empty:
-                #             for question_id in question_ids:
-                #                 # Get ground truth for this question
-                #                 question_gt = gt_df[gt_df["Question ID"] == question_id]
-                #                 if question_gt.empty:
-                #                     continue
-                                
-                #                 gt_answer = question_gt.iloc[0]["Answer Value"]
-                                
-                #                 # Get user's answer
-                #                 answers_df = AnnotatorService.get_question_answers(
-                #                     question_id=question_id, project_id=project_id, session=session
-                #                 )
-                                
-                #                 if not answers_df.empty:
-                #                     user_answers = answers_df[
-                #                         (answers_df["User ID"] == user_id) & 
-                #                         (answers_df["Video ID"] == video_id)
-                #                     ]
-                                    
-                #                     if not user_answers.empty:
-                #                         user_answer = user_answers.iloc[0]["Answer Value"]
-                #                         total_count += 1
-                #                         if user_answer == gt_answer:
-                #                             correct_count += 1
-                        
-                #         video_scores[video_id] = (correct_count / total_count) * 100 if total_count > 0 else 0
-                #     except:
-                #         video_scores[video_id] = 0
-                else:  # Accuracy Rate
-                    # Calculate accuracy rate vs ground truth for this user
-                    correct_count = 0
-                    total_count = 0
-                    
-                    try:
-                        for question_id in question_ids:
-                            # Get question details using service
-                            question_info = QuestionService.get_question_by_id(
-                                question_id=question_id, session=session
-                            )
+                if question_types[question_id] == "single":
+                    # Handle single-choice questions
+                    if gt_by_question is not None and question_id in gt_by_question.index:
+                        total_count += 1
+                        if user_answer["Answer Value"] == gt_by_question.loc[question_id]:
+                            correct_count += 1
                             
-                            if question_info["type"] == "single":
-                                # Handle single-choice questions
-                                gt_df = GroundTruthService.get_ground_truth(
-                                    video_id=video_id, project_id=project_id, session=session
-                                )
-                                
-                                if not gt_df.empty:
-                                    question_gt = gt_df[gt_df["Question ID"] == question_id]
-                                    if not question_gt.empty:
-                                        gt_answer = question_gt.iloc[0]["Answer Value"]
-                                        
-                                        # FIXED: Use get_answers() which includes Answer ID
-                                        answers_df = AnnotatorService.get_answers(
-                                            video_id=video_id, project_id=project_id, session=session
-                                        )
-                                        
-                                        if not answers_df.empty:
-                                            user_answer = answers_df[
-                                                (answers_df["User ID"] == user_id) & 
-                                                (answers_df["Question ID"] == question_id)  # FIXED: Filter by Question ID
-                                            ]
-                                            
-                                            if not user_answer.empty:
-                                                total_count += 1
-                                                if user_answer.iloc[0]["Answer Value"] == gt_answer:
-                                                    correct_count += 1
-                                                    
-                            elif question_info["type"] == "description":
-                                # Handle description questions with review status
-                                # FIXED: Use get_answers() which includes Answer ID
-                                answers_df = AnnotatorService.get_answers(
-                                    video_id=video_id, project_id=project_id, session=session
-                                )
-                                
-                                if not answers_df.empty:
-                                    user_answer = answers_df[
-                                        (answers_df["User ID"] == user_id) & 
-                                        (answers_df["Question ID"] == question_id)  # FIXED: Filter by Question ID
-                                    ]
-                                    
-                                    if not user_answer.empty:
-                                        answer_id = user_answer.iloc[0]["Answer ID"]  # Now this will work!
-                                        
-                                        # Get review status using service
-                                        review = GroundTruthService.get_answer_review(
-                                            answer_id=answer_id, session=session
-                                        )
-                                        
-                                        if review and review.get("status") in ["approved", "rejected"]:
-                                            total_count += 1
-                                            if review.get("status") == "approved":
-                                                correct_count += 1
-                                        # If pending or no review, don't count towards accuracy
-                        
-                        video_scores[video_id] = (correct_count / total_count * 100) if total_count > 0 else 0
-                        
-                    except Exception as e:
-                        print(f"Error calculating accuracy for video {video_id}: {e}")
-                        video_scores[video_id] = 0.0
-
-        # Add scores to videos and sort
-        for video in videos:
-            video["sort_score"] = video_scores.get(video["id"], 0)
+                elif question_types[question_id] == "description":
+                    # Handle description questions with review status
+                    review = GroundTruthService.get_answer_review(
+                        answer_id=int(user_answer["Answer ID"]), session=session
+                    )
+                    
+                    if review and review.get("status") in ["approved", "rejected"]:
+                        total_count += 1
+                        if review.get("status") == "approved":
+                            correct_count += 1
+                    # If pending or no review, don't count towards accuracy
+            return correct_count, total_count
+        
+        def score_video_chunk(video_ids: List[int]) -> List[Tuple[int, int, int]]:
+            """Score a chunk of videos on the worker's own session (sessions are not thread-safe)"""
+            with get_db_session() as session:
+                return [(video_id, *score_accuracy(video_id, session)) for video_id in video_ids]
+        
+        video_ids = [video["id"] for video in videos]
+        if sort_by == "Completion Rate":
+            # Completion is scored from the prefetched index, no database access needed
+            scored_rows = [(video_id, *score_completion(video_id)) for video_id in video_ids]
+        else:
+            # Videos are scored independently, so spread the per-video queries over a small thread pool
+            max_workers = max(1, min(ANNOTATOR_SORT_MAX_WORKERS, len(video_ids)))
+            video_chunks = [video_ids[i::max_workers] for i in range(max_workers)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scored_rows = [row for rows in executor.map(score_video_chunk, video_chunks) for row in rows]
         
+        # Turn (hits, total) counts into percentages in one vectorized pass
+        video_scores = {}
+        if scored_rows:
+            scored_ids, hits, totals = zip(*scored_rows)
+            hits = np.asarray(hits, dtype=np.float64)
+            totals = np.asarray(totals, dtype=np.float64)
+            scores = np.where(totals > 0, hits / np.maximum(totals, 1) * 100.0, 0.0)
+            video_scores = dict(zip(scored_ids, scores.tolist()))
+
+        # Sort by score directly (videos without a score count as 0)
+        scores_by_video = defaultdict(int, video_scores)
         reverse = (sort_order == "Descending")
-        videos.sort(key=lambda x: x.get("sort_score", 0), reverse=reverse)
-        # # print first five videos and their scores
-        # print(f"Sorting by {sort_by} with {sort_order} order")
-        # for video in videos[:5]:
-        #     print(f"Video ID: {video['id']}, Score: {video['sort_score']}")
+        videos.sort(key=lambda x: scores_by_video[x["id"]], reverse=reverse)
         return videos
         
     except Exception as e:
         st.error(f"Error applying annotator sorting: {str(e)}")
         return videos
 
-def display_project_progress(user_id: int, project_id: int, role: str):
-    """Display project progress in a refreshable fragment"""
+def display_project_progress(user_id: int, project_id: int, role: str, progress_data: Optional[Dict] = None):
+    """Display project progress in a refreshable fragment
+    
+    progress_data: pre-fetched ProjectService.progress result; fetched here when not given
+    """
     if role == "annotator":
         overall_progress = calculate_user_overall_progress(user_id=user_id, project_id=project_id)
         st.progress(overall_progress / 100)
@@ -3476,8 +3488,10 @@ def display_project_progress(user_id: int, project_id: int, role: str):
         
     elif role == "meta_reviewer":
         try:
-            with get_db_session() as session:
-                project_progress = ProjectService.progress(project_id=project_id, session=session)
+            project_progress = progress_data
+            if project_progress is None:
+                with get_db_session() as session:
+                    project_progress = ProjectService.progress(project_id=project_id, session=session)
             st.progress(project_progress['completion_percentage'] / 100)
             st.markdown(f"**Ground Truth Progress:** {project_progress['completion_percentage']:.1f}%")
             display_user_accuracy_simple(user_id=user_id, project_id=project_id, role=role)
@@ -3485,8 +3499,10 @@ def display_project_progress(user_id: int, project_id: int, role: str):
             st.error(f"Error loading project progress: {str(e)}")
     else:
         try:
-            with get_db_session() as session:
-                project_progress = ProjectService.progress(project_id=project_id, session=session)
+            project_progress = progress_data
+            if project_progress is None:
+                with get_db_session() as session:
+                    project_progress = ProjectService.progress(project_id=project_id, session=session)
             st.progress(project_progress['completion_percentage'] / 100)
             st.markdown(f"**Ground Truth Progress:** {project_progress['completion_percentage']:.1f}%")
             display_user_accuracy_simple(user_id=user_id, project_id=project_id, role=role)
@@ -3496,22 +3512,33 @@ def display_project_progress(user_id: int, project_id: int, role: str):
 def display_project_view(user_id: int, role: str):
     """Display the selected project with modern, compact layout and enhanced sorting/filtering - OPTIMIZED VERSION"""
 
-    project_id = st.session_state.selected_project_id
+    ss = st.session_state
+    project_id = ss.selected_project_id
+    
+    keys = _project_view_keys(project_id, role)
     
     if st.button("← Back to Dashboard", key="back_to_dashboard"):
         st.session_state.current_view = "dashboard"
         st.session_state.selected_project_id = None
         if "selected_annotators" in st.session_state:
             del st.session_state.selected_annotators
+        ss.get("project_has_full_gt", {}).pop(project_id, None)
         
         clear_project_cache(project_id)
         st.rerun()
     
+    project_progress = None
     try:
         project = get_project_metadata_cached(project_id=project_id)
         try:
+            # One session for the schema details and the reviewer progress shown below
             with get_db_session() as session:
                 schema_details = SchemaService.get_schema_details(schema_id=project["schema_id"], session=session)
+                if role != "annotator":
+                    try:
+                        project_progress = ProjectService.progress(project_id=project_id, session=session)
+                    except ValueError:
+                        project_progress = None  # display_project_progress reports the error
             instructions_url = schema_details.get("instructions_url")
         except Exception as e:
             print(f"Error getting schema details: {e}")
@@ -3525,7 +3552,11 @@ def display_project_view(user_id: int, role: str):
         clear_project_cache(project_id)
         st.session_state.last_project_id = project_id
     
-    mode = "Training" if check_project_has_full_ground_truth(project_id=project_id) else "Annotation"
+    # Prefer the ground truth status the dashboard already loaded for this project
+    has_full_gt = ss.setdefault("project_has_full_gt", {}).get(project_id)
+    if has_full_gt is None:
+        has_full_gt = check_project_has_full_ground_truth(project_id=project_id)
+    mode = "Training" if has_full_gt else "Annotation"
     
     st.markdown(f"## 📁 {project['name']}")
     
@@ -3547,28 +3578,24 @@ def display_project_view(user_id: int, role: str):
             run_project_wide_auto_submit_on_entry(project_id=project_id, user_id=user_id)
             st.session_state[auto_submit_key] = True
     
-    display_project_progress(user_id=user_id, project_id=project_id, role=role)
+    display_project_progress(user_id=user_id, project_id=project_id, role=role, progress_data=project_progress)
     
     videos = get_project_videos(project_id=project_id)
     
     if not videos:
         st.error("No videos found in this project.")
         return
+    original_video_count = len(videos)
 
     # OPTIMIZED SORTING/FILTERING LOGIC
-    cached_videos = get_cached_sorted_and_filtered_videos(project_id, role)
+    # Annotators fall back to the cached ID order; reviewers keep the original order from get_project_videos
+    default_sort_order = None
+    if role == "annotator":
+        default_sort_order = ss.get(keys.annotator_sort_order, "Ascending")
+    cached_videos = get_cached_sorted_and_filtered_videos(project_id, role, sort_order=default_sort_order)
 
     if cached_videos is not None:
         videos = cached_videos
-    else:
-        if role == "annotator":
-            sort_by = st.session_state.get(f"annotator_video_sort_by_{project_id}", "Default") 
-            sort_order = st.session_state.get(f"annotator_video_sort_order_{project_id}", "Ascending")
-            
-            reverse = (sort_order == "Descending")
-            videos.sort(key=lambda x: x.get("id", 0), reverse=reverse)
-        elif role in ["reviewer", "meta_reviewer"]:
-            pass  # Keep videos as-is (original order from get_project_videos)
         
     # Role-specific control panels
     if role == "reviewer":
@@ -3580,7 +3607,7 @@ def display_project_view(user_id: int, role: str):
             with analytics_tab:
                 st.markdown("#### 🎯 Performance Insights")
                 st.markdown(f"""
-                <div style="{get_card_style('#B180FF')}text-align: center;">
+                <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                     <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                         📈 Access detailed accuracy analytics for all participants in this training project
                     </div>
@@ -3596,7 +3623,7 @@ def display_project_view(user_id: int, role: str):
         with annotator_tab:
             st.markdown("#### 👥 Annotator Management")
             st.markdown(f"""
-            <div style="{get_card_style('#B180FF')}text-align: center;">
+            <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                 <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                     🎯 Select which annotators' responses to display during your review process
                 </div>
@@ -3639,7 +3666,7 @@ def display_project_view(user_id: int, role: str):
             with analytics_tab:
                 st.markdown("#### 🎯 Performance Insights")
                 st.markdown(f"""
-                <div style="{get_card_style('#B180FF')}text-align: center;">
+                <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                     <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                         📈 Access detailed accuracy analytics for all participants in training project
                     </div>
@@ -3655,7 +3682,7 @@ def display_project_view(user_id: int, role: str):
         with annotator_tab:
             st.markdown("#### 👥 Annotator Management")
             st.markdown(f"""
-            <div style="{get_card_style('#B180FF')}text-align: center;">
+            <div style="{_PURPLE_CARD_STYLE}text-align: center;">
                 <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
                     🎯 Select which annotators' responses to display during your review process
                 </div>
@@ -3702,72 +3729,65 @@ def display_project_view(user_id: int, role: str):
             display_auto_submit_tab(project_id=project_id, user_id=user_id, role=role, videos=videos)
     
     # Get layout settings
-    video_pairs_per_row = st.session_state.get(f"{role}_pairs_per_row", 1)
-    videos_per_page = st.session_state.get(f"{role}_per_page", min(10, len(videos)))
+    video_pairs_per_row = ss.get(keys.pairs_per_row, 1)
+    videos_per_page = ss.get(keys.per_page, min(10, len(videos)))
     
     st.markdown("---")
     
     # Show sorting/filtering summary
     if role in ["reviewer", "meta_reviewer"]:
-        sort_by = st.session_state.get(f"video_sort_by_{project_id}", "Default")
-        sort_applied = st.session_state.get(f"sort_applied_{project_id}", False)
-        filter_by_gt = st.session_state.get(f"video_filters_{project_id}", {})
+        sort_by = ss.get(keys.sort_by, "Default")
+        sort_applied = ss.get(keys.sort_applied, False)
+        sort_order = ss.get(keys.sort_order, "Ascending")
+        filter_by_gt = ss.get(keys.filters, {})
         
         summary_parts = []
         if sort_by != "Default" and sort_applied:
-            sort_order = st.session_state.get(f"video_sort_order_{project_id}", "Ascending")
             summary_parts.append(f"🔄 {sort_by} ({sort_order})")
         elif sort_by != "Default" and not sort_applied:
             summary_parts.append(f"⚙️ {sort_by} configured")
         elif sort_by == "Default":
-            sort_order = st.session_state.get(f"video_sort_order_{project_id}", "Ascending")
             summary_parts.append(f"📋 Default order ({sort_order})")
         
         if filter_by_gt:
-            original_videos = get_project_videos(project_id=project_id)
-            filtered_count = len(videos)
-            original_count = len(original_videos)
-            
             filter_count = len(filter_by_gt)
             filter_text = "filter" if filter_count == 1 else "filters"
-            summary_parts.append(f"🔍 {filter_count} {filter_text} ({filtered_count}/{original_count} videos)")
+            summary_parts.append(f"🔍 {filter_count} {filter_text} ({len(videos)}/{original_video_count} videos)")
         
         if summary_parts:
             custom_info(" • ".join(summary_parts))
     elif role == "annotator":
-        sort_by = st.session_state.get(f"annotator_video_sort_by_{project_id}", "Default")
-        sort_applied = st.session_state.get(f"annotator_sort_applied_{project_id}", False)
+        sort_by = ss.get(keys.annotator_sort_by, "Default")
+        sort_applied = ss.get(keys.annotator_sort_applied, False)
+        sort_order = ss.get(keys.annotator_sort_order, "Ascending")
         
         if sort_by != "Default" and sort_applied:
-            sort_order = st.session_state.get(f"annotator_video_sort_order_{project_id}", "Ascending")
             custom_info(f"🔄 {sort_by} ({sort_order})")
         elif sort_by != "Default" and not sort_applied:
             custom_info(f"⚙️ {sort_by} configured")
         else:
-            sort_order = st.session_state.get(f"annotator_video_sort_order_{project_id}", "Ascending")
             custom_info(f"📋 Default order ({sort_order})")
     
     # Calculate pagination
     total_pages = (len(videos) - 1) // videos_per_page + 1 if videos else 1
     
-    page_key = f"{role}_current_page_{project_id}"
-    if page_key not in st.session_state:
-        st.session_state[page_key] = 0
+    page_key = keys.page
+    if page_key not in ss:
+        ss[page_key] = 0
     
-    current_page = st.session_state[page_key]
+    current_page = ss[page_key]
     
     start_idx = current_page * videos_per_page
     end_idx = min(start_idx + videos_per_page, len(videos))
-    page_videos = videos[start_idx:end_idx]
     
 
     st.markdown('<div id="video-list-section"></div>', unsafe_allow_html=True)
     video_list_info_str = f"Showing videos {start_idx + 1}-{end_idx} of {len(videos)}"
     display_pagination_controls(current_page, total_pages, page_key, role, project_id, "top", video_list_info_str)
 
-    # Display videos
-    for i in range(0, len(page_videos), video_pairs_per_row):
-        row_videos = page_videos[i:i + video_pairs_per_row]
+    # Display videos (rows are sliced straight from the full list, no per-page copy)
+    for i in range(start_idx, end_idx, video_pairs_per_row):
+        row_videos = videos[i:min(i + video_pairs_per_row, end_idx)]
         
         if video_pairs_per_row == 1:
             display_video_answer_pair(row_videos[0], project_id, user_id, role, mode)
@@ -3786,7 +3806,7 @@ def display_instruction_tab_content(instructions_url: Optional[str]):
     st.markdown("#### 📖 Project Instructions")
     
     st.markdown(f"""
-    <div style="{get_card_style('#B180FF')}text-align: center;">
+    <div style="{_PURPLE_CARD_STYLE}text-align: center;">
         <div style="color: #5C00BF; font-weight: 500; font-size: 0.95rem;">
             📚 Access detailed instructions and guidelines for this annotation project
         </div>
@@ -3826,12 +3846,14 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
     # Get user's project assignments
     with get_db_session() as session:
         assignments_df = AuthService.get_project_assignments(session=session)
-    user_assignments = assignments_df[assignments_df["User ID"] == user_id]
-    
-    if role != "admin":
-        user_assignments = user_assignments[user_assignments["Role"] == backend_role]
-    
-    project_ids = user_assignments["Project ID"].tolist()
+    if assignments_df.empty:
+        project_ids = []
+    else:
+        # Single boolean mask instead of chained DataFrame filters
+        mask = assignments_df["User ID"].to_numpy() == user_id
+        if role != "admin":
+            mask &= assignments_df["Role"].to_numpy() == backend_role
+        project_ids = assignments_df["Project ID"].to_numpy()[mask].tolist()
     
     if not project_ids:
         st.warning(f"No projects assigned to you as {role}.")
@@ -3863,6 +3885,15 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
     
     selected_project_id = None
     
+    project_sort_key = {
+        "Completion Rate": itemgetter("completion_rate"),
+        "Name": itemgetter("name"),
+        "Assignment Date": itemgetter("assignment_datetime"),
+    }.get(sort_by, itemgetter("completion_rate"))
+    
+    # Case-insensitive to match the search filter below
+    highlight_pattern = re.compile(re.escape(search_term), re.IGNORECASE) if search_term else None
+    
     for group_index, (group_name, projects) in enumerate(grouped_projects.items()):
         if not projects:
             continue
@@ -3894,26 +3925,18 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
             
             # Assignment dates
             project_assignments = assignment_dates.get(project_id, {})
-            project_assignment_date = project_assignments.get(backend_role, "Not set")
-            project["assignment_date"] = project_assignment_date
-            
-            if project_assignment_date and project_assignment_date not in ["Not set", "Unknown"]:
-                try:
-                    project["assignment_datetime"] = datetime.strptime(project_assignment_date, "%Y-%m-%d")
-                except:
-                    project["assignment_datetime"] = datetime.min
-            else:
-                project["assignment_datetime"] = datetime.min
+            project["assignment_date"] = project_assignments.get(backend_role, "Not set")
+        
+        # Parse all assignment dates in one pass; "Not set"/"Unknown"/bad values become datetime.min
+        parsed_dates = pd.to_datetime(
+            pd.Series([p["assignment_date"] for p in filtered_projects], dtype=object),
+            format="%Y-%m-%d", errors="coerce"
+        )
+        for project, parsed_date in zip(filtered_projects, parsed_dates):
+            project["assignment_datetime"] = datetime.min if pd.isna(parsed_date) else parsed_date.to_pydatetime()
         
         # Sort projects
-        if sort_by == "Completion Rate":
-            filtered_projects.sort(key=lambda x: x["completion_rate"], reverse=(sort_order == "Descending"))
-        elif sort_by == "Name":
-            filtered_projects.sort(key=lambda x: x["name"], reverse=(sort_order == "Descending"))
-        elif sort_by == "Assignment Date":
-            filtered_projects.sort(key=lambda x: x["assignment_datetime"], reverse=(sort_order == "Descending"))
-        else:
-            filtered_projects.sort(key=lambda x: x["completion_rate"])
+        filtered_projects.sort(key=project_sort_key, reverse=(sort_order == "Descending"))
         
         total_projects = len(filtered_projects)
         projects_per_page = 6
@@ -3938,6 +3961,7 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
         group_color = "#9553FE"
         display_group_name = group_name
         truncated_group_name = group_name[:67] + "..." if len(group_name) > 70 else group_name
+        truncated_tag_group_name = group_name[:57] + "..." if len(group_name) > 60 else group_name
         
         # Enhanced group header with search indicator
         search_indicator = ""
@@ -4023,36 +4047,25 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
                     progress_text = f"{completion_rate:.1f}% Complete"
                     
                     project_name = project["name"]
-                    truncated_tag_group_name = group_name[:57] + "..." if len(group_name) > 60 else group_name
                     
                     # Highlight search matches
                     highlighted_name = project_name
-                    if search_term:
-                        highlighted_name = project_name.replace(
-                            search_term, 
-                            f"🔍 {search_term}"
-                        )
+                    if highlight_pattern:
+                        highlighted_name = highlight_pattern.sub(lambda m: f"🔍 {m.group(0)}", project_name)
                     
                     with st.container():
                         # 🔥 COMPRESSED VERTICAL SPACING: Reduced vertical padding/margins only, keeping horizontal spacing
-                        st.markdown(f"""
-                        <div style="border: 2px solid {group_color}; border-radius: 12px; padding: 12px 18px; margin: 4px 0; background: linear-gradient(135deg, white, {group_color}05); min-height: 160px; position: relative;" title="Group: {display_group_name}">
-                            <div style="position: absolute; top: -6px; right: 10px; background: {group_color}; color: white; padding: 2px 6px; border-radius: 6px; font-size: 0.7rem; font-weight: bold;" title="{display_group_name}">
-                                {truncated_tag_group_name}
-                            </div>
-                            <h4 style="margin: 6px 0 4px 0; color: black; font-size: 1.1rem; line-height: 1.2; word-wrap: break-word;" title="{project_name}">{highlighted_name}</h4>
-                            <p style="margin: 4px 0; color: #666; font-size: 0.9rem; min-height: 35px; line-height: 1.3;">
-                                {project["description"] or 'No description'}
-                            </p>
-                            <div style="margin: 6px 0;">
-                                <p style="margin: 2px 0;"><strong>Mode:</strong> {mode}</p>
-                                <p style="margin: 2px 0;"><strong>Progress:</strong> {progress_text}</p>
-                                <p style="margin: 2px 0; color: #666; font-size: 0.85rem;">
-                                    <strong>Assigned:</strong> {assignment_date}
-                                </p>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(_PROJECT_CARD_TEMPLATE.format(
+                            group_color=group_color,
+                            group_name=display_group_name,
+                            truncated_group_name=truncated_tag_group_name,
+                            project_name=project_name,
+                            highlighted_name=highlighted_name,
+                            description=project["description"] or 'No description',
+                            mode=mode,
+                            progress_text=progress_text,
+                            assignment_date=assignment_date
+                        ), unsafe_allow_html=True)
                         
                         if st.button("Open Project", 
                                    key=f"select_project_{project['id']}", 
@@ -4060,6 +4073,7 @@ def display_project_dashboard(user_id: int, role: str) -> Optional[int]:
                                    help=f"Open '{project_name}' from {display_group_name} group"):
                             selected_project_id = project["id"]
                             st.session_state.selected_project_id = project["id"]
+                            st.session_state.setdefault("project_has_full_gt", {})[project["id"]] = has_full_gt
                             st.session_state.current_view = "project"
                             st.rerun()
         else:
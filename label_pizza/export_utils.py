@@ -176,12 +176,16 @@ def export_projects(output_path: str = None):
             )
             video_results = session.execute(videos_stmt).all()
             
-            # Check if this project has any custom question displays
-            custom_display_stmt = (
-                select(ProjectVideoQuestionDisplay)
+            # Load all custom question displays of this project in one query
+            custom_displays_stmt = (
+                select(ProjectVideoQuestionDisplay, Question.text, Question.type, Question.options, Question.display_values)
+                .join(Question, ProjectVideoQuestionDisplay.question_id == Question.id)
                 .where(ProjectVideoQuestionDisplay.project_id == project.id)
             )
-            has_custom_displays = session.execute(custom_display_stmt).first() is not None
+            custom_displays_by_video = {}
+            for row in session.execute(custom_displays_stmt):
+                custom_displays_by_video.setdefault(row[0].video_id, []).append(row)
+            has_custom_displays = bool(custom_displays_by_video)
             
             if has_custom_displays:
                 # Build detailed structure with custom questions
@@ -189,13 +193,7 @@ def export_projects(output_path: str = None):
                 
                 for video_uid, video_id in video_results:
                     # Get custom displays for this video in this project
-                    custom_displays_stmt = (
-                        select(ProjectVideoQuestionDisplay, Question.text, Question.type, Question.options, Question.display_values)
-                        .join(Question, ProjectVideoQuestionDisplay.question_id == Question.id)
-                        .where(ProjectVideoQuestionDisplay.project_id == project.id)
-                        .where(ProjectVideoQuestionDisplay.video_id == video_id)
-                    )
-                    custom_displays = session.execute(custom_displays_stmt).all()
+                    custom_displays = custom_displays_by_video.get(video_id, [])
                     
                     if custom_displays:
                         questions_data = []
@@ -388,7 +386,8 @@ def export_annotations(output_folder: str = None):
                 .where(AnnotatorAnswer.question_id.in_(question_ids))
                 .order_by(Project.name, User.user_id_str, Video.video_uid)
             )
-            annotator_results = session.execute(stmt_annotations).all()
+            # Stream rows in batches instead of materializing every answer at once
+            annotator_results = session.execute(stmt_annotations.execution_options(yield_per=1000))
             
             # Group answers by (project, user, video)
             grouped_answers = {}
@@ -483,7 +482,8 @@ def export_ground_truths(output_folder: str = None):
                 .where(ReviewerGroundTruth.question_id.in_(question_ids))
                 .order_by(Project.name, User.user_id_str, Video.video_uid)
             )
-            gt_results = session.execute(stmt_gt).all()
+            # Stream rows in batches instead of materializing every ground truth at once
+            gt_results = session.execute(stmt_gt.execution_options(yield_per=1000))
             
             # Group ground truth answers by (project, user, video)
             grouped_gts = {}
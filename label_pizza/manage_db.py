@@ -26,7 +26,8 @@ Usage:
 import argparse
 import os
 import sys
-import datetime
+import time
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from dotenv import load_dotenv
@@ -470,11 +471,11 @@ class NuclearDatabaseManager:
             
             with self.engine.connect() as conn:
                 # Check that admin user exists
-                admin_count = conn.execute(
-                    text("SELECT COUNT(*) FROM users WHERE user_type = 'admin'")
+                admin_exists = conn.execute(
+                    text("SELECT EXISTS (SELECT 1 FROM users WHERE user_type = 'admin')")
                 ).scalar()
                 
-                if admin_count > 0:
+                if admin_exists:
                     print("   ✅ Admin user verified")
                 else:
                     print("   ❌ Admin user not found")
@@ -515,6 +516,30 @@ class NuclearDatabaseManager:
             print(f"   ❌ Verification failed: {e}")
             return False
             
+@lru_cache(maxsize=8)
+def _get_backup_handler(db_url: str) -> "DatabaseBackupRestore":
+    """Reuse one backup handler per database URL"""
+    return DatabaseBackupRestore(db_url)
+
+def resolve_backup_path(backup_dir: str = "./backups", backup_file: Optional[str] = None,
+                        compress: bool = True) -> str:
+    """Resolve where a backup will be written, creating backup_dir if needed"""
+    # Create backup directory if it doesn't exist
+    backup_path = Path(backup_dir)
+    backup_path.mkdir(exist_ok=True)
+    
+    # Handle output filename
+    if backup_file is None:
+        # Auto-generate timestamped filename
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        extension = ".sql.gz" if compress else ".sql"
+        backup_file = f"backup_before_nuclear_{timestamp}{extension}"
+    
+    # If backup_file is just a filename (no path separator), combine with backup_dir
+    if backup_file == os.path.basename(backup_file):
+        return str(backup_path / backup_file)
+    return backup_file
+
 def create_backup_if_requested(db_url: str, backup_dir: str = "./backups", 
                              backup_file: Optional[str] = None, compress: bool = True) -> Optional[str]:
     """Create a backup before reset if requested"""
@@ -523,31 +548,18 @@ def create_backup_if_requested(db_url: str, backup_dir: str = "./backups",
         return None
         
     try:
-        handler = DatabaseBackupRestore(db_url)
-        
-        # Create backup directory if it doesn't exist
-        backup_path = Path(backup_dir)
-        backup_path.mkdir(exist_ok=True)
-        
-        # Handle output filename
-        if backup_file is None:
-            # Auto-generate timestamped filename
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            extension = ".sql.gz" if compress else ".sql"
-            backup_file = f"backup_before_nuclear_{timestamp}{extension}"
-        
-        # If backup_file is just a filename (no path separator), combine with backup_dir
-        if not os.path.sep in backup_file and not os.path.isabs(backup_file):
-            output_file = str(backup_path / backup_file)
-        else:
-            output_file = backup_file
+        handler = _get_backup_handler(db_url)
+        output_file = resolve_backup_path(backup_dir, backup_file, compress)
         
         print(f"💾 Creating backup before nuclear reset: {output_file}")
         
+        # Safety backups sit on the critical path of a destructive operation,
+        # so favour compression speed over size
         success = handler.create_backup(
             output_file=output_file,
             compress=compress,
-            schema_only=False
+            schema_only=False,
+            compresslevel=1
         )
         
         if success:
@@ -569,7 +581,7 @@ def restore_from_backup(db_url: str, backup_dir: str, backup_file: str, force: b
         
     try:
         # Handle input file path
-        if not os.path.sep in backup_file and not os.path.isabs(backup_file):
+        if backup_file == os.path.basename(backup_file):
             input_file = os.path.join(backup_dir, backup_file)
         else:
             input_file = backup_file
@@ -781,6 +793,11 @@ def nuclear_reset_database(email: str, password: str, user_id: str, force: bool
         print("❌ DBURL environment variable not found")
         return False
     
+    # Confirm nuclear reset first so a cancelled reset never pays for a backup
+    if not force and not confirm_nuclear_reset():
+        print("❌ Nuclear reset cancelled")
+        return False
+    
     # Create backup if requested
     backup_created = None
     if auto_backup:
@@ -791,11 +808,6 @@ def nuclear_reset_database(email: str, password: str, user_id: str, force: bool
                 print("❌ Nuclear reset cancelled due to backup failure")
                 return False
     
-    # Confirm nuclear reset
-    if not force and not confirm_nuclear_reset():
-        print("❌ Nuclear reset cancelled")
-        return False
-    
     try:
         print("\n☢️  INITIATING NUCLEAR DATABASE DESTRUCTION...")
         
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Migration script to add reverse-lookup indexes on association and override tables.
+This script:
+1. Creates the indexes declared in models.py that existing databases lack
+2. Builds them CONCURRENTLY so writers are not blocked while they build
+"""
+
+import os
+import sys
+import argparse
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+INDEXES = [
+    ("ix_qgq_question", "question_group_questions", "question_id"),
+    ("ix_sqg_question_group", "schema_question_groups", "question_group_id"),
+    ("ix_projects_schema", "projects", "schema_id"),
+    ("ix_project_videos_video", "project_videos", "video_id"),
+    ("ix_project_group_projects_project", "project_group_projects", "project_id"),
+    ("ix_display_question", "project_video_question_displays", "question_id, project_id"),
+    ("ix_annotator_vid_proj", "annotator_answers", "video_id, project_id"),
+    ("ix_gt_reviewer_proj", "reviewer_ground_truth", "reviewer_id, project_id"),
+]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url-name", default="DBURL")
+    args = parser.parse_args()
+    
+    load_dotenv()
+    db_url = os.environ.get(args.database_url_name)
+    if not db_url:
+        print(f"❌ Environment variable {args.database_url_name} not found")
+        sys.exit(1)
+    
+    print(f"✅ Using database URL from {args.database_url_name}")
+    print("🔧 Connecting to database...")
+    
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    engine = create_engine(db_url, isolation_level="AUTOCOMMIT")
+    
+    try:
+        with engine.connect() as conn:
+            for index_name, table_name, columns in INDEXES:
+                print(f"➕ {index_name} on {table_name}({columns})...")
+                conn.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"ON {table_name} ({columns})"
+                ))
+            print("🎉 Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"💥 Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    print("🍕 Lookup Index Migration")
+    print("=" * 25)
+    main()
@@ -94,6 +94,7 @@ class QuestionGroupQuestion(Base):
     display_order = Column(Integer, nullable=False)
     __table_args__ = (
         PrimaryKeyConstraint('question_group_id', 'question_id'),
+        Index("ix_qgq_question", "question_id"),  # Find groups containing a question
     )
 
 class Schema(Base):
@@ -116,6 +117,7 @@ class SchemaQuestionGroup(Base):
     display_order = Column(Integer, nullable=False)
     __table_args__ = (
         PrimaryKeyConstraint('schema_id', 'question_group_id'),
+        Index("ix_sqg_question_group", "question_group_id"),  # Find schemas using a question group
     )
 
 class Project(Base):
@@ -128,12 +130,18 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), default=now)
     updated_at = Column(DateTime(timezone=True), default=now, onupdate=now)
     is_archived = Column(Boolean, default=False)
+    __table_args__ = (
+        Index("ix_projects_schema", "schema_id"),  # Find projects using a schema
+    )
 
 class ProjectVideo(Base):
     __tablename__ = "project_videos"
     project_id = Column(Integer, primary_key=True)
     video_id = Column(Integer, primary_key=True)
     added_at = Column(DateTime(timezone=True), default=now)
+    __table_args__ = (
+        Index("ix_project_videos_video", "video_id"),  # Find projects containing a video
+    )
 
 class ProjectUserRole(Base):
     __tablename__ = "project_user_roles"
@@ -162,6 +170,9 @@ class ProjectGroupProject(Base):
     __tablename__ = "project_group_projects"
     project_group_id = Column(Integer, primary_key=True)
     project_id = Column(Integer, primary_key=True)
+    __table_args__ = (
+        Index("ix_project_group_projects_project", "project_id"),  # Find groups containing a project
+    )
 
 class ProjectVideoQuestionDisplay(Base):
     """Custom display overrides for specific project-video-question combinations"""
@@ -182,6 +193,7 @@ class ProjectVideoQuestionDisplay(Base):
         # Primary key is the composite key above
         Index("ix_project_display_lookup", "project_id"),  # Fast project lookups
         Index("ix_video_display_lookup", "project_id", "video_id"),  # Fast video lookups
+        Index("ix_display_question", "question_id", "project_id"),  # Find overrides of a question (cascade deletes)
     )
 
 class AnnotatorAnswer(Base):
@@ -209,6 +221,7 @@ class AnnotatorAnswer(Base):
         Index("ix_proj_q_val_single", "project_id", "question_id", "answer_value", 
               postgresql_where=(answer_type == "single")),  # Fast lookups for single-choice answers
         Index("ix_annotator_vid_q", "video_id", "question_id"),  # Query answers for specific video+question
+        Index("ix_annotator_vid_proj", "video_id", "project_id"),  # Count answers for a video within a project
         Index("ix_annotator_user_proj", "user_id", "project_id"),  # Query annotator's answers for a project
         Index("ix_annotator_user_proj_q", "user_id", "project_id", "question_id"),  # Query annotator's answers for a project+question
     )
@@ -250,6 +263,7 @@ class ReviewerGroundTruth(Base):
         
         # Additional indexes specific to ground truth operations
         Index("ix_gt_reviewer", "project_id", "reviewer_id"),  # Calculate reviewer accuracy
+        Index("ix_gt_reviewer_proj", "reviewer_id", "project_id"),  # Reviewer's GT across projects
         Index("ix_gt_admin_modified", "project_id", "modified_by_admin_id"),  # Find admin-modified GTs
     )
 
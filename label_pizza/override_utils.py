@@ -19,22 +19,34 @@ All delete functions support backup parameters:
 """
 
 from typing import List, Tuple, Dict, Any, Optional, NamedTuple
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from concurrent.futures import Future, ThreadPoolExecutor
 import label_pizza.db
 from sqlalchemy.orm import Session
-from sqlalchemy import text, and_
-from label_pizza.manage_db import create_backup_if_requested
+from sqlalchemy import text, and_, bindparam
+from sqlalchemy.exc import IntegrityError
+from label_pizza.manage_db import create_backup_if_requested, resolve_backup_path
 import os
+import threading
 
 
 def get_db_url_for_backup():
     """Get database URL using the same environment variable used in init_database"""
     import label_pizza.db
-    from dotenv import load_dotenv
     
     # Get the environment variable name that was used during init_database
     env_var_name = getattr(label_pizza.db, 'current_database_url_name', 'DBURL')
+    return _load_db_url(env_var_name)
+
+
+@lru_cache(maxsize=None)
+def _load_db_url(env_var_name: str) -> str:
+    """Read the database URL once per environment variable name"""
+    from dotenv import load_dotenv
     
     load_dotenv()
     db_url = os.getenv(env_var_name)
@@ -100,32 +112,99 @@ def _confirm_cascade_deletion(operations: List[DeleteOperation]) -> bool:
         print("No operations to perform.")
         return True
     
-    print("🚨 CASCADE DELETE OPERATIONS")
-    print("=" * 50)
-    print("The following delete operations will be executed in sequence:")
-    print()
-    
-    for i, op in enumerate(operations, 1):
-        table = op.table
-        readable_name = _get_readable_operation_name(op)
-        print(f"{i:2d}. {readable_name}")
-    
-    print()
-    print(f"Total operations: {len(operations)}")
-    print("⚠️  This will permanently delete data from the database!")
-    print()
+    _readable_name_cache.clear()
+    _prefetched_names.clear()
+    
+    # Build the whole report first and write it once
+    lines = [
+        "🚨 CASCADE DELETE OPERATIONS",
+        "=" * 50,
+        "The following delete operations will be executed in sequence:",
+        "",
+    ]
+    # One session for every name lookup instead of a pool checkout per operation.
+    # Lookups are best effort, so without a usable database each falls back to ids.
+    try:
+        lookup_session = label_pizza.db.SessionLocal()
+    except Exception:
+        lookup_session = nullcontext(None)
+    with lookup_session as session:
+        _prefetch_operation_names(session, operations)
+        for i, op in enumerate(operations, 1):
+            lines.append(f"{i:2d}. {_get_readable_operation_name(op, session)}")
+    lines += [
+        "",
+        f"Total operations: {len(operations)}",
+        "⚠️  This will permanently delete data from the database!",
+        "",
+    ]
+    print("\n".join(lines))
     
     response = input("Confirm cascade deletion? Type 'DELETE' to proceed: ")
     return response.strip() == 'DELETE'
 
 
-def _get_readable_operation_name(op: DeleteOperation) -> str:
-    """Convert delete operation to human-readable name"""
+# Readable names resolved while confirming a deletion, reused for the progress
+# lines printed while executing it. Cleared once the deletion finishes.
+_readable_name_cache: Dict[Tuple[str, Tuple], str] = {}
+
+# Names prefetched for a whole confirmation report, keyed by (table, id)
+_prefetched_names: Dict[Tuple[str, int], str] = {}
+
+# Which identifier positions of each operation refer to a named row
+_OPERATION_NAME_REFERENCES: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    'User': (('users', 0),),
+    'Video': (('videos', 0),),
+    'QuestionGroup': (('question_groups', 0),),
+    'Question': (('questions', 0),),
+    'Schema': (('schemas', 0),),
+    'Project': (('projects', 0),),
+    'ProjectGroup': (('project_groups', 0),),
+    'ProjectVideo': (('projects', 0), ('videos', 1)),
+    'ProjectUserRole': (('projects', 0), ('users', 1)),
+    'ProjectGroupProject': (('project_groups', 0), ('projects', 1)),
+    'QuestionGroupQuestion': (('question_groups', 0), ('questions', 1)),
+    'SchemaQuestionGroup': (('schemas', 0), ('question_groups', 1)),
+    'ProjectVideoQuestionDisplay': (('projects', 0), ('videos', 1), ('questions', 2)),
+    'ReviewerGroundTruth': (('videos', 0), ('questions', 1), ('projects', 2)),
+}
+
+
+def _prefetch_operation_names(session: Optional[Session], operations: List[DeleteOperation]) -> None:
+    """Load every name a confirmation report needs with one IN query per table
+    instead of one lookup per operation. Best effort: misses fall back to single lookups."""
+    if session is None:
+        return
+    ids_by_table: Dict[str, set] = {}
+    for op in operations:
+        for table, position in _OPERATION_NAME_REFERENCES.get(op.table, ()):
+            ids_by_table.setdefault(table, set()).add(op.identifier[position])
+    try:
+        for table, ids in ids_by_table.items():
+            statement = text(f"SELECT id, {_NAME_COLUMNS[table]} FROM {table} WHERE id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
+            )
+            for row_id, name in session.execute(statement, {"ids": list(ids)}):
+                _prefetched_names[(table, row_id)] = name
+    except Exception:
+        session.rollback()
+
+
+def _get_readable_operation_name(op: DeleteOperation, session: Optional[Session] = None) -> str:
+    """Convert delete operation to human-readable name, reusing names already looked up"""
+    key = (op.table, op.identifier)
+    if key not in _readable_name_cache:
+        _readable_name_cache[key] = _lookup_readable_operation_name(op, session)
+    return _readable_name_cache[key]
+
+
+def _lookup_readable_operation_name(op: DeleteOperation, session: Optional[Session] = None) -> str:
+    """Convert delete operation to human-readable name, using session if given or a fresh one otherwise"""
     table = op.table
     identifier = op.identifier
     
     try:
-        with label_pizza.db.SessionLocal() as session:
+        with nullcontext(session) if session is not None else label_pizza.db.SessionLocal() as session:
             if table == 'User':
                 user_name = _get_name_from_id(session, 'users', 'user_id_str', identifier[0])
                 return f"Delete user '{user_name}'"
@@ -231,37 +310,164 @@ def _get_readable_operation_name(op: DeleteOperation) -> str:
                 return f"Delete {table.lower()} (ID: {identifier[0]})"
                 
     except Exception as e:
-        # Fallback if name lookup fails
+        # Fallback if name lookup fails; reset a shared session so later lookups still work
+        if session is not None:
+            session.rollback()
         return f"Delete {table.lower()} (ID: {identifier[0]})"
 
 
 def _get_name_from_id(session: Session, table: str, name_column: str, id_value: int) -> str:
     """Helper function to get name from ID for any table"""
+    if _NAME_COLUMNS.get(table) == name_column and (table, id_value) in _prefetched_names:
+        return _prefetched_names[(table, id_value)]
     try:
-        result = session.execute(text(f"SELECT {name_column} FROM {table} WHERE id = :id"), {"id": id_value})
+        statement = _NAME_BY_ID_STATEMENTS.get(table) if _NAME_COLUMNS.get(table) == name_column else None
+        if statement is None:
+            statement = text(f"SELECT {name_column} FROM {table} WHERE id = :id")
+        result = session.execute(statement, {"id": id_value})
         row = result.fetchone()
         return row[0] if row else f"ID_{id_value}"
     except:
         return f"ID_{id_value}"
 
 
-def _execute_delete_operations(operations: List[DeleteOperation]) -> bool:
+_backup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="override-backup")
+
+
+# Inside backup_batch() only the first requested backup is taken; later
+# operations in the batch reuse its file
+_backup_batch_lock = threading.Lock()
+_backup_batch_depth = 0
+_backup_batch_file: Optional[str] = None
+
+
+@contextmanager
+def backup_batch():
+    """Take at most one backup for all override operations run inside the block"""
+    global _backup_batch_depth, _backup_batch_file
+    with _backup_batch_lock:
+        _backup_batch_depth += 1
+    try:
+        yield
+    finally:
+        with _backup_batch_lock:
+            _backup_batch_depth -= 1
+            if _backup_batch_depth == 0:
+                _backup_batch_file = None
+
+
+def _create_backup_for_operations(backup_params: Dict[str, Any]) -> Optional[str]:
+    """Create the backup requested by an operation's backup_params"""
+    global _backup_batch_file
+    with _backup_batch_lock:
+        if _backup_batch_depth and _backup_batch_file is not None:
+            return _backup_batch_file
+        db_url = get_db_url_for_backup()
+        backup_file = create_backup_if_requested(
+            str(db_url),
+            backup_params.get('backup_dir', './backups'),
+            backup_params.get('backup_file', None),
+            backup_params.get('compress', True)
+        )
+        if _backup_batch_depth:
+            _backup_batch_file = backup_file
+        return backup_file
+
+
+class _BackgroundBackup(NamedTuple):
+    """A backup dumped to temp_file while the user reviews the deletion"""
+    future: Future
+    temp_file: str
+    backup_file: str
+
+
+def _dump_backup_to(backup_params: Dict[str, Any], output_file: str) -> Optional[str]:
+    """Dump the database to output_file"""
+    db_url = get_db_url_for_backup()
+    return create_backup_if_requested(
+        str(db_url),
+        backup_params.get('backup_dir', './backups'),
+        output_file,
+        backup_params.get('compress', True)
+    )
+
+
+def _remove_file_if_present(path: str) -> None:
+    """Delete a leftover file, ignoring one that was never written"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _start_backup_in_background(operations: List[DeleteOperation]) -> Optional[_BackgroundBackup]:
+    """Start the requested backup so it overlaps with the confirmation prompt.
+    
+    The dump goes to a hidden temp file beside the target and is only moved
+    onto backup_file once the deletion is confirmed, so a cancelled deletion
+    never touches an existing backup.
+    """
+    with _backup_batch_lock:
+        if _backup_batch_depth and _backup_batch_file is not None:
+            return None  # The batch backup already exists; nothing to overlap
+    for op in operations:
+        if op.backup_params.get('backup_first', False):
+            compress = op.backup_params.get('compress', True)
+            backup_file = resolve_backup_path(
+                op.backup_params.get('backup_dir', './backups'),
+                op.backup_params.get('backup_file', None),
+                compress
+            )
+            # create_backup appends .gz to compressed output; name both files the way they land on disk
+            if compress and not backup_file.endswith('.gz'):
+                backup_file += '.gz'
+            temp_file = os.path.join(os.path.dirname(backup_file), f".partial_{os.path.basename(backup_file)}")
+            future = _backup_executor.submit(_dump_backup_to, op.backup_params, temp_file)
+            return _BackgroundBackup(future, temp_file, backup_file)
+    return None
+
+
+def _finish_background_backup(pending_backup: _BackgroundBackup) -> Optional[str]:
+    """Wait for a confirmed background backup and move it onto its real name"""
+    global _backup_batch_file
+    try:
+        dumped_file = pending_backup.future.result()
+    except Exception:
+        _remove_file_if_present(pending_backup.temp_file)
+        raise
+    if dumped_file is None:
+        _remove_file_if_present(pending_backup.temp_file)
+        return None
+    os.replace(pending_backup.temp_file, pending_backup.backup_file)
+    with _backup_batch_lock:
+        if _backup_batch_depth:
+            _backup_batch_file = pending_backup.backup_file
+    return pending_backup.backup_file
+
+
+def _discard_background_backup(pending_backup: Optional[_BackgroundBackup]) -> None:
+    """Drop a background backup after the user declines the deletion, without waiting for it"""
+    if pending_backup is None or pending_backup.future.cancel():
+        return
+    # Already dumping: remove the temp file once the worker finishes
+    pending_backup.future.add_done_callback(lambda _: _remove_file_if_present(pending_backup.temp_file))
+
+
+def _execute_delete_operations(operations: List[DeleteOperation],
+                               pending_backup: Optional[_BackgroundBackup] = None) -> bool:
     """Execute the delete operations in order"""
     if not operations:
         return True
     
-    # Create backup if any operation requests it
+    # Create backup if any operation requests it (or wait for the one already started)
     backup_created = None
     for op in operations:
         if op.backup_params.get('backup_first', False):
             try:
-                db_url = get_db_url_for_backup()
-                backup_created = create_backup_if_requested(
-                    str(db_url),
-                    op.backup_params.get('backup_dir', './backups'),
-                    op.backup_params.get('backup_file', None),
-                    op.backup_params.get('compress', True)
-                )
+                if pending_backup is not None:
+                    backup_created = _finish_background_backup(pending_backup)
+                else:
+                    backup_created = _create_backup_for_operations(op.backup_params)
                 print(f"💾 Backup created successfully: {backup_created}")
                 break  # Only need one backup
             except Exception as e:
@@ -278,46 +484,61 @@ def _execute_delete_operations(operations: List[DeleteOperation]) -> bool:
     try:
         with label_pizza.db.SessionLocal() as session:
             # Handle admin reversion operations first
-            for op in operations:
-                if op.table == 'ProjectUserRole' and len(op.identifier) == 3 and op.identifier[2] == 'admin':
-                    # This is an admin role deletion, need to revert ground truths first
-                    # This logic reverts any ground truth modifications made by this admin
-                    project_id, user_id, role = op.identifier
-                    try:
-                        result = session.execute(text("""
-                            UPDATE reviewer_ground_truth 
-                            SET answer_value = original_answer_value, 
-                                modified_at = NULL, 
-                                modified_by_admin_id = NULL, 
-                                modified_by_admin_at = NULL 
-                            WHERE project_id = :p_id AND modified_by_admin_id = :u_id
-                        """), {"p_id": project_id, "u_id": user_id})
-                        rows_affected = result.rowcount
-                        if rows_affected > 0:
-                            print(f"✅ Reverted {rows_affected} admin modifications for user {user_id} in project {project_id}")
-                    except Exception as e:
-                        print(f"❌ Failed to revert admin modifications: {e}")
-                        session.rollback()
-                        return False
+            # This reverts any ground truth modifications made by the admins being
+            # removed, for all (project, admin) pairs in one UPDATE statement
+            admin_pairs = [
+                (op.identifier[0], op.identifier[1]) for op in operations
+                if op.table == 'ProjectUserRole' and len(op.identifier) == 3 and op.identifier[2] == 'admin'
+            ]
+            if admin_pairs:
+                try:
+                    result = session.execute(text("""
+                        UPDATE reviewer_ground_truth 
+                        SET answer_value = original_answer_value, 
+                            modified_at = NULL, 
+                            modified_by_admin_id = NULL, 
+                            modified_by_admin_at = NULL 
+                        WHERE (project_id, modified_by_admin_id) IN :pairs
+                    """).bindparams(bindparam("pairs", expanding=True)), {"pairs": admin_pairs})
+                    rows_affected = result.rowcount
+                    if rows_affected > 0:
+                        pairs_desc = ", ".join(f"user {u_id} in project {p_id}" for p_id, u_id in admin_pairs)
+                        print(f"✅ Reverted {rows_affected} admin modifications ({pairs_desc})")
+                except Exception as e:
+                    print(f"❌ Failed to revert admin modifications: {e}")
+                    session.rollback()
+                    return False
             
             # Now execute the actual delete operations
-            for op in operations:
+            # Operations are sorted by DELETION_ORDER, so rows of the same table
+            # are adjacent and each table goes to the database in one batch
+            for _, group in groupby(operations, key=lambda op: (op.table, op.operation_type)):
+                table_ops = list(group)
                 try:
-                    _execute_single_delete_operation(session, op)
-                    success_count += 1
-                    readable_name = _get_readable_operation_name(op)
-                    print(f"✅ {readable_name}")
+                    _execute_delete_batch(session, table_ops)
                 except Exception as e:
-                    readable_name = _get_readable_operation_name(op)
+                    readable_name = _get_readable_operation_name(table_ops[0])
+                    if len(table_ops) > 1:
+                        readable_name += f" (and {len(table_ops) - 1} more {table_ops[0].table} rows)"
                     print(f"❌ Failed: {readable_name} - {e}")
                     session.rollback()
                     return False
+                success_count += len(table_ops)
+                # One write per batch rather than one per deleted row. Names come from
+                # the confirmation report; without one, summarize instead of looking them up
+                if all((op.table, op.identifier) in _readable_name_cache for op in table_ops):
+                    print("\n".join(f"✅ {_get_readable_operation_name(op)}" for op in table_ops))
+                else:
+                    print(f"✅ Deleted {len(table_ops)} {table_ops[0].table} rows")
             
             session.commit()
             
     except Exception as e:
         print(f"❌ Transaction failed: {e}")
         return False
+    finally:
+        _readable_name_cache.clear()
+        _prefetched_names.clear()
     
     print(f"\n🎉 Successfully completed {success_count} delete operations")
     if backup_created:
@@ -326,122 +547,167 @@ def _execute_delete_operations(operations: List[DeleteOperation]) -> bool:
     return True
 
 
+# Maximum number of rows removed by one set-based DELETE statement
+DELETE_BATCH_SIZE = 5000
+
+# Table name and (key column, bind-parameter name) pairs per table, keyed by
+# lowercased DeleteOperation.table. Key columns line up with DeleteOperation.identifier.
+_DELETE_USING_ID_KEYS: Dict[str, Tuple[str, Tuple[Tuple[str, str], ...]]] = {
+    'user': ("users", (("id", "id"),)),
+    'video': ("videos", (("id", "id"),)),
+    'videotag': ("video_tags", (("video_id", "video_id"), ("tag", "tag"))),
+    'questiongroup': ("question_groups", (("id", "id"),)),
+    'question': ("questions", (("id", "id"),)),
+    'questiongroupquestion': ("question_group_questions", (("question_group_id", "qg_id"), ("question_id", "q_id"))),
+    'schema': ("schemas", (("id", "id"),)),
+    'schemaquestiongroup': ("schema_question_groups", (("schema_id", "s_id"), ("question_group_id", "qg_id"))),
+    'project': ("projects", (("id", "id"),)),
+    'projectvideo': ("project_videos", (("project_id", "p_id"), ("video_id", "v_id"))),
+    'projectuserrole': ("project_user_roles", (("project_id", "p_id"), ("user_id", "u_id"), ("role", "role"))),
+    'projectgroup': ("project_groups", (("id", "id"),)),
+    'projectgroupproject': ("project_group_projects", (("project_group_id", "pg_id"), ("project_id", "p_id"))),
+    'projectvideoquestiondisplay': ("project_video_question_displays",
+                                    (("project_id", "p_id"), ("video_id", "v_id"), ("question_id", "q_id"))),
+    'annotatoranswer': ("annotator_answers", (("id", "id"),)),
+    'reviewergroundtruth': ("reviewer_ground_truth", (("video_id", "v_id"), ("question_id", "q_id"), ("project_id", "p_id"))),
+    'answerreview': ("answer_reviews", (("id", "id"),)),
+}
+
+
+def _build_delete_statements(table_name: str, keys: Tuple[Tuple[str, str], ...]) -> Tuple[Any, Any]:
+    """Build the single-row and set-based DELETE statements for a table"""
+    where = " AND ".join(f"{column} = :{param}" for column, param in keys)
+    if len(keys) == 1:
+        target = keys[0][0]
+    else:
+        target = "(" + ", ".join(column for column, _ in keys) + ")"
+    single = text(f"DELETE FROM {table_name} WHERE {where}")
+    batch = text(f"DELETE FROM {table_name} WHERE {target} IN :keys").bindparams(bindparam("keys", expanding=True))
+    return single, batch
+
+
+# Built once at import so hot delete loops reuse the same text() constructs
+_DELETE_USING_ID_STATEMENTS: Dict[str, Tuple[Any, Any]] = {
+    table: _build_delete_statements(table_name, keys)
+    for table, (table_name, keys) in _DELETE_USING_ID_KEYS.items()
+}
+
+
+def _get_delete_using_id_keys(table: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Look up the table name and key columns for a DeleteOperation table"""
+    try:
+        return _DELETE_USING_ID_KEYS[table]
+    except KeyError:
+        raise ValueError(f"Unknown table for using_id deletion: {table}")
+
+
 def _execute_single_delete_operation(session: Session, op: DeleteOperation):
     """Execute a single delete operation"""
     table = op.table.lower()
     
     if op.operation_type == 'using_id':
-        if table == 'user':
-            session.execute(text("DELETE FROM users WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'video':
-            session.execute(text("DELETE FROM videos WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'videotag':
-            session.execute(text("DELETE FROM video_tags WHERE video_id = :video_id AND tag = :tag"), 
-                          {"video_id": op.identifier[0], "tag": op.identifier[1]})
-        elif table == 'questiongroup':
-            session.execute(text("DELETE FROM question_groups WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'question':
-            session.execute(text("DELETE FROM questions WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'questiongroupquestion':
-            session.execute(text("DELETE FROM question_group_questions WHERE question_group_id = :qg_id AND question_id = :q_id"),
-                          {"qg_id": op.identifier[0], "q_id": op.identifier[1]})
-        elif table == 'schema':
-            session.execute(text("DELETE FROM schemas WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'schemaquestiongroup':
-            session.execute(text("DELETE FROM schema_question_groups WHERE schema_id = :s_id AND question_group_id = :qg_id"),
-                          {"s_id": op.identifier[0], "qg_id": op.identifier[1]})
-        elif table == 'project':
-            session.execute(text("DELETE FROM projects WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'projectvideo':
-            session.execute(text("DELETE FROM project_videos WHERE project_id = :p_id AND video_id = :v_id"),
-                          {"p_id": op.identifier[0], "v_id": op.identifier[1]})
-        elif table == 'projectuserrole':
-            session.execute(text("DELETE FROM project_user_roles WHERE project_id = :p_id AND user_id = :u_id AND role = :role"),
-                          {"p_id": op.identifier[0], "u_id": op.identifier[1], "role": op.identifier[2]})
-        elif table == 'projectgroup':
-            session.execute(text("DELETE FROM project_groups WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'projectgroupproject':
-            session.execute(text("DELETE FROM project_group_projects WHERE project_group_id = :pg_id AND project_id = :p_id"),
-                          {"pg_id": op.identifier[0], "p_id": op.identifier[1]})
-        elif table == 'projectvideoquestiondisplay':
-            session.execute(text("DELETE FROM project_video_question_displays WHERE project_id = :p_id AND video_id = :v_id AND question_id = :q_id"),
-                          {"p_id": op.identifier[0], "v_id": op.identifier[1], "q_id": op.identifier[2]})
-        elif table == 'annotatoranswer':
-            session.execute(text("DELETE FROM annotator_answers WHERE id = :id"), {"id": op.identifier[0]})
-        elif table == 'reviewergroundtruth':
-            session.execute(text("DELETE FROM reviewer_ground_truth WHERE video_id = :v_id AND question_id = :q_id AND project_id = :p_id"),
-                          {"v_id": op.identifier[0], "q_id": op.identifier[1], "p_id": op.identifier[2]})
-        elif table == 'answerreview':
-            session.execute(text("DELETE FROM answer_reviews WHERE id = :id"), {"id": op.identifier[0]})
-        else:
-            raise ValueError(f"Unknown table for using_id deletion: {table}")
+        _, keys = _get_delete_using_id_keys(table)
+        single_statement, _ = _DELETE_USING_ID_STATEMENTS[table]
+        session.execute(single_statement, {param: value for (_, param), value in zip(keys, op.identifier)})
+
+
+def _execute_delete_batch(session: Session, ops: List[DeleteOperation], batch_size: int = DELETE_BATCH_SIZE):
+    """Execute same-table delete operations as set-based DELETEs of up to batch_size rows"""
+    if len(ops) == 1 or ops[0].operation_type != 'using_id':
+        for op in ops:
+            _execute_single_delete_operation(session, op)
+        return
+    
+    table = ops[0].table.lower()
+    _, keys = _get_delete_using_id_keys(table)
+    _, statement = _DELETE_USING_ID_STATEMENTS[table]
+    if len(keys) == 1:
+        values = [op.identifier[0] for op in ops]
+    else:
+        values = [tuple(op.identifier[:len(keys)]) for op in ops]
+    # Chunk the key list so a huge cascade does not become one giant statement
+    for start in range(0, len(values), batch_size):
+        session.execute(statement, {"keys": values[start:start + batch_size]})
 
 
 # ============================================================================
 # HELPER FUNCTIONS FOR COLLECTING DEPENDENCIES
 # ============================================================================
 
-def _get_user_id_from_user_id_str(session: Session, user_id_str: str) -> int:
-    """Get user ID from user_id_str"""
-    result = session.execute(text("SELECT id FROM users WHERE user_id_str = :user_id_str"), {"user_id_str": user_id_str})
-    row = result.fetchone()
+# Name lookups run on every preview, rename and by-name call, so build them once
+_NAME_COLUMNS: Dict[str, str] = {
+    "users": "user_id_str",
+    "videos": "video_uid",
+    "question_groups": "title",
+    "questions": "text",
+    "schemas": "name",
+    "projects": "name",
+    "project_groups": "name",
+}
+
+_NAME_BY_ID_STATEMENTS: Dict[str, Any] = {
+    table: text(f"SELECT {column} FROM {table} WHERE id = :id") for table, column in _NAME_COLUMNS.items()
+}
+
+_ID_BY_NAME_STATEMENTS: Dict[str, Any] = {
+    table: text(f"SELECT id FROM {table} WHERE {column} = :value") for table, column in _NAME_COLUMNS.items()
+}
+
+
+def _get_id_by_name(session: Session, table: str, label: str, name: str) -> int:
+    """Get a row's ID from its name column, raising ValueError if it does not exist"""
+    row = session.execute(_ID_BY_NAME_STATEMENTS[table], {"value": name}).fetchone()
     if not row:
-        raise ValueError(f"User not found: {user_id_str}")
+        raise ValueError(f"{label} not found: {name}")
     return row[0]
 
 
+def _get_ids_by_names(session: Session, lookups: List[Tuple[str, str, str]]) -> List[int]:
+    """Resolve several (table, label, name) lookups in one round-trip, raising
+    ValueError for the first one that does not exist"""
+    columns = ", ".join(
+        f"(SELECT id FROM {table} WHERE {_NAME_COLUMNS[table]} = :v{i})" for i, (table, _, _) in enumerate(lookups)
+    )
+    row = session.execute(text(f"SELECT {columns}"), {f"v{i}": name for i, (_, _, name) in enumerate(lookups)}).fetchone()
+    for (_, label, name), row_id in zip(lookups, row):
+        if row_id is None:
+            raise ValueError(f"{label} not found: {name}")
+    return list(row)
+
+
+def _get_user_id_from_user_id_str(session: Session, user_id_str: str) -> int:
+    """Get user ID from user_id_str"""
+    return _get_id_by_name(session, "users", "User", user_id_str)
+
+
 def _get_video_id_from_video_uid(session: Session, video_uid: str) -> int:
     """Get video ID from video_uid"""
-    result = session.execute(text("SELECT id FROM videos WHERE video_uid = :video_uid"), {"video_uid": video_uid})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Video not found: {video_uid}")
-    return row[0]
+    return _get_id_by_name(session, "videos", "Video", video_uid)
 
 
 def _get_question_group_id_from_title(session: Session, title: str) -> int:
     """Get question group ID from title"""
-    result = session.execute(text("SELECT id FROM question_groups WHERE title = :title"), {"title": title})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Question group not found: {title}")
-    return row[0]
+    return _get_id_by_name(session, "question_groups", "Question group", title)
 
 
 def _get_question_id_from_text(session: Session, text_param: str) -> int:
     """Get question ID from text"""
-    result = session.execute(text("SELECT id FROM questions WHERE text = :text"), {"text": text_param})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Question not found: {text_param}")
-    return row[0]
+    return _get_id_by_name(session, "questions", "Question", text_param)
 
 
 def _get_schema_id_from_name(session: Session, name: str) -> int:
     """Get schema ID from name"""
-    result = session.execute(text("SELECT id FROM schemas WHERE name = :name"), {"name": name})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Schema not found: {name}")
-    return row[0]
+    return _get_id_by_name(session, "schemas", "Schema", name)
 
 
 def _get_project_id_from_name(session: Session, name: str) -> int:
     """Get project ID from name"""
-    result = session.execute(text("SELECT id FROM projects WHERE name = :name"), {"name": name})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Project not found: {name}")
-    return row[0]
+    return _get_id_by_name(session, "projects", "Project", name)
 
 
 def _get_project_group_id_from_name(session: Session, name: str) -> int:
     """Get project group ID from name"""
-    result = session.execute(text("SELECT id FROM project_groups WHERE name = :name"), {"name": name})
-    row = result.fetchone()
-    if not row:
-        raise ValueError(f"Project group not found: {name}")
-    return row[0]
+    return _get_id_by_name(session, "project_groups", "Project group", name)
 
 
 def _collect_answer_review_dependencies(session: Session, answer_id: int, backup_params: Dict[str, Any]) -> List[DeleteOperation]:
@@ -472,24 +738,28 @@ def _collect_project_video_dependencies(session: Session, project_id: int, video
     """Collect dependencies for ProjectVideo deletion"""
     operations = []
     
-    # Find AnnotatorAnswers for this project+video
-    result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND video_id = :v_id"), 
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-        operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-    
-    # Find ReviewerGroundTruth for this project+video
-    result = session.execute(text("SELECT question_id FROM reviewer_ground_truth WHERE project_id = :p_id AND video_id = :v_id"),
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, row[0], project_id), backup_params))
-    
-    # Find ProjectVideoQuestionDisplays for this project+video
-    result = session.execute(text("SELECT question_id FROM project_video_question_displays WHERE project_id = :p_id AND video_id = :v_id"),
-                           {"p_id": project_id, "v_id": video_id})
-    for row in result.fetchall():
-        operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, row[0]), backup_params))
+    # Find AnnotatorAnswers, ReviewerGroundTruth and ProjectVideoQuestionDisplays
+    # for this project+video in a single round-trip
+    result = session.execute(text("""
+        SELECT 'AnnotatorAnswer' AS kind, aa.id AS ref_id, ar.id AS review_id FROM annotator_answers aa
+        LEFT JOIN answer_reviews ar ON ar.answer_id = aa.id
+        WHERE aa.project_id = :p_id AND aa.video_id = :v_id
+        UNION ALL
+        SELECT 'ReviewerGroundTruth', question_id, NULL FROM reviewer_ground_truth
+        WHERE project_id = :p_id AND video_id = :v_id
+        UNION ALL
+        SELECT 'ProjectVideoQuestionDisplay', question_id, NULL FROM project_video_question_displays
+        WHERE project_id = :p_id AND video_id = :v_id
+    """).execution_options(yield_per=1000), {"p_id": project_id, "v_id": video_id})
+    for kind, ref_id, review_id in result:
+        if kind == 'AnnotatorAnswer':
+            if review_id is not None:
+                operations.append(DeleteOperation('AnswerReview', 'using_id', (review_id,), backup_params))
+            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (ref_id,), backup_params))
+        elif kind == 'ReviewerGroundTruth':
+            operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, ref_id, project_id), backup_params))
+        else:
+            operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, ref_id), backup_params))
     
     return operations
 
@@ -542,11 +812,26 @@ def _collect_project_user_role_dependencies(session: Session, project_id: int, u
             operations.append(DeleteOperation('ProjectUserRole', 'using_id', (project_id, user_id, 'reviewer'), backup_params))
         
         # Delete annotator answers
-        result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND user_id = :u_id"),
-                               {"p_id": project_id, "u_id": user_id})
-        for row in result.fetchall():
-            operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
+        operations.extend(_collect_answers_with_reviews(session, "project_id = :p_id AND user_id = :u_id",
+                                                        {"p_id": project_id, "u_id": user_id}, backup_params))
+    
+    return operations
+
+
+def _collect_answers_with_reviews(session: Session, where_clause: str, params: Dict[str, Any], backup_params: Dict[str, Any]) -> List[DeleteOperation]:
+    """Collect AnnotatorAnswer deletions matching where_clause together with their AnswerReviews in one query"""
+    operations = []
+    
+    # Whole projects or users can own millions of answers; stream them in batches
+    result = session.execute(text(f"""
+        SELECT aa.id, ar.id FROM annotator_answers aa
+        LEFT JOIN answer_reviews ar ON ar.answer_id = aa.id
+        WHERE {where_clause}
+    """).execution_options(yield_per=1000), params)
+    for answer_id, review_id in result:
+        if review_id is not None:
+            operations.append(DeleteOperation('AnswerReview', 'using_id', (review_id,), backup_params))
+        operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (answer_id,), backup_params))
     
     return operations
 
@@ -560,37 +845,29 @@ def _collect_question_group_question_dependencies(session: Session, question_gro
     """Collect dependencies for QuestionGroupQuestion deletion"""
     operations = []
     
-    # Step 1: Get all schemas using this question group
-    schema_result = session.execute(text("SELECT schema_id FROM schema_question_groups WHERE question_group_id = :qg_id"), 
-                                  {"qg_id": question_group_id})
-    schema_ids = [row[0] for row in schema_result.fetchall()]
-    
-    # Step 2: Get all projects using those schemas
-    project_ids = []
-    for schema_id in schema_ids:
-        project_result = session.execute(text("SELECT id FROM projects WHERE schema_id = :s_id"), {"s_id": schema_id})
-        project_ids.extend([row[0] for row in project_result.fetchall()])
-    
-    # Step 3: Delete related answers and displays for each project
-    for project_id in project_ids:
-        # Delete AnnotatorAnswers
-        result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-            operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-        
-        # Delete ReviewerGroundTruth
-        result = session.execute(text("SELECT video_id FROM reviewer_ground_truth WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], question_id, project_id), backup_params))
-        
-        # Delete ProjectVideoQuestionDisplay
-        result = session.execute(text("SELECT video_id FROM project_video_question_displays WHERE project_id = :p_id AND question_id = :q_id"),
-                               {"p_id": project_id, "q_id": question_id})
-        for row in result.fetchall():
-            operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, row[0], question_id), backup_params))
+    # Projects whose schema uses this question group, resolved in the database
+    # so the schema and project ids never round-trip through Python
+    params = {"qg_id": question_group_id, "q_id": question_id}
+    scope = """
+        question_id = :q_id AND project_id IN (
+            SELECT p.id FROM projects p
+            JOIN schema_question_groups sqg ON sqg.schema_id = p.schema_id
+            WHERE sqg.question_group_id = :qg_id
+        )
+    """
+    
+    # Delete AnnotatorAnswers (and their reviews)
+    operations.extend(_collect_answers_with_reviews(session, scope, params, backup_params))
+    
+    # Delete ReviewerGroundTruth
+    result = session.execute(text(f"SELECT video_id, project_id FROM reviewer_ground_truth WHERE {scope}").execution_options(yield_per=1000), params)
+    for row in result:
+        operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], question_id, row[1]), backup_params))
+    
+    # Delete ProjectVideoQuestionDisplay
+    result = session.execute(text(f"SELECT project_id, video_id FROM project_video_question_displays WHERE {scope}").execution_options(yield_per=1000), params)
+    for row in result:
+        operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (row[0], row[1], question_id), backup_params))
     
     return operations
 
@@ -599,36 +876,26 @@ def _collect_schema_question_group_dependencies(session: Session, schema_id: int
     """Collect dependencies for SchemaQuestionGroup deletion"""
     operations = []
     
-    # Step 1: Get all projects using this schema
-    project_result = session.execute(text("SELECT id FROM projects WHERE schema_id = :s_id"), {"s_id": schema_id})
-    project_ids = [row[0] for row in project_result.fetchall()]
-    
-    # Step 2: Get all questions from this question group
-    question_result = session.execute(text("SELECT question_id FROM question_group_questions WHERE question_group_id = :qg_id"), 
-                                    {"qg_id": question_group_id})
-    question_ids = [row[0] for row in question_result.fetchall()]
-    
-    # Step 3: Delete related answers and displays for each project+question combination
-    for project_id in project_ids:
-        for question_id in question_ids:
-            # Delete AnnotatorAnswers
-            result = session.execute(text("SELECT id FROM annotator_answers WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.extend(_collect_annotator_answer_dependencies(session, row[0], backup_params))
-                operations.append(DeleteOperation('AnnotatorAnswer', 'using_id', (row[0],), backup_params))
-            
-            # Delete ReviewerGroundTruth
-            result = session.execute(text("SELECT video_id FROM reviewer_ground_truth WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], question_id, project_id), backup_params))
-            
-            # Delete ProjectVideoQuestionDisplay
-            result = session.execute(text("SELECT video_id FROM project_video_question_displays WHERE project_id = :p_id AND question_id = :q_id"),
-                                   {"p_id": project_id, "q_id": question_id})
-            for row in result.fetchall():
-                operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, row[0], question_id), backup_params))
+    # Match every project using this schema against every question in this
+    # question group on the server instead of looping project x question
+    params = {"s_id": schema_id, "qg_id": question_group_id}
+    scope = """
+        project_id IN (SELECT id FROM projects WHERE schema_id = :s_id)
+        AND question_id IN (SELECT question_id FROM question_group_questions WHERE question_group_id = :qg_id)
+    """
+    
+    # Delete AnnotatorAnswers (and their reviews)
+    operations.extend(_collect_answers_with_reviews(session, scope, params, backup_params))
+    
+    # Delete ReviewerGroundTruth
+    result = session.execute(text(f"SELECT video_id, question_id, project_id FROM reviewer_ground_truth WHERE {scope}").execution_options(yield_per=1000), params)
+    for row in result:
+        operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (row[0], row[1], row[2]), backup_params))
+    
+    # Delete ProjectVideoQuestionDisplay
+    result = session.execute(text(f"SELECT project_id, video_id, question_id FROM project_video_question_displays WHERE {scope}").execution_options(yield_per=1000), params)
+    for row in result:
+        operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (row[0], row[1], row[2]), backup_params))
     
     return operations
 
@@ -687,11 +954,27 @@ def _collect_project_dependencies(session: Session, project_id: int, backup_para
     """Collect dependencies for Project deletion"""
     operations = []
     
-    # Delete ProjectVideos (and their dependencies)
-    result = session.execute(text("SELECT video_id FROM project_videos WHERE project_id = :p_id"), {"p_id": project_id})
-    for row in result.fetchall():
-        operations.extend(_collect_project_video_dependencies(session, project_id, row[0], backup_params))
-        operations.append(DeleteOperation('ProjectVideo', 'using_id', (project_id, row[0]), backup_params))
+    # Delete ProjectVideos and everything recorded against them: answers (with
+    # their reviews) in one query and the remaining per-video rows in another,
+    # instead of one round-trip per video in the project
+    operations.extend(_collect_answers_with_reviews(session, "project_id = :p_id", {"p_id": project_id}, backup_params))
+    result = session.execute(text("""
+        SELECT 'ReviewerGroundTruth' AS kind, video_id, question_id FROM reviewer_ground_truth
+        WHERE project_id = :p_id
+        UNION ALL
+        SELECT 'ProjectVideoQuestionDisplay', video_id, question_id FROM project_video_question_displays
+        WHERE project_id = :p_id
+        UNION ALL
+        SELECT 'ProjectVideo', video_id, NULL FROM project_videos
+        WHERE project_id = :p_id
+    """).execution_options(yield_per=1000), {"p_id": project_id})
+    for kind, video_id, question_id in result:
+        if kind == 'ReviewerGroundTruth':
+            operations.append(DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, question_id, project_id), backup_params))
+        elif kind == 'ProjectVideoQuestionDisplay':
+            operations.append(DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, question_id), backup_params))
+        else:
+            operations.append(DeleteOperation('ProjectVideo', 'using_id', (project_id, video_id), backup_params))
     
     # Delete ProjectUserRoles (and their dependencies)
     result = session.execute(text("SELECT user_id, role FROM project_user_roles WHERE project_id = :p_id"), {"p_id": project_id})
@@ -751,7 +1034,7 @@ def delete_user_using_id(user_id: int, backup_first: bool = True, backup_dir: st
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if user exists
-            result = session.execute(text("SELECT user_id_str FROM users WHERE id = :id"), {"id": user_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["users"], {"id": user_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ User with ID {user_id} not found")
@@ -766,12 +1049,14 @@ def delete_user_using_id(user_id: int, backup_first: bool = True, backup_dir: st
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting user: {e}")
@@ -786,7 +1071,7 @@ def delete_video_using_id(video_id: int, backup_first: bool = True, backup_dir:
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if video exists
-            result = session.execute(text("SELECT video_uid FROM videos WHERE id = :id"), {"id": video_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["videos"], {"id": video_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Video with ID {video_id} not found")
@@ -801,12 +1086,14 @@ def delete_video_using_id(video_id: int, backup_first: bool = True, backup_dir:
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting video: {e}")
@@ -831,11 +1118,13 @@ def delete_video_tag_using_id(video_id: int, tag: str, backup_first: bool = True
             operations = [DeleteOperation('VideoTag', 'using_id', (video_id, tag), backup_params)]
             sorted_operations = _collect_delete_operations(operations)
             
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting video tag: {e}")
@@ -850,7 +1139,7 @@ def delete_question_group_using_id(question_group_id: int, backup_first: bool =
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if question group exists
-            result = session.execute(text("SELECT title FROM question_groups WHERE id = :id"), {"id": question_group_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["question_groups"], {"id": question_group_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Question group with ID {question_group_id} not found")
@@ -865,12 +1154,14 @@ def delete_question_group_using_id(question_group_id: int, backup_first: bool =
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting question group: {e}")
@@ -885,7 +1176,7 @@ def delete_question_using_id(question_id: int, backup_first: bool = True, backup
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if question exists
-            result = session.execute(text("SELECT text FROM questions WHERE id = :id"), {"id": question_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["questions"], {"id": question_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Question with ID {question_id} not found")
@@ -900,18 +1191,85 @@ def delete_question_using_id(question_id: int, backup_first: bool = True, backup
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting question: {e}")
         return False
 
 
+def _delete_many_using_ids(table: str, model: str, label: str, ids: List[int], collect_dependencies,
+                           backup_params: Dict[str, Any], confirm: bool = True) -> bool:
+    """Delete several rows of one table by ID with one backup, one confirmation and one transaction"""
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        print("No operations to perform.")
+        return True
+    
+    try:
+        with label_pizza.db.SessionLocal() as session:
+            # Check that every row exists in one query
+            result = session.execute(
+                text(f"SELECT id FROM {table} WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                {"ids": ids}
+            )
+            found_ids = {row[0] for row in result.fetchall()}
+            missing_ids = [row_id for row_id in ids if row_id not in found_ids]
+            if missing_ids:
+                print(f"❌ {label.capitalize()} with IDs {missing_ids} not found")
+                return False
+            
+            print(f"🔍 Collecting dependencies for {len(ids)} {label}")
+            
+            # Collect all dependent operations
+            operations = []
+            for row_id in ids:
+                operations.extend(collect_dependencies(session, row_id, backup_params))
+                operations.append(DeleteOperation(model, 'using_id', (row_id,), backup_params))
+            
+            # Sort and deduplicate
+            sorted_operations = _collect_delete_operations(operations)
+            
+            # Back up while the user reviews the operations, then confirm and execute.
+            # Unattended scripts pass confirm=False and skip building the report.
+            pending_backup = _start_backup_in_background(sorted_operations)
+            if not confirm:
+                print(f"Deleting {len(sorted_operations)} rows without confirmation")
+            elif not _confirm_cascade_deletion(sorted_operations):
+                print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
+                return False
+            
+            return _execute_delete_operations(sorted_operations, pending_backup)
+            
+    except Exception as e:
+        print(f"❌ Error deleting {label}: {e}")
+        return False
+
+
+def delete_questions_using_ids(question_ids: List[int], backup_first: bool = True, backup_dir: str = "./backups", 
+                               backup_file: Optional[str] = None, compress: bool = True, confirm: bool = True) -> bool:
+    """Delete several questions by ID with one backup, one confirmation and one transaction"""
+    backup_params = {"backup_first": backup_first, "backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+    return _delete_many_using_ids("questions", "Question", "questions", question_ids, _collect_question_dependencies,
+                                  backup_params, confirm)
+
+
+def delete_videos_using_ids(video_ids: List[int], backup_first: bool = True, backup_dir: str = "./backups", 
+                            backup_file: Optional[str] = None, compress: bool = True, confirm: bool = True) -> bool:
+    """Delete several videos by ID with one backup, one confirmation and one transaction"""
+    backup_params = {"backup_first": backup_first, "backup_dir": backup_dir, "backup_file": backup_file, "compress": compress}
+    return _delete_many_using_ids("videos", "Video", "videos", video_ids, _collect_video_dependencies,
+                                  backup_params, confirm)
+
+
 def delete_question_group_question_using_id(question_group_id: int, question_id: int, backup_first: bool = True, 
                                            backup_dir: str = "./backups", backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Delete question group question relationship by IDs"""
@@ -935,12 +1293,14 @@ def delete_question_group_question_using_id(question_group_id: int, question_id:
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting question group question: {e}")
@@ -955,7 +1315,7 @@ def delete_schema_using_id(schema_id: int, backup_first: bool = True, backup_dir
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if schema exists
-            result = session.execute(text("SELECT name FROM schemas WHERE id = :id"), {"id": schema_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["schemas"], {"id": schema_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Schema with ID {schema_id} not found")
@@ -970,12 +1330,14 @@ def delete_schema_using_id(schema_id: int, backup_first: bool = True, backup_dir
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting schema: {e}")
@@ -1005,12 +1367,14 @@ def delete_schema_question_group_using_id(schema_id: int, question_group_id: int
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting schema question group: {e}")
@@ -1025,7 +1389,7 @@ def delete_project_using_id(project_id: int, backup_first: bool = True, backup_d
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if project exists
-            result = session.execute(text("SELECT name FROM projects WHERE id = :id"), {"id": project_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["projects"], {"id": project_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Project with ID {project_id} not found")
@@ -1040,12 +1404,14 @@ def delete_project_using_id(project_id: int, backup_first: bool = True, backup_d
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project: {e}")
@@ -1075,12 +1441,14 @@ def delete_project_video_using_id(project_id: int, video_id: int, backup_first:
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project video: {e}")
@@ -1110,12 +1478,14 @@ def delete_project_user_role_using_id(project_id: int, user_id: int, role: str,
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project user role: {e}")
@@ -1130,7 +1500,7 @@ def delete_project_group_using_id(project_group_id: int, backup_first: bool = Tr
     try:
         with label_pizza.db.SessionLocal() as session:
             # Check if project group exists
-            result = session.execute(text("SELECT name FROM project_groups WHERE id = :id"), {"id": project_group_id})
+            result = session.execute(_NAME_BY_ID_STATEMENTS["project_groups"], {"id": project_group_id})
             row = result.fetchone()
             if not row:
                 print(f"❌ Project group with ID {project_group_id} not found")
@@ -1145,12 +1515,14 @@ def delete_project_group_using_id(project_group_id: int, backup_first: bool = Tr
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project group: {e}")
@@ -1176,11 +1548,13 @@ def delete_project_group_project_using_id(project_group_id: int, project_id: int
             operations = [DeleteOperation('ProjectGroupProject', 'using_id', (project_group_id, project_id), backup_params)]
             sorted_operations = _collect_delete_operations(operations)
             
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project group project: {e}")
@@ -1206,11 +1580,13 @@ def delete_project_video_question_display_using_id(project_id: int, video_id: in
             operations = [DeleteOperation('ProjectVideoQuestionDisplay', 'using_id', (project_id, video_id, question_id), backup_params)]
             sorted_operations = _collect_delete_operations(operations)
             
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting project video question display: {e}")
@@ -1240,12 +1616,14 @@ def delete_annotator_answer_using_id(answer_id: int, backup_first: bool = True,
             # Sort and deduplicate
             sorted_operations = _collect_delete_operations(operations)
             
-            # Confirm and execute
+            # Back up while the user reviews the operations, then confirm and execute
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting annotator answer: {e}")
@@ -1272,11 +1650,13 @@ def delete_reviewer_ground_truth_using_id(video_id: int, question_id: int, proje
             operations = [DeleteOperation('ReviewerGroundTruth', 'using_id', (video_id, question_id, project_id), backup_params)]
             sorted_operations = _collect_delete_operations(operations)
             
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting reviewer ground truth: {e}")
@@ -1302,11 +1682,13 @@ def delete_answer_review_using_id(answer_review_id: int, backup_first: bool = Tr
             operations = [DeleteOperation('AnswerReview', 'using_id', (answer_review_id,), backup_params)]
             sorted_operations = _collect_delete_operations(operations)
             
+            pending_backup = _start_backup_in_background(sorted_operations)
             if not _confirm_cascade_deletion(sorted_operations):
                 print("❌ Deletion cancelled")
+                _discard_background_backup(pending_backup)
                 return False
             
-            return _execute_delete_operations(sorted_operations)
+            return _execute_delete_operations(sorted_operations, pending_backup)
             
     except Exception as e:
         print(f"❌ Error deleting answer review: {e}")
@@ -1382,8 +1764,9 @@ def delete_question_group_question(question_group_title: str, question_text: str
     """Delete question group question relationship by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            question_group_id = _get_question_group_id_from_title(session, question_group_title)
-            question_id = _get_question_id_from_text(session, question_text)
+            question_group_id, question_id = _get_ids_by_names(session, [
+                ("question_groups", "Question group", question_group_title), ("questions", "Question", question_text)
+            ])
             return delete_question_group_question_using_id(question_group_id, question_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting question group question '{question_group_title}'/'{question_text}': {e}")
@@ -1407,8 +1790,9 @@ def delete_schema_question_group(schema_name: str, question_group_title: str, ba
     """Delete schema question group relationship by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            schema_id = _get_schema_id_from_name(session, schema_name)
-            question_group_id = _get_question_group_id_from_title(session, question_group_title)
+            schema_id, question_group_id = _get_ids_by_names(session, [
+                ("schemas", "Schema", schema_name), ("question_groups", "Question group", question_group_title)
+            ])
             return delete_schema_question_group_using_id(schema_id, question_group_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting schema question group '{schema_name}'/'{question_group_title}': {e}")
@@ -1432,8 +1816,9 @@ def delete_project_video(project_name: str, video_uid: str, backup_first: bool =
     """Delete project video relationship by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_id = _get_project_id_from_name(session, project_name)
-            video_id = _get_video_id_from_video_uid(session, video_uid)
+            project_id, video_id = _get_ids_by_names(session, [
+                ("projects", "Project", project_name), ("videos", "Video", video_uid)
+            ])
             return delete_project_video_using_id(project_id, video_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting project video '{project_name}'/'{video_uid}': {e}")
@@ -1445,8 +1830,9 @@ def delete_project_user_role(project_name: str, user_id_str: str, role: str, bac
     """Delete project user role by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_id = _get_project_id_from_name(session, project_name)
-            user_id = _get_user_id_from_user_id_str(session, user_id_str)
+            project_id, user_id = _get_ids_by_names(session, [
+                ("projects", "Project", project_name), ("users", "User", user_id_str)
+            ])
             return delete_project_user_role_using_id(project_id, user_id, role, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting project user role '{project_name}'/'{user_id_str}'/'{role}': {e}")
@@ -1470,8 +1856,9 @@ def delete_project_group_project(project_group_name: str, project_name: str, bac
     """Delete project group project relationship by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_group_id = _get_project_group_id_from_name(session, project_group_name)
-            project_id = _get_project_id_from_name(session, project_name)
+            project_group_id, project_id = _get_ids_by_names(session, [
+                ("project_groups", "Project group", project_group_name), ("projects", "Project", project_name)
+            ])
             return delete_project_group_project_using_id(project_group_id, project_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting project group project '{project_group_name}'/'{project_name}': {e}")
@@ -1483,9 +1870,9 @@ def delete_project_video_question_display(project_name: str, video_uid: str, que
     """Delete project video question display by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_id = _get_project_id_from_name(session, project_name)
-            video_id = _get_video_id_from_video_uid(session, video_uid)
-            question_id = _get_question_id_from_text(session, question_text)
+            project_id, video_id, question_id = _get_ids_by_names(session, [
+                ("projects", "Project", project_name), ("videos", "Video", video_uid), ("questions", "Question", question_text)
+            ])
             return delete_project_video_question_display_using_id(project_id, video_id, question_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting project video question display '{project_name}'/'{video_uid}'/'{question_text}': {e}")
@@ -1498,10 +1885,10 @@ def delete_annotator_answer(video_uid: str, question_text: str, user_id_str: str
     """Delete annotator answer by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            video_id = _get_video_id_from_video_uid(session, video_uid)
-            question_id = _get_question_id_from_text(session, question_text)
-            user_id = _get_user_id_from_user_id_str(session, user_id_str)
-            project_id = _get_project_id_from_name(session, project_name)
+            video_id, question_id, user_id, project_id = _get_ids_by_names(session, [
+                ("videos", "Video", video_uid), ("questions", "Question", question_text),
+                ("users", "User", user_id_str), ("projects", "Project", project_name)
+            ])
             
             # Find the answer ID
             result = session.execute(text("""
@@ -1524,9 +1911,9 @@ def delete_reviewer_ground_truth(video_uid: str, question_text: str, project_nam
     """Delete reviewer ground truth by names"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            video_id = _get_video_id_from_video_uid(session, video_uid)
-            question_id = _get_question_id_from_text(session, question_text)
-            project_id = _get_project_id_from_name(session, project_name)
+            video_id, question_id, project_id = _get_ids_by_names(session, [
+                ("videos", "Video", video_uid), ("questions", "Question", question_text), ("projects", "Project", project_name)
+            ])
             return delete_reviewer_ground_truth_using_id(video_id, question_id, project_id, backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error deleting reviewer ground truth '{video_uid}'/'{question_text}'/'{project_name}': {e}")
@@ -1543,427 +1930,212 @@ def delete_answer_review(answer_id: int, backup_first: bool = True, backup_dir:
 # NAME MANAGEMENT FUNCTIONS - GET FUNCTIONS
 # ============================================================================
 
-def get_user_name(user_id: int) -> str:
-    """Get user_id_str from user ID"""
+def _get_name_by_id(table: str, label: str, id_value: int) -> str:
+    """Get a row's name column from its ID, raising ValueError if it does not exist"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT user_id_str FROM users WHERE id = :id"), {"id": user_id})
-            row = result.fetchone()
+            row = session.execute(_NAME_BY_ID_STATEMENTS[table], {"id": id_value}).fetchone()
             if not row:
-                raise ValueError(f"User with ID {user_id} not found")
+                raise ValueError(f"{label.capitalize()} with ID {id_value} not found")
             return row[0]
     except Exception as e:
-        raise ValueError(f"Error getting user name: {e}")
+        raise ValueError(f"Error getting {label} name: {e}")
+
+
+def get_user_name(user_id: int) -> str:
+    """Get user_id_str from user ID"""
+    return _get_name_by_id("users", "user", user_id)
 
 
 def get_video_name(video_id: int) -> str:
     """Get video_uid from video ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT video_uid FROM videos WHERE id = :id"), {"id": video_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Video with ID {video_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting video name: {e}")
+    return _get_name_by_id("videos", "video", video_id)
 
 
 def get_question_group_name(question_group_id: int) -> str:
     """Get title from question group ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT title FROM question_groups WHERE id = :id"), {"id": question_group_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Question group with ID {question_group_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting question group name: {e}")
+    return _get_name_by_id("question_groups", "question group", question_group_id)
 
 
 def get_question_name(question_id: int) -> str:
     """Get text from question ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT text FROM questions WHERE id = :id"), {"id": question_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Question with ID {question_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting question name: {e}")
+    return _get_name_by_id("questions", "question", question_id)
 
 
 def get_schema_name(schema_id: int) -> str:
     """Get name from schema ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT name FROM schemas WHERE id = :id"), {"id": schema_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Schema with ID {schema_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting schema name: {e}")
+    return _get_name_by_id("schemas", "schema", schema_id)
 
 
 def get_project_name(project_id: int) -> str:
     """Get name from project ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT name FROM projects WHERE id = :id"), {"id": project_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Project with ID {project_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting project name: {e}")
+    return _get_name_by_id("projects", "project", project_id)
 
 
 def get_project_group_name(project_group_id: int) -> str:
     """Get name from project group ID"""
-    try:
-        with label_pizza.db.SessionLocal() as session:
-            result = session.execute(text("SELECT name FROM project_groups WHERE id = :id"), {"id": project_group_id})
-            row = result.fetchone()
-            if not row:
-                raise ValueError(f"Project group with ID {project_group_id} not found")
-            return row[0]
-    except Exception as e:
-        raise ValueError(f"Error getting project group name: {e}")
+    return _get_name_by_id("project_groups", "project group", project_group_id)
 
 
 # ============================================================================
 # NAME MANAGEMENT FUNCTIONS - SET USING ID FUNCTIONS
 # ============================================================================
 
-def set_user_name_using_id(user_id: int, user_id_str: str, backup_first: bool = True, backup_dir: str = "./backups", 
-                          backup_file: Optional[str] = None, compress: bool = True) -> bool:
-    """Set user_id_str for user ID"""
+def _start_rename_backup(backup_first: bool, backup_dir: str, backup_file: Optional[str], compress: bool) -> Optional[Future]:
+    """Start the optional backup for a rename so it overlaps with the UPDATE"""
+    if not backup_first:
+        return None
+    backup_params = {'backup_dir': backup_dir, 'backup_file': backup_file, 'compress': compress}
+    return _backup_executor.submit(_create_backup_for_operations, backup_params)
+
+
+def _await_rename_backup(pending_backup: Optional[Future]) -> bool:
+    """Wait for the rename backup; return False if it failed and the user aborts"""
+    if pending_backup is None:
+        return True
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if user exists
-            result = session.execute(text("SELECT user_id_str FROM users WHERE id = :id"), {"id": user_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ User with ID {user_id} not found")
-                return False
-                
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM users WHERE user_id_str = :user_id_str AND id != :id"), 
-                                   {"user_id_str": user_id_str, "id": user_id})
-            if result.fetchone():
-                print(f"❌ User ID string '{user_id_str}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE users SET user_id_str = :user_id_str WHERE id = :id"), 
-                          {"user_id_str": user_id_str, "id": user_id})
-            session.commit()
-            
-            print(f"✅ Updated user ID {user_id}: '{old_name}' → '{user_id_str}'")
-            return True
-            
+        backup_file_created = pending_backup.result()
+        print(f"💾 Backup created: {backup_file_created}")
     except Exception as e:
-        print(f"❌ Error setting user name: {e}")
+        print(f"❌ Failed to create backup: {e}")
+        print("⚠️  Backup creation failed, but backup_first=True was requested.")
+        response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
+        if response.strip() != 'CONTINUE':
+            print("❌ Operation cancelled due to backup failure")
+            return False
+    return True
+
+
+def _apply_rename(session: Session, table: str, column: str, row_id: int, old_value: str, new_value: str,
+                  label: str, duplicate_message: str, backup_first: bool, backup_dir: str,
+                  backup_file: Optional[str], compress: bool) -> bool:
+    """Rename a row whose current value is already known, so callers need only one lookup"""
+    if old_value == new_value:
+        print(f"ℹ️  Nothing to update: value is already '{new_value}'")
+        return True
+    
+    # Only back up once we know a change will actually be made. The backup runs
+    # on its own connection while we update; we commit only after it finishes,
+    # so it still captures the old value.
+    pending_backup = _start_rename_backup(backup_first, backup_dir, backup_file, compress)
+    
+    # Update the name; the unique constraint rejects duplicates atomically
+    try:
+        session.execute(text(f"UPDATE {table} SET {column} = :value WHERE id = :id"), 
+                      {"value": new_value, "id": row_id})
+        if not _await_rename_backup(pending_backup):
+            session.rollback()
+            return False
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        if pending_backup is not None:
+            pending_backup.exception()  # let the backup finish before returning
+        print(f"❌ {duplicate_message}")
         return False
+    
+    print(f"✅ Updated {label} ID {row_id}: '{old_value}' → '{new_value}'")
+    return True
 
 
-def set_video_name_using_id(video_id: int, video_uid: str, backup_first: bool = True, backup_dir: str = "./backups", 
-                           backup_file: Optional[str] = None, compress: bool = True) -> bool:
-    """Set video_uid for video ID"""
+def _rename_by_name(session: Session, table: str, old_value: str, new_value: str, label: str,
+                    duplicate_message: str, backup_first: bool, backup_dir: str,
+                    backup_file: Optional[str], compress: bool) -> bool:
+    """Rename a row found by its current name with one UPDATE ... RETURNING round-trip"""
+    column = _NAME_COLUMNS[table]
+    if old_value == new_value:
+        row_id = _get_id_by_name(session, table, label.capitalize(), old_value)
+        return _apply_rename(session, table, column, row_id, old_value, new_value, label, duplicate_message,
+                             backup_first, backup_dir, backup_file, compress)
+    
+    # The UPDATE finds the row, renames it and reports its id at once; a missing
+    # row or a duplicate name is known before any backup work starts. The backup
+    # then runs on its own connection and we commit only after it finishes.
+    pending_backup = None
+    try:
+        row = session.execute(text(f"UPDATE {table} SET {column} = :new_value WHERE {column} = :old_value RETURNING id"),
+                              {"new_value": new_value, "old_value": old_value}).fetchone()
+        if not row:
+            session.rollback()
+            raise ValueError(f"{label.capitalize()} not found: {old_value}")
+        pending_backup = _start_rename_backup(backup_first, backup_dir, backup_file, compress)
+        if not _await_rename_backup(pending_backup):
+            session.rollback()
+            return False
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        print(f"❌ {duplicate_message}")
+        return False
+    
+    print(f"✅ Updated {label} ID {row[0]}: '{old_value}' → '{new_value}'")
+    return True
+
+
+def _set_name_using_id(table: str, label: str, row_id: int, new_value: str, duplicate_message: str,
+                       backup_first: bool, backup_dir: str, backup_file: Optional[str], compress: bool) -> bool:
+    """Rename the row with the given ID after checking that it exists"""
     try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
         with label_pizza.db.SessionLocal() as session:
-            # Check if video exists
-            result = session.execute(text("SELECT video_uid FROM videos WHERE id = :id"), {"id": video_id})
-            row = result.fetchone()
+            row = session.execute(_NAME_BY_ID_STATEMENTS[table], {"id": row_id}).fetchone()
             if not row:
-                print(f"❌ Video with ID {video_id} not found")
+                print(f"❌ {label.capitalize()} with ID {row_id} not found")
                 return False
                 
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM videos WHERE video_uid = :video_uid AND id != :id"), 
-                                   {"video_uid": video_uid, "id": video_id})
-            if result.fetchone():
-                print(f"❌ Video UID '{video_uid}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE videos SET video_uid = :video_uid WHERE id = :id"), 
-                          {"video_uid": video_uid, "id": video_id})
-            session.commit()
-            
-            print(f"✅ Updated video ID {video_id}: '{old_name}' → '{video_uid}'")
-            return True
+            return _apply_rename(session, table, _NAME_COLUMNS[table], row_id, row[0], new_value, label,
+                                 duplicate_message, backup_first, backup_dir, backup_file, compress)
             
     except Exception as e:
-        print(f"❌ Error setting video name: {e}")
+        print(f"❌ Error setting {label} name: {e}")
         return False
 
 
+def set_user_name_using_id(user_id: int, user_id_str: str, backup_first: bool = True, backup_dir: str = "./backups", 
+                          backup_file: Optional[str] = None, compress: bool = True) -> bool:
+    """Set user_id_str for user ID"""
+    return _set_name_using_id("users", "user", user_id, user_id_str, f"User ID string '{user_id_str}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
+
+
+def set_video_name_using_id(video_id: int, video_uid: str, backup_first: bool = True, backup_dir: str = "./backups", 
+                           backup_file: Optional[str] = None, compress: bool = True) -> bool:
+    """Set video_uid for video ID"""
+    return _set_name_using_id("videos", "video", video_id, video_uid, f"Video UID '{video_uid}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
+
+
 def set_question_group_name_using_id(question_group_id: int, title: str, backup_first: bool = True, backup_dir: str = "./backups", 
                                     backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set title for question group ID"""
-    try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if question group exists
-            result = session.execute(text("SELECT title FROM question_groups WHERE id = :id"), {"id": question_group_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ Question group with ID {question_group_id} not found")
-                return False
-                
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM question_groups WHERE title = :title AND id != :id"), 
-                                   {"title": title, "id": question_group_id})
-            if result.fetchone():
-                print(f"❌ Question group title '{title}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE question_groups SET title = :title WHERE id = :id"), 
-                          {"title": title, "id": question_group_id})
-            session.commit()
-            
-            print(f"✅ Updated question group ID {question_group_id}: '{old_name}' → '{title}'")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error setting question group name: {e}")
-        return False
+    return _set_name_using_id("question_groups", "question group", question_group_id, title, f"Question group title '{title}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
 
 def set_question_name_using_id(question_id: int, question_text: str, backup_first: bool = True, backup_dir: str = "./backups", 
                               backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set text for question ID"""
-    try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if question exists
-            result = session.execute(text("SELECT text FROM questions WHERE id = :id"), {"id": question_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ Question with ID {question_id} not found")
-                return False
-                
-            old_text = row[0]
-            
-            # Check if new text is unique
-            result = session.execute(text("SELECT id FROM questions WHERE text = :text AND id != :id"), 
-                                   {"text": question_text, "id": question_id})  # Fixed: use question_text parameter
-            if result.fetchone():
-                print(f"❌ Question text already exists")
-                return False
-            
-            # Update the text
-            session.execute(text("UPDATE questions SET text = :text WHERE id = :id"), 
-                          {"text": question_text, "id": question_id})  # Fixed: use question_text parameter
-            session.commit()
-            
-            print(f"✅ Updated question ID {question_id} text")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error setting question name: {e}")
-        return False
+    return _set_name_using_id("questions", "question", question_id, question_text, "Question text already exists",
+                              backup_first, backup_dir, backup_file, compress)
 
 
 def set_schema_name_using_id(schema_id: int, name: str, backup_first: bool = True, backup_dir: str = "./backups", 
                             backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for schema ID"""
-    try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if schema exists
-            result = session.execute(text("SELECT name FROM schemas WHERE id = :id"), {"id": schema_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ Schema with ID {schema_id} not found")
-                return False
-                
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM schemas WHERE name = :name AND id != :id"), 
-                                   {"name": name, "id": schema_id})
-            if result.fetchone():
-                print(f"❌ Schema name '{name}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE schemas SET name = :name WHERE id = :id"), 
-                          {"name": name, "id": schema_id})
-            session.commit()
-            
-            print(f"✅ Updated schema ID {schema_id}: '{old_name}' → '{name}'")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error setting schema name: {e}")
-        return False
+    return _set_name_using_id("schemas", "schema", schema_id, name, f"Schema name '{name}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
 
 
 def set_project_name_using_id(project_id: int, name: str, backup_first: bool = True, backup_dir: str = "./backups", 
                              backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for project ID"""
-    try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if project exists
-            result = session.execute(text("SELECT name FROM projects WHERE id = :id"), {"id": project_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ Project with ID {project_id} not found")
-                return False
-                
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM projects WHERE name = :name AND id != :id"), 
-                                   {"name": name, "id": project_id})
-            if result.fetchone():
-                print(f"❌ Project name '{name}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE projects SET name = :name WHERE id = :id"), 
-                          {"name": name, "id": project_id})
-            session.commit()
-            
-            print(f"✅ Updated project ID {project_id}: '{old_name}' → '{name}'")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error setting project name: {e}")
-        return False
+    return _set_name_using_id("projects", "project", project_id, name, f"Project name '{name}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
 
 
 def set_project_group_name_using_id(project_group_id: int, name: str, backup_first: bool = True, backup_dir: str = "./backups", 
                                    backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name for project group ID"""
-    try:
-        if backup_first:
-            try:
-                db_url = get_db_url_for_backup()
-                backup_file_created = create_backup_if_requested(str(db_url), backup_dir, backup_file, compress)
-                print(f"💾 Backup created: {backup_file_created}")
-            except Exception as e:
-                print(f"❌ Failed to create backup: {e}")
-                print("⚠️  Backup creation failed, but backup_first=True was requested.")
-                response = input("Continue without backup? Type 'CONTINUE' to proceed: ")
-                if response.strip() != 'CONTINUE':
-                    print("❌ Operation cancelled due to backup failure")
-                    return False
-            
-        with label_pizza.db.SessionLocal() as session:
-            # Check if project group exists
-            result = session.execute(text("SELECT name FROM project_groups WHERE id = :id"), {"id": project_group_id})
-            row = result.fetchone()
-            if not row:
-                print(f"❌ Project group with ID {project_group_id} not found")
-                return False
-                
-            old_name = row[0]
-            
-            # Check if new name is unique
-            result = session.execute(text("SELECT id FROM project_groups WHERE name = :name AND id != :id"), 
-                                   {"name": name, "id": project_group_id})
-            if result.fetchone():
-                print(f"❌ Project group name '{name}' already exists")
-                return False
-            
-            # Update the name
-            session.execute(text("UPDATE project_groups SET name = :name WHERE id = :id"), 
-                          {"name": name, "id": project_group_id})
-            session.commit()
-            
-            print(f"✅ Updated project group ID {project_group_id}: '{old_name}' → '{name}'")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error setting project group name: {e}")
-        return False
+    return _set_name_using_id("project_groups", "project group", project_group_id, name, f"Project group name '{name}' already exists",
+                              backup_first, backup_dir, backup_file, compress)
 
 
 # ============================================================================
@@ -1975,8 +2147,9 @@ def set_user_name(old_user_id_str: str, new_user_id_str: str, backup_first: bool
     """Set user_id_str by current user_id_str"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            user_id = _get_user_id_from_user_id_str(session, old_user_id_str)
-            return set_user_name_using_id(user_id, new_user_id_str, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "users", old_user_id_str, new_user_id_str, "user",
+                                   f"User ID string '{new_user_id_str}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting user name '{old_user_id_str}': {e}")
         return False
@@ -1987,8 +2160,9 @@ def set_video_name(old_video_uid: str, new_video_uid: str, backup_first: bool =
     """Set video_uid by current video_uid"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            video_id = _get_video_id_from_video_uid(session, old_video_uid)
-            return set_video_name_using_id(video_id, new_video_uid, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "videos", old_video_uid, new_video_uid, "video",
+                                   f"Video UID '{new_video_uid}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting video name '{old_video_uid}': {e}")
         return False
@@ -1999,8 +2173,9 @@ def set_question_group_name(old_title: str, new_title: str, backup_first: bool =
     """Set title by current title"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            question_group_id = _get_question_group_id_from_title(session, old_title)
-            return set_question_group_name_using_id(question_group_id, new_title, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "question_groups", old_title, new_title, "question group",
+                                   f"Question group title '{new_title}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting question group name '{old_title}': {e}")
         return False
@@ -2011,20 +2186,74 @@ def set_question_name(old_text: str, new_text: str, backup_first: bool = True, b
     """Set text by current text"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            question_id = _get_question_id_from_text(session, old_text)
-            return set_question_name_using_id(question_id, new_text, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "questions", old_text, new_text, "question",
+                                   "Question text already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting question name '{old_text}': {e}")
         return False
 
 
+def set_question_names(renames: List[Tuple[str, str]], backup_first: bool = True, backup_dir: str = "./backups", 
+                       backup_file: Optional[str] = None, compress: bool = True) -> bool:
+    """Set text for several questions by current text with one backup and one transaction"""
+    if not renames:
+        print("ℹ️  Nothing to update: no renames given")
+        return True
+    
+    try:
+        with label_pizza.db.SessionLocal() as session:
+            # Resolve every current text in one query
+            old_texts = [old_text for old_text, _ in renames]
+            result = session.execute(
+                text("SELECT id, text FROM questions WHERE text IN :texts").bindparams(bindparam("texts", expanding=True)),
+                {"texts": old_texts}
+            )
+            id_by_text = {row[1]: row[0] for row in result.fetchall()}
+            missing = [old_text for old_text in old_texts if old_text not in id_by_text]
+            if missing:
+                print(f"❌ Questions not found: {missing}")
+                return False
+            
+            updates = [{"text": new_text, "id": id_by_text[old_text]} for old_text, new_text in renames if old_text != new_text]
+            if not updates:
+                print("ℹ️  Nothing to update: all values are already set")
+                return True
+            
+            # Only back up once we know a change will actually be made; it overlaps
+            # with the UPDATE and we commit only after it finishes
+            pending_backup = _start_rename_backup(backup_first, backup_dir, backup_file, compress)
+            
+            # One executemany for all renames; the unique constraint rejects duplicates atomically
+            try:
+                session.execute(text("UPDATE questions SET text = :text WHERE id = :id"), updates)
+                if not _await_rename_backup(pending_backup):
+                    session.rollback()
+                    return False
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                if pending_backup is not None:
+                    pending_backup.exception()  # let the backup finish before returning
+                print(f"❌ Question text already exists")
+                return False
+            
+            print(f"✅ Updated text of {len(updates)} questions")
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error setting question names: {e}")
+        return False
+
+
 def set_schema_name(old_name: str, new_name: str, backup_first: bool = True, backup_dir: str = "./backups", 
                    backup_file: Optional[str] = None, compress: bool = True) -> bool:
     """Set name by current name"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            schema_id = _get_schema_id_from_name(session, old_name)
-            return set_schema_name_using_id(schema_id, new_name, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "schemas", old_name, new_name, "schema",
+                                   f"Schema name '{new_name}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting schema name '{old_name}': {e}")
         return False
@@ -2035,8 +2264,9 @@ def set_project_name(old_name: str, new_name: str, backup_first: bool = True, ba
     """Set name by current name"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_id = _get_project_id_from_name(session, old_name)
-            return set_project_name_using_id(project_id, new_name, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "projects", old_name, new_name, "project",
+                                   f"Project name '{new_name}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting project name '{old_name}': {e}")
         return False
@@ -2047,8 +2277,9 @@ def set_project_group_name(old_name: str, new_name: str, backup_first: bool = Tr
     """Set name by current name"""
     try:
         with label_pizza.db.SessionLocal() as session:
-            project_group_id = _get_project_group_id_from_name(session, old_name)
-            return set_project_group_name_using_id(project_group_id, new_name, backup_first, backup_dir, backup_file, compress)
+            return _rename_by_name(session, "project_groups", old_name, new_name, "project group",
+                                   f"Project group name '{new_name}' already exists",
+                                   backup_first, backup_dir, backup_file, compress)
     except Exception as e:
         print(f"❌ Error setting project group name '{old_name}': {e}")
         return False
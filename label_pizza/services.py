@@ -1,4 +1,4 @@
-from sqlalchemy import select, insert, update, func, delete, exists, join, distinct, and_, or_, case, text
+from sqlalchemy import select, insert, update, func, delete, exists, join, distinct, and_, or_, not_, case, text
 from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager  
 from sqlalchemy.sql import literal_column
 from typing import List, Optional, Dict, Any, Tuple
@@ -22,6 +22,52 @@ load_dotenv()
 from label_pizza.verification_registry import verify
 
 
+def _compact_frame(df: pd.DataFrame, id_columns: List[str], category_columns: List[str]) -> pd.DataFrame:
+    """Downcast integer ID columns and store low-cardinality string columns as categories.
+    
+    Args:
+        df: DataFrame to compact in place
+        id_columns: Integer ID columns to downcast
+        category_columns: String columns to convert to category dtype
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    if df.empty:
+        return df
+    for column in id_columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in category_columns:
+        df[column] = df[column].astype("category")
+    return df
+
+
+def _fetch_page_with_total(session: Session, query, page: int, page_size: int) -> Tuple[List[Any], int]:
+    """Fetch one page of entities together with the unpaginated row count.
+    
+    The total rides along on every row as ``COUNT(*) OVER ()``, so the page
+    and its count come back in a single round-trip.
+    
+    Args:
+        session: Database session
+        query: Single-entity select to paginate
+        page: Zero-based page number
+        page_size: Rows per page
+        
+    Returns:
+        Tuple of (entities on the page, total matching rows)
+    """
+    rows = session.execute(
+        query.add_columns(func.count().over()).offset(page * page_size).limit(page_size)
+    ).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+    if page == 0:
+        return [], 0
+    # Past the last page there are no rows to carry the total
+    return [], session.scalar(select(func.count()).select_from(query.subquery()))
+
+
 class VideoService:
     @staticmethod
     def batch_check_videos_in_projects(video_id: int, project_ids: List[int], session: Session) -> Dict[int, bool]:
@@ -88,7 +134,11 @@ class VideoService:
         Returns:
             Video object if found, None otherwise
         """
-        video = VideoService.get_video_by_uid(video_uid=video_uid, session=session)
+        # Plain column row; no ORM instance needed to build the dict
+        video = session.execute(
+            select(Video.id, Video.video_uid, Video.url, Video.video_metadata, Video.created_at, Video.is_archived)
+            .where(Video.video_uid == video_uid)
+        ).first()
         if not video:
             raise ValueError(f"Video with UID '{video_uid}' not found")
         return {
@@ -149,10 +199,12 @@ class VideoService:
         Raises:
             ValueError: If video not found
         """
-        video = session.get(Video, video_id)
-        if not video:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(Video).where(Video.id == video_id).values(is_archived=True).returning(Video.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Video with ID {video_id} not found")
-        video.is_archived = True
         session.commit()
     
     @staticmethod
@@ -166,10 +218,12 @@ class VideoService:
         Raises:
             ValueError: If video not found
         """
-        video = session.get(Video, video_id)
-        if not video:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(Video).where(Video.id == video_id).values(is_archived=False).returning(Video.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Video with ID {video_id} not found")
-        video.is_archived = False
         session.commit()
     
     @staticmethod
@@ -185,7 +239,10 @@ class VideoService:
             - URL: Video URL
             - Archived: Whether the video is archived
         """
-        videos = session.scalars(select(Video)).all()
+        # Only the listed columns; video_metadata can be large
+        videos = session.execute(
+            select(Video.id, Video.video_uid, Video.url, Video.created_at, Video.updated_at, Video.is_archived)
+        ).all()
         
         return pd.DataFrame([
             {
@@ -475,15 +532,11 @@ class VideoService:
         active_videos = session.scalar(select(func.count(Video.id)).where(Video.is_archived == False))
         archived_videos = total_videos - active_videos
         
-        # Get unassigned count efficiently
-        assigned_video_ids = session.scalars(
-            select(ProjectVideo.video_id).distinct()
-        ).all()
-        
+        # Get unassigned count efficiently; assigned ids stay in the database as a subquery
         unassigned_count = session.scalar(
             select(func.count(Video.id)).where(
                 Video.is_archived == False,
-                ~Video.id.in_(assigned_video_ids) if assigned_video_ids else True
+                ~Video.id.in_(select(ProjectVideo.video_id))
             )
         )
         
@@ -519,19 +572,10 @@ class VideoService:
         
         # Handle unassigned filter
         if show_only_unassigned:
-            assigned_video_ids = session.scalars(
-                select(ProjectVideo.video_id).distinct()
-            ).all()
-            if assigned_video_ids:
-                query = query.where(~Video.id.in_(assigned_video_ids))
-        
-        # Get total count for pagination
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = session.scalar(count_query)
+            query = query.where(~Video.id.in_(select(ProjectVideo.video_id)))
         
-        # Apply pagination
-        query = query.offset(page * page_size).limit(page_size)
-        videos = session.scalars(query).all()
+        # Fetch the page and its total count in one query
+        videos, total_count = _fetch_page_with_total(session, query, page, page_size)
         
         # Convert to dataframe format
         video_data = []
@@ -574,75 +618,42 @@ class ProjectService:
         if not project_ids:
             return {}
         
-        # Single query to get all project basic info
+        # Project info and all three counts in one round-trip, as correlated
+        # subqueries instead of a separate GROUP BY query per count
         projects_query = select(
             Project.id,
             Project.name,
             Project.description,
             Project.schema_id,
             Project.is_archived,
-            Project.created_at
+            Project.created_at,
+            # Non-archived videos in the project
+            select(func.count(ProjectVideo.video_id))
+            .join(Video, ProjectVideo.video_id == Video.id)
+            .where(ProjectVideo.project_id == Project.id, Video.is_archived == False)
+            .scalar_subquery().label('video_count'),
+            # Non-archived questions in the project's schema
+            select(func.count(Question.id))
+            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+            .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
+            .where(SchemaQuestionGroup.schema_id == Project.schema_id, Question.is_archived == False)
+            .scalar_subquery().label('question_count'),
+            # Ground truth rows for non-archived questions
+            select(func.count())
+            .select_from(ReviewerGroundTruth)
+            .join(Question, ReviewerGroundTruth.question_id == Question.id)
+            .where(ReviewerGroundTruth.project_id == Project.id, Question.is_archived == False)
+            .scalar_subquery().label('gt_count')
         ).where(Project.id.in_(project_ids))
         
         projects_result = session.execute(projects_query).all()
         
-        # Single query to get video counts for all projects
-        video_counts_query = select(
-            ProjectVideo.project_id,
-            func.count(ProjectVideo.video_id).label('video_count')
-        ).select_from(
-            ProjectVideo
-        ).join(
-            Video, ProjectVideo.video_id == Video.id
-        ).where(
-            ProjectVideo.project_id.in_(project_ids),
-            Video.is_archived == False
-        ).group_by(ProjectVideo.project_id)
-        
-        video_counts_result = session.execute(video_counts_query).all()
-        video_counts_map = {row.project_id: row.video_count for row in video_counts_result}
-        
-        # Single query to get question counts for all schemas
-        schema_ids = [p.schema_id for p in projects_result]
-        question_counts_query = select(
-            SchemaQuestionGroup.schema_id,
-            func.count(Question.id).label('question_count')
-        ).select_from(
-            Question
-        ).join(
-            QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id
-        ).join(
-            SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id
-        ).where(
-            SchemaQuestionGroup.schema_id.in_(schema_ids),
-            Question.is_archived == False
-        ).group_by(SchemaQuestionGroup.schema_id)
-        
-        question_counts_result = session.execute(question_counts_query).all()
-        question_counts_map = {row.schema_id: row.question_count for row in question_counts_result}
-        
-        # Single query to get ground truth counts for all projects
-        gt_counts_query = select(
-            ReviewerGroundTruth.project_id,
-            func.count().label('gt_count')
-        ).select_from(
-            ReviewerGroundTruth
-        ).join(
-            Question, ReviewerGroundTruth.question_id == Question.id
-        ).where(
-            ReviewerGroundTruth.project_id.in_(project_ids),
-            Question.is_archived == False
-        ).group_by(ReviewerGroundTruth.project_id)
-        
-        gt_counts_result = session.execute(gt_counts_query).all()
-        gt_counts_map = {row.project_id: row.gt_count for row in gt_counts_result}
-        
         # Build result
         result = {}
         for project in projects_result:
-            video_count = video_counts_map.get(project.id, 0)
-            question_count = question_counts_map.get(project.schema_id, 0)
-            gt_count = gt_counts_map.get(project.id, 0)
+            video_count = project.video_count
+            question_count = project.question_count
+            gt_count = project.gt_count
             
             total_possible = video_count * question_count
             completion_percentage = (gt_count / total_possible * 100) if total_possible > 0 else 0.0
@@ -709,7 +720,7 @@ class ProjectService:
             ).label('total_questions'),
             # Count ground truth answers
             func.coalesce(
-                select(func.count(ReviewerGroundTruth.project_id))
+                select(func.count())
                 .select_from(ReviewerGroundTruth)
                 .where(ReviewerGroundTruth.project_id == Project.id)
                 .scalar_subquery(), 0
@@ -773,7 +784,7 @@ class ProjectService:
             ).label('total_questions'),
             # Count ground truth answers
             func.coalesce(
-                select(func.count(ReviewerGroundTruth.project_id))
+                select(func.count())
                 .select_from(ReviewerGroundTruth)
                 .where(ReviewerGroundTruth.project_id == Project.id)
                 .scalar_subquery(), 0
@@ -836,7 +847,7 @@ class ProjectService:
             raise ValueError("Project name is required")
         
         # Check if project name already exists
-        existing_project = session.scalar(select(Project).where(Project.name == name))
+        existing_project = session.scalar(select(exists().where(Project.name == name)))
         if existing_project:
             raise ValueError(f"Project with name '{name}' already exists")
         
@@ -1161,39 +1172,37 @@ class ProjectService:
         Raises:
             ValueError: If project not found
         """
-        project = session.get(Project, project_id)
-        if not project:
+        # Existence check and all counts in a single round-trip
+        row = session.execute(
+            select(
+                # Count videos in project
+                select(func.count())
+                .select_from(ProjectVideo)
+                .where(ProjectVideo.project_id == Project.id)
+                .scalar_subquery().label('total_videos'),
+                # Count total questions in schema through question groups
+                select(func.count())
+                .select_from(Question)
+                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+                .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
+                .where(SchemaQuestionGroup.schema_id == Project.schema_id)
+                .scalar_subquery().label('total_questions'),
+                # Count annotator answers
+                select(func.count())
+                .select_from(AnnotatorAnswer)
+                .where(AnnotatorAnswer.project_id == Project.id)
+                .scalar_subquery().label('total_answers'),
+                # Count ground truth answers
+                select(func.count())
+                .select_from(ReviewerGroundTruth)
+                .where(ReviewerGroundTruth.project_id == Project.id)
+                .scalar_subquery().label('ground_truth_answers')
+            ).where(Project.id == project_id)
+        ).one_or_none()
+        if row is None:
             raise ValueError(f"Project with ID {project_id} not found")
         
-        # Get total videos in project
-        total_videos = session.scalar(
-            select(func.count())
-            .select_from(ProjectVideo)
-            .where(ProjectVideo.project_id == project_id)
-        )
-        
-        # Get total questions in schema through question groups
-        total_questions = session.scalar(
-            select(func.count())
-            .select_from(Question)
-            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-            .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
-            .where(SchemaQuestionGroup.schema_id == project.schema_id)
-        )
-        
-        # Get total annotator answers
-        total_answers = session.scalar(
-            select(func.count())
-            .select_from(AnnotatorAnswer)
-            .where(AnnotatorAnswer.project_id == project_id)
-        )
-        
-        # Get ground truth answers
-        ground_truth_answers = session.scalar(
-            select(func.count())
-            .select_from(ReviewerGroundTruth)
-            .where(ReviewerGroundTruth.project_id == project_id)
-        )
+        total_videos, total_questions, total_answers, ground_truth_answers = row
         
         # Calculate completion percentage
         total_possible_answers = total_videos * total_questions
@@ -1305,7 +1314,12 @@ class ProjectService:
         """
         # Verify input parameters
         ProjectService.verify_add_user_to_project(project_id, user_id, role, session)
-        
+        ProjectService._assign_user_roles(project_id, user_id, role, session, user_weight)
+        session.commit()
+    
+    @staticmethod
+    def _assign_user_roles(project_id: int, user_id: int, role: str, session: Session, user_weight: Optional[float] = None) -> None:
+        """Stage a verified role assignment without committing, so callers can batch many in one transaction."""
         # Archive any existing roles for this user in this project
         session.execute(
             update(ProjectUserRole)
@@ -1352,8 +1366,6 @@ class ProjectService:
             ensure_role("admin")
         else:
             raise ValueError(f"Invalid role: {role}")
-            
-        session.commit()
     
     @staticmethod
     def get_project_annotators(project_id: int, session: Session) -> Dict[str, Dict[str, Any]]:
@@ -1508,13 +1520,8 @@ class ProjectService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = session.scalar(count_query)
-        
-        # Apply pagination
-        query = query.offset(page * page_size).limit(page_size)
-        projects = session.scalars(query).all()
+        # Fetch the page and its total count in one query
+        projects, total_count = _fetch_page_with_total(session, query, page, page_size)
         
         # Process projects with enhanced data
         enhanced_projects = []
@@ -1585,21 +1592,26 @@ class SchemaService:
             - Rules: Schema rules JSON
             - Question Groups: List of question groups in schema
         """
-        schemas = session.scalars(select(Schema)).all()
+        schemas = session.execute(
+            select(Schema.id, Schema.name, Schema.instructions_url, Schema.has_custom_display, Schema.is_archived)
+        ).all()
+        
+        # Get question group titles for all schemas in one query
+        group_titles = {}
+        for schema_id, title in session.execute(
+            select(SchemaQuestionGroup.schema_id, QuestionGroup.title)
+            .join(QuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
+        ):
+            group_titles.setdefault(schema_id, []).append(title)
+        
         rows = []
         for s in schemas:
-            # Get question groups for this schema
-            groups = session.scalars(
-                select(QuestionGroup)
-                .join(SchemaQuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
-                .where(SchemaQuestionGroup.schema_id == s.id)
-            ).all()
-            
+            titles = group_titles.get(s.id)
             rows.append({
                 "ID": s.id,
                 "Name": s.name,
                 "Instructions URL": s.instructions_url,
-                "Question Groups": ", ".join(g.title for g in groups) if groups else "No groups",
+                "Question Groups": ", ".join(titles) if titles else "No groups",
                 "Has Custom Display": s.has_custom_display,
                 "Archived": s.is_archived
             })
@@ -1649,6 +1661,28 @@ class SchemaService:
             for q in questions
         ])
 
+    @staticmethod
+    def get_schema_question_types(schema_id: int, session: Session) -> Dict[str, str]:
+        """Get question text -> question type for every question in a schema.
+        
+        Lightweight alternative to get_schema_questions when only text and
+        type are needed.
+        
+        Args:
+            schema_id: The ID of the schema
+            session: Database session
+            
+        Returns:
+            Dictionary mapping question text to question type
+        """
+        rows = session.execute(
+            select(Question.text, Question.type)
+            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+            .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
+            .where(SchemaQuestionGroup.schema_id == schema_id)
+        ).all()
+        return dict(rows)
+
     @staticmethod
     def get_schema_questions_with_custom_display(schema_id: int, project_id: int, video_id: int, session: Session) -> pd.DataFrame:
         """Get all questions in a schema with custom display applied for a specific project-video combination.
@@ -1725,10 +1759,10 @@ class SchemaService:
         Raises:
             ValueError: If schema not found
         """
-        schema = session.scalar(select(Schema).where(Schema.name == name))
-        if not schema:
+        schema_id = session.scalar(select(Schema.id).where(Schema.name == name))
+        if schema_id is None:
             raise ValueError(f"Schema '{name}' not found")
-        return schema.id
+        return schema_id
     
     @staticmethod
     def get_schema_name_by_id(schema_id: int, session: Session) -> str:
@@ -1801,7 +1835,7 @@ class SchemaService:
             raise ValueError("Schema name is required")
 
         # Check if schema with same name exists
-        existing = session.scalar(select(Schema).where(Schema.name == name))
+        existing = session.scalar(select(exists().where(Schema.name == name)))
         if existing:
             raise ValueError(f"Schema with name '{name}' already exists")
 
@@ -1973,7 +2007,7 @@ class SchemaService:
             
             # Check for unique name (excluding current schema)
             existing = session.scalar(
-                select(Schema).where(Schema.name == name, Schema.id != schema_id)
+                select(exists().where(Schema.name == name, Schema.id != schema_id))
             )
             if existing:
                 raise ValueError(f"Schema with name '{name}' already exists")
@@ -2269,33 +2303,22 @@ class SchemaService:
         if not schema:
             raise ValueError(f"Schema with ID {schema_id} not found")
             
-        # Get all question groups in schema ordered by display_order
-        groups = session.scalars(
-            select(QuestionGroup)
+        # Get all question groups in schema with display order and question count in one query
+        groups = session.execute(
+            select(
+                QuestionGroup,
+                SchemaQuestionGroup.display_order,
+                func.count(QuestionGroupQuestion.question_id)
+            )
             .join(SchemaQuestionGroup, QuestionGroup.id == SchemaQuestionGroup.question_group_id)
+            .outerjoin(QuestionGroupQuestion, QuestionGroupQuestion.question_group_id == QuestionGroup.id)
             .where(SchemaQuestionGroup.schema_id == schema_id)
+            .group_by(QuestionGroup.id, SchemaQuestionGroup.display_order)
             .order_by(SchemaQuestionGroup.display_order)
         ).all()
         
-        # Get question counts for each group
         rows = []
-        for group in groups:
-            # Count questions in this group
-            question_count = session.scalar(
-                select(func.count())
-                .select_from(QuestionGroupQuestion)
-                .where(QuestionGroupQuestion.question_group_id == group.id)
-            )
-            
-            # Get display order
-            display_order = session.scalar(
-                select(SchemaQuestionGroup.display_order)
-                .where(
-                    SchemaQuestionGroup.schema_id == schema_id,
-                    SchemaQuestionGroup.question_group_id == group.id
-                )
-            )
-            
+        for group, display_order, question_count in groups:
             rows.append({
                 "ID": group.id,
                 "Title": group.title,
@@ -2346,15 +2369,18 @@ class SchemaService:
     @staticmethod
     def get_schema_counts(session: Session) -> Dict[str, int]:
         """Get schema counts without loading actual data."""
-        total_schemas = session.scalar(select(func.count(Schema.id)))
-        archived_schemas = session.scalar(select(func.count(Schema.id)).where(Schema.is_archived == True))
-        active_schemas = total_schemas - archived_schemas
-        schemas_with_custom_display = session.scalar(
-            select(func.count(Schema.id)).where(
-                Schema.has_custom_display == True,
-                Schema.is_archived == False
+        # All counts in one scan using filtered aggregates
+        total_schemas, archived_schemas, schemas_with_custom_display = session.execute(
+            select(
+                func.count(Schema.id),
+                func.count(Schema.id).filter(Schema.is_archived == True),
+                func.count(Schema.id).filter(
+                    Schema.has_custom_display == True,
+                    Schema.is_archived == False
+                )
             )
-        )
+        ).one()
+        active_schemas = total_schemas - archived_schemas
         
         return {
             "total": total_schemas,
@@ -2381,13 +2407,8 @@ class SchemaService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = session.scalar(count_query)
-        
-        # Apply pagination
-        query = query.offset(page * page_size).limit(page_size)
-        schemas = session.scalars(query).all()
+        # Fetch the page and its total count in one query
+        schemas, total_count = _fetch_page_with_total(session, query, page, page_size)
         
         # Process schemas
         schema_data = []
@@ -2448,7 +2469,13 @@ class QuestionService:
             - Default: Default option for single-choice questions
             - Archived: Whether the question is archived
         """
-        qs = session.scalars(select(Question)).all()
+        # Only the columns shown in the table; skips option_weights/display_values and ORM hydration
+        qs = session.execute(
+            select(
+                Question.id, Question.text, Question.display_text, Question.type,
+                Question.options, Question.default_option, Question.is_archived
+            )
+        ).all()
         return pd.DataFrame([
             {
                 "ID": q.id, 
@@ -2561,7 +2588,7 @@ class QuestionService:
             ValueError: If validation fails
         """
         # Check if question text already exists
-        existing = session.scalar(select(Question).where(Question.text == text))
+        existing = session.scalar(select(exists().where(Question.text == text)))
         if existing:
             raise ValueError(f"Question with text '{text}' already exists")
         
@@ -2775,10 +2802,12 @@ class QuestionService:
         Raises:
             ValueError: If question not found
         """
-        q = session.get(Question, question_id)
-        if not q:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(Question).where(Question.id == question_id).values(is_archived=True).returning(Question.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Question with ID {question_id} not found")
-        q.is_archived = True
         session.commit()
 
     @staticmethod
@@ -2792,10 +2821,12 @@ class QuestionService:
         Raises:
             ValueError: If question not found
         """
-        q = session.get(Question, question_id)
-        if not q:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(Question).where(Question.id == question_id).values(is_archived=False).returning(Question.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Question with ID {question_id} not found")
-        q.is_archived = False
         session.commit()
 
     @staticmethod
@@ -2812,7 +2843,14 @@ class QuestionService:
         Raises:
             ValueError: If question not found
         """
-        question = session.scalar(select(Question).where(Question.text == text))
+        # Plain column row; no ORM instance needed to build the dict
+        question = session.execute(
+            select(
+                Question.id, Question.text, Question.display_text, Question.type,
+                Question.options, Question.display_values, Question.default_option,
+                Question.option_weights, Question.created_at, Question.is_archived
+            ).where(Question.text == text)
+        ).first()
         if not question:
             raise ValueError(f"Question with text '{text}' not found")
         
@@ -2829,6 +2867,25 @@ class QuestionService:
             "archived": question.is_archived
         }
 
+    @staticmethod
+    def get_question_types_by_texts(texts: List[str], session: Session) -> Dict[str, str]:
+        """Get question text -> question type for many questions in one query.
+        
+        Args:
+            texts: Question texts to look up
+            session: Database session
+            
+        Returns:
+            Dictionary mapping question text to question type; texts that do
+            not exist are left out
+        """
+        if not texts:
+            return {}
+        rows = session.execute(
+            select(Question.text, Question.type).where(Question.text.in_(texts))
+        ).all()
+        return dict(rows)
+
     @staticmethod
     def get_question_by_text_with_custom_display(text: str, project_id: int, video_id: int, session: Session) -> Dict[str, Any]:
         """Get a question by its text with custom display applied for a specific project-video combination.
@@ -2996,11 +3053,16 @@ class QuestionService:
     @staticmethod
     def get_question_counts(session: Session) -> Dict[str, int]:
         """Get question counts without loading actual data."""
-        total_questions = session.scalar(select(func.count(Question.id)))
-        archived_questions = session.scalar(select(func.count(Question.id)).where(Question.is_archived == True))
+        # All counts in one scan using filtered aggregates
+        total_questions, archived_questions, single_choice, description_type = session.execute(
+            select(
+                func.count(Question.id),
+                func.count(Question.id).filter(Question.is_archived == True),
+                func.count(Question.id).filter(Question.type == "single", Question.is_archived == False),
+                func.count(Question.id).filter(Question.type == "description", Question.is_archived == False)
+            )
+        ).one()
         active_questions = total_questions - archived_questions
-        single_choice = session.scalar(select(func.count(Question.id)).where(Question.type == "single", Question.is_archived == False))
-        description_type = session.scalar(select(func.count(Question.id)).where(Question.type == "description", Question.is_archived == False))
         
         return {
             "total": total_questions,
@@ -3031,13 +3093,8 @@ class QuestionService:
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = session.scalar(count_query)
-        
-        # Apply pagination
-        query = query.offset(page * page_size).limit(page_size)
-        questions = session.scalars(query).all()
+        # Fetch the page and its total count in one query
+        questions, total_count = _fetch_page_with_total(session, query, page, page_size)
         
         # Process questions
         question_data = []
@@ -3159,18 +3216,20 @@ class CustomDisplayService:
         if question_dict["archived"]:
             raise ValueError(f"Question {question_id} is archived")
         
-        reusable_group_count = session.scalar(
-            select(func.count())
-            .select_from(QuestionGroup)
-            .join(QuestionGroupQuestion, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
-            .where(
-                QuestionGroupQuestion.question_id == question_id,
-                QuestionGroup.is_reusable == True,
-                QuestionGroup.is_archived == False
+        in_reusable_group = session.scalar(
+            select(
+                select(QuestionGroup.id)
+                .join(QuestionGroupQuestion, QuestionGroup.id == QuestionGroupQuestion.question_group_id)
+                .where(
+                    QuestionGroupQuestion.question_id == question_id,
+                    QuestionGroup.is_reusable == True,
+                    QuestionGroup.is_archived == False
+                )
+                .exists()
             )
         )
 
-        if reusable_group_count > 0:
+        if in_reusable_group:
             # Get the reusable group names for a better error message
             reusable_groups = session.scalars(
                 select(QuestionGroup.title)
@@ -3358,17 +3417,19 @@ class CustomDisplayService:
         Returns:
             True if overrides were removed, False if none existed
         """
-        custom_display = session.get(
-            ProjectVideoQuestionDisplay,
-            (project_id, video_id, question_id)
+        # The DELETE's rowcount tells us whether an override existed; no lookup first
+        result = session.execute(
+            delete(ProjectVideoQuestionDisplay).where(
+                ProjectVideoQuestionDisplay.project_id == project_id,
+                ProjectVideoQuestionDisplay.video_id == video_id,
+                ProjectVideoQuestionDisplay.question_id == question_id
+            )
         )
+        if result.rowcount == 0:
+            return False
         
-        if custom_display:
-            session.delete(custom_display)
-            session.commit()
-            return True
-        
-        return False
+        session.commit()
+        return True
 
     @staticmethod
     def get_all_custom_displays_for_video(
@@ -3386,8 +3447,10 @@ class CustomDisplayService:
         Returns:
             List of dictionaries with custom display information
         """
-        overrides = session.scalars(
-            select(ProjectVideoQuestionDisplay)
+        # Join the question text in instead of looking it up per override
+        overrides = session.execute(
+            select(ProjectVideoQuestionDisplay, Question.text)
+            .join(Question, ProjectVideoQuestionDisplay.question_id == Question.id)
             .where(
                 ProjectVideoQuestionDisplay.project_id == project_id,
                 ProjectVideoQuestionDisplay.video_id == video_id
@@ -3395,11 +3458,10 @@ class CustomDisplayService:
         ).all()
         
         result = []
-        for override in overrides:
-            question_dict = QuestionService.get_question_by_id(question_id=override.question_id, session=session)
+        for override, question_text in overrides:
             result.append({
                 "question_id": override.question_id,
-                "question_text": question_dict["text"],
+                "question_text": question_text,
                 "has_custom_text": override.custom_display_text is not None,
                 "has_custom_options": override.custom_option_display_map is not None,
                 "custom_display_text": override.custom_display_text,
@@ -3431,22 +3493,22 @@ class CustomDisplayService:
         if not schema or not schema.has_custom_display:
             return []
         
-        overrides = session.scalars(
-            select(ProjectVideoQuestionDisplay)
+        # Join video uids and question texts in instead of two lookups per override
+        overrides = session.execute(
+            select(ProjectVideoQuestionDisplay, Video.video_uid, Question.text)
+            .join(Question, ProjectVideoQuestionDisplay.question_id == Question.id)
+            .outerjoin(Video, ProjectVideoQuestionDisplay.video_id == Video.id)
             .where(ProjectVideoQuestionDisplay.project_id == project_id)
         ).all()
         
         result = []
-        for override in overrides:
-            video = session.get(Video, override.video_id)
-            question_dict = QuestionService.get_question_by_id(question_id=override.question_id, session=session)
-            
+        for override, video_uid, question_text in overrides:
             result.append({
                 "project_id": override.project_id,
                 "video_id": override.video_id,
-                "video_uid": video.video_uid if video else None,
+                "video_uid": video_uid,
                 "question_id": override.question_id,
-                "question_text": question_dict["text"],
+                "question_text": question_text,
                 "custom_display_text": override.custom_display_text,
                 "custom_option_display_map": override.custom_option_display_map,
                 "created_at": override.created_at,
@@ -3609,7 +3671,9 @@ class AuthService:
     @staticmethod
     def get_all_users(session: Session) -> pd.DataFrame:
         """Get all users in a DataFrame format."""
-        users = session.scalars(select(User)).all()
+        users = session.execute(
+            select(User.id, User.user_id_str, User.email, User.password_hash, User.user_type, User.is_archived, User.created_at)
+        ).all()
         return pd.DataFrame([
             {
                 "ID": u.id,
@@ -3646,15 +3710,15 @@ class AuthService:
     @staticmethod
     def verify_update_user_id(user_id: int, new_user_id: str, session: Session) -> None:
         """Verify parameters for updating a user's ID."""
-        user = session.get(User, user_id)
-        if not user:
+        # Fetch the user and any holder of the new ID in one round-trip
+        users = session.scalars(
+            select(User).where(or_(User.id == user_id, User.user_id_str == new_user_id))
+        ).all()
+        if not any(u.id == user_id for u in users):
             raise ValueError(f"User with ID {user_id} not found")
         
         # Check if new user ID already exists
-        existing = session.scalar(
-            select(User).where(User.user_id_str == new_user_id)
-        )
-        if existing and existing.id != user_id:
+        if any(u.id != user_id for u in users):
             raise ValueError(f"User ID '{new_user_id}' already exists")
         
         
@@ -3670,7 +3734,11 @@ class AuthService:
     @staticmethod
     def verify_update_user_email(user_id: int, new_email: str, session: Session) -> None:
         """Verify parameters for updating a user's email."""
-        user = session.get(User, user_id)
+        # Fetch the user and any holder of the new email in one round-trip
+        users = session.scalars(
+            select(User).where(or_(User.id == user_id, User.email == new_email))
+        ).all()
+        user = next((u for u in users if u.id == user_id), None)
         if not user:
             raise ValueError(f"User with ID {user_id} not found")
         
@@ -3683,10 +3751,7 @@ class AuthService:
             raise ValueError("Email is required for human and admin users")
         
         # Check if new email already exists
-        existing = session.scalar(
-            select(User).where(User.email == new_email)
-        )
-        if existing and existing.id != user_id:
+        if any(u.id != user_id for u in users):
             raise ValueError(f"Email '{new_email}' already exists")
 
     @staticmethod
@@ -3755,20 +3820,16 @@ class AuthService:
         # If changing to admin role, assign to all projects
         if new_role == "admin" and user.user_type != "admin":
             user.user_type = new_role
-            session.commit()
             # Get all non-archived projects
             projects = session.scalars(
                 select(Project).where(Project.is_archived == False)
             ).all()
             
-            # Assign user as admin to each project using KEYWORD ARGUMENTS
+            # Assign user as admin to each project, committing once for all of them
             for project in projects:
-                ProjectService.add_user_to_project(
-                    project_id=project.id, 
-                    user_id=user_id, 
-                    role="admin", 
-                    session=session
-                )
+                ProjectService.verify_add_user_to_project(project.id, user_id, "admin", session)
+                ProjectService._assign_user_roles(project.id, user_id, "admin", session)
+            session.commit()
         else:
             user.user_type = new_role
             session.commit()
@@ -3805,10 +3866,12 @@ class AuthService:
     @staticmethod
     def toggle_user_archived(user_id: int, session: Session) -> None:
         """Toggle a user's archived status."""
-        user = session.get(User, user_id)
-        if not user:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(User).where(User.id == user_id).values(is_archived=not_(User.is_archived)).returning(User.id)
+        )
+        if updated_id is None:
             raise ValueError(f"User with ID {user_id} not found")
-        user.is_archived = not user.is_archived
         session.commit()
 
     @staticmethod
@@ -3838,7 +3901,7 @@ class AuthService:
         
         result = session.execute(query).all()
         
-        return pd.DataFrame([
+        return _compact_frame(pd.DataFrame([
             {
                 "Project ID": row.project_id,
                 "Project Name": row.project_name,
@@ -3851,7 +3914,7 @@ class AuthService:
                 "User Weight": row.user_weight
             }
             for row in result
-        ])
+        ]), id_columns=["Project ID", "User ID"], category_columns=["Role"])
 
     @staticmethod
     def verify_create_user(user_id: str, email: str, password_hash: str, user_type: str, session: Session, is_archived: bool = False) -> None:
@@ -4053,8 +4116,13 @@ class AuthService:
     #     session.commit()
 
     @staticmethod
-    def verify_remove_user_from_project(user_id: int, project_id: int, role: str, session: Session) -> None:
-        """Verify that a user can be removed from a project for a specific role."""
+    def verify_remove_user_from_project(user_id: int, project_id: int, role: str, session: Session,
+                                        active_roles: Optional[set] = None) -> None:
+        """Verify that a user can be removed from a project for a specific role.
+        
+        active_roles optionally supplies the user's prefetched non-archived roles in
+        the project, so bulk callers avoid one query per pair.
+        """
         # Validate user exists and isn't archived
         user = session.get(User, user_id)
         if not user:
@@ -4087,16 +4155,19 @@ class AuthService:
             roles_to_check = ["model"]
         
         # Check if user has any active assignments at the requested level or above
-        active_assignments = session.scalars(
-            select(ProjectUserRole).where(
-                ProjectUserRole.user_id == user_id,
-                ProjectUserRole.project_id == project_id,
-                ProjectUserRole.role.in_(roles_to_check),
-                ProjectUserRole.is_archived == False
+        if active_roles is not None:
+            has_active_assignment = any(r in active_roles for r in roles_to_check)
+        else:
+            has_active_assignment = session.scalar(
+                select(exists().where(
+                    ProjectUserRole.user_id == user_id,
+                    ProjectUserRole.project_id == project_id,
+                    ProjectUserRole.role.in_(roles_to_check),
+                    ProjectUserRole.is_archived == False
+                ))
             )
-        ).all()
         
-        if not active_assignments:
+        if not has_active_assignment:
             raise ValueError(f"No active assignments found for user '{user.user_id_str}' in project '{project.name}' at role level '{role}' or above")
         
     @staticmethod
@@ -4173,24 +4244,22 @@ class AuthService:
         if user.user_type == "admin":
             raise ValueError(f"Cannot remove admin user {user_id} from any project role")
         
-        # Get all active role assignments for this user in this project
-        assignments = session.scalars(
-            select(ProjectUserRole).where(
+        # Archive all active role assignments in one UPDATE; its rowcount is the result
+        removed = session.execute(
+            update(ProjectUserRole)
+            .where(
                 ProjectUserRole.user_id == user_id,
                 ProjectUserRole.project_id == project_id,
                 ProjectUserRole.is_archived == False
             )
-        ).all()
+            .values(is_archived=True)
+        ).rowcount
         
-        if not assignments:
+        if not removed:
             return 0
         
-        # Archive all role assignments
-        for assignment in assignments:
-            assignment.is_archived = True
-        
         session.commit()
-        return len(assignments)
+        return removed
 
     
 
@@ -4209,6 +4278,10 @@ class AuthService:
         """
         failures = []
         
+        # Load every user and project once so the per-pair session.get calls hit the identity map
+        session.scalars(select(User).where(User.id.in_(user_ids))).all()
+        session.scalars(select(Project).where(Project.id.in_(project_ids))).all()
+        
         for user_id in user_ids:
             for project_id in project_ids:
                 try:
@@ -4248,12 +4321,13 @@ class AuthService:
         # First verify all assignments would succeed
         AuthService.verify_bulk_assign_users_to_projects(user_ids, project_ids, role, session)
         
-        # If verification passes, do all assignments
+        # If verification passes, do all assignments in one transaction
         assignment_count = 0
         for user_id in user_ids:
             for project_id in project_ids:
-                ProjectService.add_user_to_project(project_id, user_id, role, session, user_weight)  # Updated call
+                ProjectService._assign_user_roles(project_id, user_id, role, session, user_weight)
                 assignment_count += 1
+        session.commit()
         
         return assignment_count
 
@@ -4271,11 +4345,29 @@ class AuthService:
             ValueError: If any removal would fail, with details about all failures
         """
         failures = []
+        
+        # Load every user and project once so the per-pair session.get calls hit the identity map
+        session.scalars(select(User).where(User.id.in_(user_ids))).all()
+        session.scalars(select(Project).where(Project.id.in_(project_ids))).all()
+        
+        # Fetch the active roles of every (user, project) pair in one query
+        active_roles = {}
+        for pair_user_id, pair_project_id, pair_role in session.execute(
+            select(ProjectUserRole.user_id, ProjectUserRole.project_id, ProjectUserRole.role).where(
+                ProjectUserRole.user_id.in_(user_ids),
+                ProjectUserRole.project_id.in_(project_ids),
+                ProjectUserRole.is_archived == False
+            )
+        ):
+            active_roles.setdefault((pair_user_id, pair_project_id), set()).add(pair_role)
     
         for user_id in user_ids:
             for project_id in project_ids:
                 try:
-                    AuthService.verify_remove_user_from_project(user_id, project_id, role, session)
+                    AuthService.verify_remove_user_from_project(
+                        user_id, project_id, role, session,
+                        active_roles=active_roles.get((user_id, project_id), set())
+                    )
                 except ValueError as e:
                     # Get user and project names for better error messages
                     try:
@@ -4431,30 +4523,19 @@ class AuthService:
     @staticmethod
     def get_assignment_counts(session: Session) -> Dict[str, int]:
         """Get assignment counts without loading actual data."""
-        # Count total assignment records (use a different field since ProjectUserRole has no id)
-        total_assignments = session.scalar(
-            select(func.count()).select_from(ProjectUserRole)
-        )
-        
-        active_assignments = session.scalar(
-            select(func.count()).select_from(ProjectUserRole)
-            .where(ProjectUserRole.is_archived == False)
-        )
+        # All assignment counts in one pass over ProjectUserRole
+        active = ProjectUserRole.is_archived == False
+        total_assignments, active_assignments, unique_users, unique_projects = session.execute(
+            select(
+                func.count(),
+                func.count().filter(active),
+                func.count(func.distinct(ProjectUserRole.user_id)).filter(active),
+                func.count(func.distinct(ProjectUserRole.project_id)).filter(active)
+            ).select_from(ProjectUserRole)
+        ).one()
         
         archived_assignments = total_assignments - active_assignments
         
-        # Count unique users with assignments
-        unique_users = session.scalar(
-            select(func.count(func.distinct(ProjectUserRole.user_id)))
-            .where(ProjectUserRole.is_archived == False)
-        )
-        
-        # Count unique projects with assignments
-        unique_projects = session.scalar(
-            select(func.count(func.distinct(ProjectUserRole.project_id)))
-            .where(ProjectUserRole.is_archived == False)
-        )
-        
         return {
             "total_assignments": total_assignments,
             "active_assignments": active_assignments,
@@ -4466,28 +4547,20 @@ class AuthService:
     @staticmethod
     def get_user_counts(session: Session) -> Dict[str, int]:
         """Get count statistics for users."""
-        from sqlalchemy import func, select
+        # One grouped query; totals are derived from the breakdown
+        counts = session.execute(
+            select(User.user_type, User.is_archived, func.count())
+            .group_by(User.user_type, User.is_archived)
+        ).all()
         
-        total_users = session.scalar(select(func.count()).select_from(User))
-        archived_users = session.scalar(
-            select(func.count()).select_from(User)
-            .where(User.is_archived == True)
-        )
+        total_users = sum(c for _, _, c in counts)
+        archived_users = sum(c for _, is_archived, c in counts if is_archived)
         active_users = total_users - archived_users
         
         # Count by role
-        admin_users = session.scalar(
-            select(func.count()).select_from(User)
-            .where(User.user_type == 'admin')
-        )
-        human_users = session.scalar(
-            select(func.count()).select_from(User)
-            .where(User.user_type == 'human')
-        )
-        model_users = session.scalar(
-            select(func.count()).select_from(User)
-            .where(User.user_type == 'model')
-        )
+        admin_users = sum(c for user_type, _, c in counts if user_type == 'admin')
+        human_users = sum(c for user_type, _, c in counts if user_type == 'human')
+        model_users = sum(c for user_type, _, c in counts if user_type == 'model')
         
         return {
             "total": total_users,
@@ -4816,8 +4889,11 @@ class QuestionGroupService:
         if not group:
             raise ValueError(f"Question group with ID {group_id} not found")
         
-        questions = session.scalars(
-            select(Question)
+        questions = session.execute(
+            select(
+                Question.id, Question.text, Question.display_text, Question.type,
+                Question.options, Question.default_option, Question.is_archived
+            )
             .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
             .where(QuestionGroupQuestion.question_group_id == group_id)
         ).all()
@@ -5003,9 +5079,9 @@ class QuestionGroupService:
 
         # Check if title already exists
         existing = session.scalar(
-            select(QuestionGroup).where(
+            select(exists().where(
                 QuestionGroup.title == title
-            )
+            ))
         )
         if existing:
             raise ValueError(f"Question group with title '{title}' already exists")
@@ -5030,7 +5106,7 @@ class QuestionGroupService:
 
         # Validate all questions exist and aren't archived
         for question_id in question_ids:
-            question = session.scalar(select(Question).where(Question.id == question_id))
+            question = session.get(Question, question_id)
             if not question:
                 raise ValueError(f"Question with ID {question_id} not found")
             if question.is_archived:
@@ -5043,7 +5119,7 @@ class QuestionGroupService:
         # If auto submit is TRUE, check that all questions have a default option
         if is_auto_submit:
             for question_id in question_ids:
-                question = session.scalar(select(Question).where(Question.id == question_id))
+                question = session.get(Question, question_id)
                 if question.default_option is None:
                     raise ValueError(f"Question with ID {question_id} does not have a default option")
 
@@ -5246,7 +5322,7 @@ class QuestionGroupService:
         # Check if new title conflicts with existing group
         if new_display_title != group.display_title:
             existing = session.scalar(
-                select(QuestionGroup).where(QuestionGroup.display_title == new_display_title)
+                select(exists().where(QuestionGroup.display_title == new_display_title))
             )
             if existing:
                 raise ValueError(f"Question group with display title '{new_display_title}' already exists")
@@ -5331,19 +5407,22 @@ class QuestionGroupService:
         Raises:
             ValueError: If group not found
         """
-        group = session.get(QuestionGroup, group_id)
-        if not group:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(QuestionGroup).where(QuestionGroup.id == group_id).values(is_archived=True).returning(QuestionGroup.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Question group with ID {group_id} not found")
         
-        group.is_archived = True
         # Also archive all questions in this group
-        questions = session.scalars(
-            select(Question)
-            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-            .where(QuestionGroupQuestion.question_group_id == group_id)
-        ).all()
-        for q in questions:
-            q.is_archived = True
+        session.execute(
+            update(Question)
+            .where(Question.id.in_(
+                select(QuestionGroupQuestion.question_id)
+                .where(QuestionGroupQuestion.question_group_id == group_id)
+            ))
+            .values(is_archived=True)
+        )
         session.commit()
 
     @staticmethod
@@ -5357,11 +5436,12 @@ class QuestionGroupService:
         Raises:
             ValueError: If group not found
         """
-        group = session.get(QuestionGroup, group_id)
-        if not group:
+        # RETURNING tells us whether the row existed without a separate SELECT
+        updated_id = session.scalar(
+            update(QuestionGroup).where(QuestionGroup.id == group_id).values(is_archived=False).returning(QuestionGroup.id)
+        )
+        if updated_id is None:
             raise ValueError(f"Question group with ID {group_id} not found")
-        
-        group.is_archived = False
         session.commit()
 
     @staticmethod
@@ -5926,18 +6006,16 @@ class AnnotatorService(BaseAnswerService):
             
             # Get all answers for these questions
             question_ids = [q.id for q in questions]
-            answers = session.scalars(
-                select(AnnotatorAnswer)
+            # Answer dict by question_id, built straight from the two columns
+            answers_by_question_id = dict(session.execute(
+                select(AnnotatorAnswer.question_id, AnnotatorAnswer.answer_value)
                 .where(
                     AnnotatorAnswer.video_id == video_id,
                     AnnotatorAnswer.project_id == project_id,
                     AnnotatorAnswer.user_id == user_id,
                     AnnotatorAnswer.question_id.in_(question_ids)
                 )
-            ).all()
-            
-            # Build answer dict by question_id
-            answers_by_question_id = {answer.question_id: answer.answer_value for answer in answers}
+            ).all())
             
             # Organize by group
             result = {}
@@ -6234,7 +6312,7 @@ class AnnotatorService(BaseAnswerService):
             )
         ).all()
         
-        return pd.DataFrame([
+        return _compact_frame(pd.DataFrame([
             {
                 "Video ID": a.video_id,
                 "User ID": a.user_id,
@@ -6245,7 +6323,7 @@ class AnnotatorService(BaseAnswerService):
                 "Notes": a.notes
             }
             for a in answers
-        ])
+        ]), id_columns=["Video ID", "User ID"], category_columns=["Answer Value"])
     
     @staticmethod
     def get_user_answers_for_question_group(video_id: int, project_id: int, user_id: int, question_group_id: int, session: Session) -> Dict[str, str]:
@@ -6295,20 +6373,20 @@ class AnnotatorService(BaseAnswerService):
         Returns:
             True if user has submitted answers, False otherwise
         """
-        answer_count = session.scalar(
-            select(func.count())
-            .select_from(AnnotatorAnswer)
-            .join(Question, AnnotatorAnswer.question_id == Question.id)
-            .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
-            .where(
-                AnnotatorAnswer.video_id == video_id,
-                AnnotatorAnswer.project_id == project_id,
-                AnnotatorAnswer.user_id == user_id,
-                QuestionGroupQuestion.question_group_id == question_group_id
+        return session.scalar(
+            select(
+                select(AnnotatorAnswer.id)
+                .join(Question, AnnotatorAnswer.question_id == Question.id)
+                .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
+                .where(
+                    AnnotatorAnswer.video_id == video_id,
+                    AnnotatorAnswer.project_id == project_id,
+                    AnnotatorAnswer.user_id == user_id,
+                    QuestionGroupQuestion.question_group_id == question_group_id
+                )
+                .exists()
             )
         )
-        
-        return answer_count > 0
     
     @staticmethod
     def calculate_user_overall_progress(user_id: int, project_id: int, session: Session) -> float:
@@ -6674,15 +6752,13 @@ class GroundTruthService(BaseAnswerService):
                 
                 if is_training:
                     # Get ALL ground truth for training mode
-                    all_gt = session.scalars(
-                        select(ReviewerGroundTruth)
+                    gt_by_question_id = dict(session.execute(
+                        select(ReviewerGroundTruth.question_id, ReviewerGroundTruth.answer_value)
                         .where(
                             ReviewerGroundTruth.video_id == video_id,
                             ReviewerGroundTruth.project_id == project_id
                         )
-                    ).all()
-                    
-                    gt_by_question_id = {gt.question_id: gt.answer_value for gt in all_gt}
+                    ).all())
                     
                     # Organize by group
                     for group_id, group_questions in questions_by_group.items():
@@ -6745,19 +6821,17 @@ class GroundTruthService(BaseAnswerService):
                                 reviewer_ids = {review.reviewer_id for review in reviews if review.reviewer_id}
                                 user_info_map = {}
                                 if reviewer_ids:
-                                    users = session.scalars(
-                                        select(User).where(User.id.in_(reviewer_ids))
-                                    ).all()
-                                    user_info_map = {user.id: user.user_id_str for user in users}
+                                    user_info_map = dict(session.execute(
+                                        select(User.id, User.user_id_str).where(User.id.in_(reviewer_ids))
+                                    ).all())
                                 
                                 # Get all annotator user info for answer owners
                                 annotator_ids = desc_answers["User ID"].unique().tolist()
                                 annotator_info_map = {}
                                 if annotator_ids:
-                                    annotators = session.scalars(
-                                        select(User).where(User.id.in_(annotator_ids))
-                                    ).all()
-                                    annotator_info_map = {user.id: user.user_id_str for user in annotators}
+                                    annotator_info_map = dict(session.execute(
+                                        select(User.id, User.user_id_str).where(User.id.in_(annotator_ids))
+                                    ).all())
                                 
                                 # Organize by group and question
                                 for question in description_questions:
@@ -6843,8 +6917,8 @@ class GroundTruthService(BaseAnswerService):
                 gt_dict[question_id] = gt.answer_value
             
             # Get all questions for this project to check completion
-            questions = session.scalars(
-                select(Question)
+            project_question_ids = set(session.scalars(
+                select(Question.id)
                 .join(QuestionGroupQuestion, Question.id == QuestionGroupQuestion.question_id)
                 .join(SchemaQuestionGroup, QuestionGroupQuestion.question_group_id == SchemaQuestionGroup.question_group_id)
                 .join(Project, SchemaQuestionGroup.schema_id == Project.schema_id)
@@ -6852,9 +6926,7 @@ class GroundTruthService(BaseAnswerService):
                     Project.id == project_id,
                     Question.is_archived == False
                 )
-            ).all()
-            
-            project_question_ids = {q.id for q in questions}
+            ))
             
             # Check admin modifications for all questions at once
             admin_modifications = {}
@@ -6871,10 +6943,9 @@ class GroundTruthService(BaseAnswerService):
             
             user_info = {}
             if all_user_ids:
-                users = session.scalars(
-                    select(User).where(User.id.in_(all_user_ids))
-                ).all()
-                user_info = {user.id: user.user_id_str for user in users}
+                user_info = dict(session.execute(
+                    select(User.id, User.user_id_str).where(User.id.in_(all_user_ids))
+                ).all())
             
             # Build GT status strings
             gt_status_by_question = {}
@@ -6945,17 +7016,15 @@ class GroundTruthService(BaseAnswerService):
             
             # Get ground truth for all questions at once
             question_ids = [q.id for q in questions]
-            ground_truths = session.scalars(
-                select(ReviewerGroundTruth)
+            # GT dict by question, built straight from the two columns
+            gt_dict = dict(session.execute(
+                select(ReviewerGroundTruth.question_id, ReviewerGroundTruth.answer_value)
                 .where(
                     ReviewerGroundTruth.video_id == video_id,
                     ReviewerGroundTruth.project_id == project_id,
                     ReviewerGroundTruth.question_id.in_(question_ids)
                 )
-            ).all()
-            
-            # Build GT dict by question
-            gt_dict = {gt.question_id: gt.answer_value for gt in ground_truths}
+            ).all())
             
             # Organize by group
             result = {}
@@ -7220,20 +7289,19 @@ class GroundTruthService(BaseAnswerService):
     def check_ground_truth_exists_for_question(video_id: int, project_id: int, question_id: int, session: Session) -> bool:
         """Check if ground truth exists for a single question (most efficient for existence checks)."""
         return session.scalar(
-            select(func.count(ReviewerGroundTruth.question_id))
-            .where(
+            select(exists().where(
                 ReviewerGroundTruth.video_id == video_id,
                 ReviewerGroundTruth.project_id == project_id,
                 ReviewerGroundTruth.question_id == question_id
-            )
-        ) > 0
+            ))
+        )
 
     # @staticmethod
     # TODO: See if we want to use this instead
     # def check_question_modified_by_admin_optimized(video_id: int, project_id: int, question_id: int, session: Session) -> bool:
     #     """Optimized version that doesn't fetch full ground truth data."""
     #     return session.scalar(
-    #         select(func.count(ReviewerGroundTruth.question_id))
+    #         select(func.count())
     #         .where(
     #             ReviewerGroundTruth.video_id == video_id,
     #             ReviewerGroundTruth.project_id == project_id,
@@ -7256,25 +7324,32 @@ class GroundTruthService(BaseAnswerService):
             True if all questions in the group have ground truth, False otherwise
         """
         try:
-            # Get all questions in the group
-            questions = QuestionService.get_questions_by_group_id(group_id=question_group_id, session=session)
-            if not questions:
-                return False
-            
-            question_ids = [q["id"] for q in questions]
-            
-            # Count how many of these questions have ground truth
-            gt_count = session.scalar(
-                select(func.count(ReviewerGroundTruth.question_id))
-                .where(
-                    ReviewerGroundTruth.video_id == video_id,
-                    ReviewerGroundTruth.project_id == project_id,
-                    ReviewerGroundTruth.question_id.in_(question_ids)
+            # Count the group's questions and how many of them have ground truth in
+            # one round-trip, without loading the question rows
+            group_question_ids = (
+                select(QuestionGroupQuestion.question_id)
+                .join(Question, Question.id == QuestionGroupQuestion.question_id)
+                .where(QuestionGroupQuestion.question_group_id == question_group_id)
+            )
+            total_questions, gt_count = session.execute(
+                select(
+                    select(func.count())
+                    .select_from(group_question_ids.subquery())
+                    .scalar_subquery(),
+                    select(func.count())
+                    .where(
+                        ReviewerGroundTruth.video_id == video_id,
+                        ReviewerGroundTruth.project_id == project_id,
+                        ReviewerGroundTruth.question_id.in_(group_question_ids)
+                    )
+                    .scalar_subquery()
                 )
-            )
+            ).one()
+            if not total_questions:
+                return False
             
             # Return True if all questions have ground truth
-            return gt_count == len(question_ids)
+            return gt_count == total_questions
             
         except Exception as e:
             print(f"Error in check_all_questions_have_ground_truth_for_group: {e}")
@@ -7838,8 +7913,7 @@ class GroundTruthService(BaseAnswerService):
             
             if admin_user_ids:
                 users_query = select(User.id, User.user_id_str).where(User.id.in_(admin_user_ids))
-                user_results = session.execute(users_query).all()
-                admin_users = {r.id: r.user_id_str for r in user_results}
+                admin_users = dict(session.execute(users_query).all())
             
             # Build result dictionary
             for result in results:
@@ -8435,12 +8509,10 @@ class GroundTruthService(BaseAnswerService):
                 progress_callback(1, 4, "Loading project data...")
             
             # Get all project info in batch
-            projects = session.execute(
+            project_map = dict(session.execute(
                 select(Project.id, Project.name)
                 .where(Project.id.in_(project_ids))
-            ).all()
-            
-            project_map = {p.id: p.name for p in projects}
+            ).all())
             
             if progress_callback:
                 progress_callback(2, 4, "Loading project videos and questions...")
@@ -8653,7 +8725,7 @@ class ProjectGroupService:
     def verify_create_project_group(name: str, description: str, project_ids: list[int] | None, session: Session) -> ProjectGroup:
         """Verify create project group with optional list of project IDs, enforcing uniqueness constraints."""
         # Check for unique name
-        existing = session.scalar(select(ProjectGroup).where(ProjectGroup.name == name))
+        existing = session.scalar(select(exists().where(ProjectGroup.name == name)))
         if existing:
             raise ValueError(f"Project group with name '{name}' already exists")
 
@@ -8683,22 +8755,26 @@ class ProjectGroupService:
     @staticmethod
     def verify_edit_project_group(group_id: int, name: str | None, description: str | None, add_project_ids: list[int] | None, remove_project_ids: list[int] | None, session: Session) -> ProjectGroup:
         """Verify edit project group with optional list of project IDs, enforcing uniqueness constraints when adding."""
-        group = session.get(ProjectGroup, group_id)
+        # Fetch the group and any group already using the new name in one round-trip
+        condition = ProjectGroup.id == group_id
+        if name:
+            condition = or_(condition, ProjectGroup.name == name)
+        groups = session.scalars(select(ProjectGroup).where(condition)).all()
+        group = next((g for g in groups if g.id == group_id), None)
         if not group:
             raise ValueError(f"Project group with ID {group_id} not found")
         if name:
             # Check for unique name
-            existing = session.scalar(select(ProjectGroup).where(ProjectGroup.name == name, ProjectGroup.id != group_id))
-            if existing and existing.id != group_id:
+            if any(g.id != group_id for g in groups):
                 raise ValueError(f"Project group with name '{name}' already exists")
         if add_project_ids:
             # Get current project IDs
-            current_ids = set(row.project_id for row in session.scalars(select(ProjectGroupProject).where(ProjectGroupProject.project_group_id == group_id)).all())
+            current_ids = set(session.scalars(select(ProjectGroupProject.project_id).where(ProjectGroupProject.project_group_id == group_id)))
             new_ids = set(add_project_ids)
             all_ids = list(current_ids | new_ids)
             ProjectGroupService._validate_project_group_uniqueness(project_ids=all_ids, session=session)
         if remove_project_ids:
-            current_ids = set(row.project_id for row in session.scalars(select(ProjectGroupProject).where(ProjectGroupProject.project_group_id == group_id)).all())
+            current_ids = set(session.scalars(select(ProjectGroupProject.project_id).where(ProjectGroupProject.project_group_id == group_id)))
             for pid in remove_project_ids:
                 if pid not in current_ids:
                     raise ValueError(f"Project with ID {pid} not found in group")
@@ -8715,18 +8791,23 @@ class ProjectGroupService:
             group.description = description
         if add_project_ids:
             # Get current project IDs
-            current_ids = set(row.project_id for row in session.scalars(select(ProjectGroupProject).where(ProjectGroupProject.project_group_id == group_id)).all())
+            current_ids = set(session.scalars(select(ProjectGroupProject.project_id).where(ProjectGroupProject.project_group_id == group_id)))
             new_ids = set(add_project_ids)
             all_ids = list(current_ids | new_ids)
             ProjectGroupService._validate_project_group_uniqueness(project_ids=all_ids, session=session)
             for pid in new_ids - current_ids:
                 session.add(ProjectGroupProject(project_group_id=group_id, project_id=pid))
         if remove_project_ids:
-            current_ids = set(row.project_id for row in session.scalars(select(ProjectGroupProject).where(ProjectGroupProject.project_group_id == group_id)).all())
-            for pid in remove_project_ids:
-                row = session.scalar(select(ProjectGroupProject).where(ProjectGroupProject.project_group_id == group_id, ProjectGroupProject.project_id == pid))
-                if row:
-                    session.delete(row)
+            # Bulk delete; the session is committed right after, so there is no
+            # identity map worth synchronizing
+            session.execute(
+                delete(ProjectGroupProject)
+                .where(
+                    ProjectGroupProject.project_group_id == group_id,
+                    ProjectGroupProject.project_id.in_(remove_project_ids)
+                )
+                .execution_options(synchronize_session=False)
+            )
         session.commit()
         return group
 
@@ -9246,12 +9327,9 @@ class AutoSubmitService:
                 verification_function = group_details.get("verification_function")
                 
                 if verification_function:
-                    from label_pizza.models import QuestionGroup
-                    from sqlalchemy import select
-                    
-                    group = session.execute(
-                        select(QuestionGroup).where(QuestionGroup.id == question_group_id)
-                    ).scalar_one()
+                    group = session.get(QuestionGroup, question_group_id)
+                    if group is None:
+                        raise ValueError(f"Question group with ID {question_group_id} not found")
                     
                     AnnotatorService._run_verification(group, answers)
                     
@@ -9355,12 +9433,9 @@ class ReviewerAutoSubmitService:
                 verification_function = group_details.get("verification_function")
                 
                 if verification_function:
-                    from label_pizza.models import QuestionGroup
-                    from sqlalchemy import select
-                    
-                    group = session.execute(
-                        select(QuestionGroup).where(QuestionGroup.id == question_group_id)
-                    ).scalar_one()
+                    group = session.get(QuestionGroup, question_group_id)
+                    if group is None:
+                        raise ValueError(f"Question group with ID {question_group_id} not found")
                     AnnotatorService._run_verification(group, answers)
                     
             except ValueError as verification_error:
@@ -22,7 +22,6 @@ import os
 import concurrent.futures
 import threading
 from concurrent.futures import ThreadPoolExecutor
-import glob
 from copy import deepcopy
 
 # --------------------------------------------------------------------------- #
@@ -2396,6 +2395,8 @@ def sync_projects(*, projects_path: str | Path | None = None, projects_data: Lis
     
     # Validate and normalize project data
     processed: List[Dict] = []
+    schema_question_types: Dict[str, Dict[str, str]] = {}
+    question_types_by_text: Dict[str, str] = {}
     with tqdm(total=len(projects_data), desc="Validating project data", unit="project") as pbar:
         for idx, cfg in enumerate(projects_data, 1):
             # Validate required fields
@@ -2417,6 +2418,18 @@ def sync_projects(*, projects_path: str | Path | None = None, projects_data: Lis
             video_uids = []
             video_duplicates = []
             
+            # Resolve the types of every question referenced by this project in one query
+            missing_texts = {
+                q["question_text"]
+                for video in cfg["videos"] if isinstance(video, dict)
+                for q in video.get("questions", []) if isinstance(q, dict) and "question_text" in q
+            } - question_types_by_text.keys()
+            if missing_texts:
+                with label_pizza.db.SessionLocal() as sess:
+                    question_types_by_text.update(
+                        QuestionService.get_question_types_by_texts(list(missing_texts), sess)
+                    )
+            
             for video_idx, video in enumerate(cfg["videos"]):
                 # Extract video UID based on format (string or dict)
                 if isinstance(video, str):
@@ -2433,27 +2446,25 @@ def sync_projects(*, projects_path: str | Path | None = None, projects_data: Lis
                             raise ValueError(f"Entry #{idx}, video #{video_idx + 1}: Extra fields: {', '.join(extra)}")
                         
                     video_uid = video["video_uid"]
-                    # Get question types from database
-                    question_types = {}
-                    try:
-                        with label_pizza.db.SessionLocal() as sess:
-                            schema_id = SchemaService.get_schema_id_by_name(cfg["schema_name"], sess)
-                            questions_df = SchemaService.get_schema_questions(schema_id, sess)
-                            if not questions_df.empty:
-                                question_types = dict(zip(questions_df["Text"], questions_df["Type"]))
-                    except:
-                        # Schema doesn't exist, skip validation
-                        pass
+                    # Get question types from database (once per schema)
+                    if cfg["schema_name"] not in schema_question_types:
+                        question_types = {}
+                        try:
+                            with label_pizza.db.SessionLocal() as sess:
+                                schema_id = SchemaService.get_schema_id_by_name(cfg["schema_name"], sess)
+                                question_types = SchemaService.get_schema_question_types(schema_id, sess)
+                        except:
+                            # Schema doesn't exist, skip validation
+                            pass
+                        schema_question_types[cfg["schema_name"]] = question_types
+                    question_types = schema_question_types[cfg["schema_name"]]
                     
                     for question_idx, q in enumerate(video["questions"]):
                         if not isinstance(q, dict):
                             raise ValueError(f"Entry #{idx}, video '{video_uid}', question #{question_idx + 1}: Invalid format")
-                        question_type = None
-                        with label_pizza.db.SessionLocal() as sess:
-                            try:
-                                question_type = QuestionService.get_question_by_text(q["question_text"], sess)["type"]
-                            except:
-                                raise ValueError(f"Entry #{idx}, video '{video_uid}', question #{question_idx + 1}: Question not found in database")
+                        question_type = question_types_by_text.get(q.get("question_text"))
+                        if question_type is None:
+                            raise ValueError(f"Entry #{idx}, video '{video_uid}', question #{question_idx + 1}: Question not found in database")
 
                         if question_type not in ["single", "description"]:
                             raise ValueError(f"Entry #{idx}, video '{video_uid}', question #{question_idx + 1}: Question type must be 'single' or 'description'")
@@ -3251,7 +3262,16 @@ def load_and_flatten_json_files(folder_path: str) -> list[dict]:
         Handles both single objects and arrays in JSON files.
         Prints success/failure for each file loaded.
     """
-    json_files = glob.glob(f"{folder_path}/*.json")
+    # One directory scan; DirEntry answers is_file() from the scan itself.
+    # A missing folder yields no files, as glob did.
+    try:
+        with os.scandir(folder_path) as it:
+            json_files = [
+                entry.path for entry in it
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        json_files = []
     flattened_data = []
     
     for filepath in json_files:
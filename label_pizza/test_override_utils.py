@@ -13,6 +13,8 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+import threading
 
 # Add the current directory to Python path so we can import override_utils
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -314,6 +316,66 @@ class TestDeleteUsingIdFunctions:
             assert result is False
             mock_execute.assert_not_called()
     
+    def test_delete_questions_using_ids_success(self, mock_db):
+        """Test deleting several questions in one confirmation and transaction"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(1,), (2,)]
+        
+        with patch('override_utils._collect_question_dependencies', return_value=[]) as mock_collect_deps, \
+             patch('override_utils._confirm_cascade_deletion', return_value=True) as mock_confirm, \
+             patch('override_utils._execute_delete_operations', return_value=True) as mock_execute:
+            
+            result = override_utils.delete_questions_using_ids([1, 2, 2], backup_first=False)
+            
+            assert result is True
+            assert mock_collect_deps.call_count == 2
+            mock_confirm.assert_called_once()
+            mock_execute.assert_called_once()
+            executed_operations = mock_execute.call_args[0][0]
+            assert [op.identifier for op in executed_operations] == [(1,), (2,)]
+    
+    def test_delete_questions_using_ids_missing(self, mock_db):
+        """Test deleting several questions - one of them not found"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(1,)]
+        
+        with patch('override_utils._execute_delete_operations') as mock_execute:
+            result = override_utils.delete_questions_using_ids([1, 999])
+            
+            assert result is False
+            mock_execute.assert_not_called()
+    
+    def test_delete_videos_using_ids_success(self, mock_db):
+        """Test deleting several videos in one confirmation and transaction"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(3,), (4,)]
+        
+        with patch('override_utils._collect_video_dependencies', return_value=[]) as mock_collect_deps, \
+             patch('override_utils._confirm_cascade_deletion', return_value=True), \
+             patch('override_utils._execute_delete_operations', return_value=True) as mock_execute:
+            
+            result = override_utils.delete_videos_using_ids([3, 4], backup_first=False)
+            
+            assert result is True
+            assert mock_collect_deps.call_count == 2
+            executed_operations = mock_execute.call_args[0][0]
+            assert [(op.table, op.identifier) for op in executed_operations] == [('Video', (3,)), ('Video', (4,))]
+    
+    def test_delete_videos_using_ids_without_confirmation(self, mock_db):
+        """Test batch deletion with confirm=False skips the cascade report"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(3,)]
+        
+        with patch('override_utils._collect_video_dependencies', return_value=[]), \
+             patch('override_utils._confirm_cascade_deletion') as mock_confirm, \
+             patch('override_utils._execute_delete_operations', return_value=True) as mock_execute:
+            
+            result = override_utils.delete_videos_using_ids([3], backup_first=False, confirm=False)
+            
+            assert result is True
+            mock_confirm.assert_not_called()
+            mock_execute.assert_called_once()
+    
     def test_delete_video_tag_using_id_success(self, mock_db):
         """Test successful video tag deletion"""
         mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
@@ -521,6 +583,8 @@ class TestNameManagementFunctions:
     def test_set_user_name_using_id_backup_failure_abort(self, mock_input, mock_db, mock_backup):
         """Test setting user name when backup fails and user aborts"""
         mock_backup.side_effect = Exception("Backup failed")
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchone.return_value = ("old_name",)
         
         result = override_utils.set_user_name_using_id(1, "new_name")
         
@@ -539,11 +603,26 @@ class TestNameManagementFunctions:
     def test_set_user_name_using_id_name_exists(self, mock_db):
         """Test setting user name - name already exists"""
         mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
-        mock_session.execute.return_value.fetchone.side_effect = [("old_name",), ("existing_user",)]
+        lookup_result = Mock()
+        lookup_result.fetchone.return_value = ("old_name",)
+        mock_session.execute.side_effect = [lookup_result, IntegrityError("UPDATE", {}, Exception("duplicate key"))]
         
         result = override_utils.set_user_name_using_id(1, "existing_name", backup_first=False)
         
         assert result is False
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+    
+    def test_set_user_name_using_id_unchanged_skips_backup(self, mock_db, mock_backup):
+        """Test setting user name to its current value - no backup, no update"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchone.return_value = ("same_name",)
+        
+        result = override_utils.set_user_name_using_id(1, "same_name")
+        
+        assert result is True
+        mock_backup.assert_not_called()
+        mock_session.commit.assert_not_called()
     
     def test_set_user_name_using_id_success(self, mock_db, mock_backup):
         """Test successful user name update"""
@@ -556,6 +635,54 @@ class TestNameManagementFunctions:
         mock_backup.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    def test_set_user_name_single_statement(self, mock_db):
+        """Test renaming by user_id_str finds and updates the row in one UPDATE ... RETURNING"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchone.return_value = (1,)
+        
+        result = override_utils.set_user_name("old_name", "new_name", backup_first=False)
+        
+        assert result is True
+        assert mock_session.execute.call_count == 1
+        assert "RETURNING id" in str(mock_session.execute.call_args[0][0])
+        mock_session.commit.assert_called_once()
+    
+    def test_set_user_name_not_found(self, mock_db):
+        """Test renaming a missing user_id_str rolls back and reports failure"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchone.return_value = None
+        
+        result = override_utils.set_user_name("missing", "new_name", backup_first=False)
+        
+        assert result is False
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    
+    def test_set_question_names_single_update(self, mock_db):
+        """Test renaming several questions with one lookup and one executemany"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(1, "old a"), (2, "old b"), (3, "same")]
+        
+        result = override_utils.set_question_names(
+            [("old a", "new a"), ("old b", "new b"), ("same", "same")], backup_first=False
+        )
+        
+        assert result is True
+        assert mock_session.execute.call_count == 2
+        update_params = mock_session.execute.call_args[0][1]
+        assert update_params == [{"text": "new a", "id": 1}, {"text": "new b", "id": 2}]
+        mock_session.commit.assert_called_once()
+    
+    def test_set_question_names_missing_text(self, mock_db):
+        """Test renaming several questions - one current text not found"""
+        mock_session = mock_db.SessionLocal.return_value.__enter__.return_value
+        mock_session.execute.return_value.fetchall.return_value = [(1, "old a")]
+        
+        result = override_utils.set_question_names([("old a", "new a"), ("missing", "new b")], backup_first=False)
+        
+        assert result is False
+        mock_session.commit.assert_not_called()
 
 # ============================================================================
 # INTEGRATION AND EDGE CASE TESTS
@@ -736,6 +863,63 @@ def test_delete_operation_namedtuple():
     assert operation.backup_params['backup_first'] is True
 
 
+
+def test_backup_batch_reuses_first_backup(mock_backup, sample_backup_params):
+    """Test that operations inside backup_batch share one backup"""
+    with patch('override_utils.get_db_url_for_backup', return_value="postgresql://test"):
+        with override_utils.backup_batch():
+            first = override_utils._create_backup_for_operations(sample_backup_params)
+            second = override_utils._create_backup_for_operations(sample_backup_params)
+        assert first == second == "/backups/test_backup.sql.gz"
+        assert mock_backup.call_count == 1
+        
+        override_utils._create_backup_for_operations(sample_backup_params)
+        assert mock_backup.call_count == 2
+
+def _fake_dump(started=None, release=None):
+    """Return a stand-in for _dump_backup_to that writes 'new' once release is set"""
+    def dump(backup_params, output_file):
+        if started is not None:
+            started.set()
+        if release is not None:
+            release.wait(5)
+        with open(output_file, "w") as f:
+            f.write("new")
+        return output_file
+    return dump
+
+def test_cancelled_background_backup_keeps_existing_file(tmp_path):
+    """Test that cancelling a deletion never touches the caller's backup file"""
+    existing = tmp_path / "named.sql.gz"
+    existing.write_text("old")
+    params = {"backup_first": True, "backup_dir": str(tmp_path), "backup_file": "named.sql.gz", "compress": True}
+    started, release = threading.Event(), threading.Event()
+    
+    with patch('override_utils._dump_backup_to', _fake_dump(started, release)):
+        pending = override_utils._start_backup_in_background([DeleteOperation('User', 'using_id', (1,), params)])
+        assert started.wait(5)
+        override_utils._discard_background_backup(pending)
+        assert not pending.future.done()  # Cancelling did not wait for the dump
+        cleaned_up = threading.Event()
+        pending.future.add_done_callback(lambda _: cleaned_up.set())  # Runs after the discard callback
+        release.set()
+        assert cleaned_up.wait(5)
+    
+    assert existing.read_text() == "old"
+    assert not os.path.exists(pending.temp_file)
+
+def test_confirmed_background_backup_moves_into_place(tmp_path):
+    """Test that a confirmed background backup replaces its temp file with the named file"""
+    params = {"backup_first": True, "backup_dir": str(tmp_path), "backup_file": "named.sql", "compress": True}
+    
+    with patch('override_utils._dump_backup_to', _fake_dump()):
+        pending = override_utils._start_backup_in_background([DeleteOperation('User', 'using_id', (1,), params)])
+        backup_file = override_utils._finish_background_backup(pending)
+    
+    assert backup_file == str(tmp_path / "named.sql.gz")
+    assert (tmp_path / "named.sql.gz").read_text() == "new"
+    assert not os.path.exists(pending.temp_file)
+
 # ============================================================================
 # PYTEST CONFIGURATION
 # ============================================================================
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from functools import lru_cache
 from label_pizza.services import AuthService
 
 ###############################################################################
@@ -26,8 +27,9 @@ COLORS = {
 #     box-shadow: 0 2px 8px {color}20;
 #     """
 
+@lru_cache(maxsize=32)
 def get_card_style(color, opacity=0.15):
-    """Generate consistent card styling"""
+    """Generate consistent card styling (memoized - the palette is small and fixed)"""
     # Convert decimal opacity to hex alpha value
     hex_alpha = format(int(opacity * 255), '02x')
     return f"""
@@ -7,6 +7,7 @@ import importlib.util
 import sys
 import json
 import inspect
+import threading
 from typing import Dict, Callable, Optional, List, Set
 from pathlib import Path
 import os
@@ -86,34 +87,60 @@ class VerificationRegistry:
 # Global registry instance
 _registry = VerificationRegistry()
 
+# Config workspaces are loaded on first use instead of at import time, but
+# still relative to the working directory the module was imported from
+_auto_loaded = False
+_auto_load_lock = threading.Lock()
+_import_cwd = Path.cwd()
+
+def _ensure_auto_loaded() -> None:
+    """Load the workspaces listed in verification_config.json once"""
+    global _auto_loaded
+    if _auto_loaded:
+        return
+    with _auto_load_lock:
+        if not _auto_loaded:
+            auto_load_workspaces(_import_cwd)
+            # Only publish once loading finishes, so other threads never see a partial registry
+            _auto_loaded = True
+
 def register_workspace(workspace_path: str) -> None:
     """Register verification functions from workspace"""
+    # Config workspaces go first, as they did when they loaded at import
+    _ensure_auto_loaded()
     _registry.register_workspace(workspace_path)
 
 def get_verification_function(function_name: str) -> Optional[Callable]:
     """Get verification function by name"""
+    _ensure_auto_loaded()
     return _registry.get_function(function_name)
 
 def has_verification_function(function_name: str) -> bool:
     """Check if verification function exists"""
+    _ensure_auto_loaded()
     return _registry.has_function(function_name)
 
 def list_verification_functions() -> List[str]:
     """List all available verification functions"""
+    _ensure_auto_loaded()
     return _registry.list_functions()
 
 def get_verification_function_source(function_name: str) -> Optional[str]:
     """Get workspace path where function was loaded from"""
+    _ensure_auto_loaded()
     return _registry.get_function_source(function_name)
 
 def clear_registry() -> None:
     """Clear all registered functions (useful for testing)"""
-    _registry.clear()
+    global _auto_loaded
+    with _auto_load_lock:
+        _auto_loaded = True  # Do not reload config workspaces after an explicit clear
+        _registry.clear()
 
 
-def load_verification_config() -> List[str]:
-    """Load workspace paths from config file"""
-    config_file = Path("verification_config.json")
+def load_verification_config(base_dir: Optional[Path] = None) -> List[str]:
+    """Load workspace paths from config file in base_dir (default: current directory)"""
+    config_file = Path(base_dir or ".") / "verification_config.json"
     if config_file.exists():
         try:
             with open(config_file, 'r') as f:
@@ -124,12 +151,13 @@ def load_verification_config() -> List[str]:
     return []
 
 
-def auto_load_workspaces() -> None:
-    """Automatically load all workspaces from config"""
-    workspace_paths = load_verification_config()
-    for workspace_path in workspace_paths:
-        if Path(workspace_path).exists():
-            register_workspace(workspace_path)
+def auto_load_workspaces(base_dir: Optional[Path] = None) -> None:
+    """Automatically load all workspaces from config, resolving relative paths against base_dir"""
+    base_dir = Path(base_dir or ".")
+    for workspace_path in load_verification_config(base_dir):
+        workspace_path = base_dir / workspace_path
+        if workspace_path.exists():
+            _registry.register_workspace(str(workspace_path))
 
 
 class VerifyModule:
@@ -152,7 +180,4 @@ class VerifyModule:
 
 
 # Create backward-compatible verify module instance
-verify = VerifyModule()
-
-# Auto-load workspaces when module is imported
-auto_load_workspaces()
\ No newline at end of file
+verify = VerifyModule()
\ No newline at end of file
@@ -93,7 +93,7 @@ def test_schema(session):
     )
     
     # Create schema with the question group
-    schema = SchemaService.create_schema("test_schema", [group.id], session)
+    schema = SchemaService.create_schema(name="test_schema", question_group_ids=[group.id], session=session)
     return schema
 
 @pytest.fixture
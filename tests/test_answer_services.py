@@ -1,9 +1,9 @@
 import pytest
-from label_pizza.services import AnnotatorService, GroundTruthService, ProjectService, AuthService, QuestionService, QuestionGroupService
+from label_pizza.services import _compact_frame, AnnotatorService, GroundTruthService, ProjectService, AuthService, QuestionService, QuestionGroupService
 import pandas as pd
 from datetime import datetime, timezone
 from sqlalchemy import select
-from label_pizza.models import Question, QuestionGroupQuestion, SchemaQuestionGroup, Project, AnnotatorAnswer, AnswerReview
+from label_pizza.models import Question, QuestionGroupQuestion, SchemaQuestionGroup, Project, AnnotatorAnswer, AnswerReview, ReviewerGroundTruth
 
 def test_annotator_service_submit_answer_to_question_group(session, test_user, test_project, test_video, test_question_group):
     """Test submitting answers to a question group."""
@@ -237,6 +237,46 @@ def test_annotator_service_get_question_answers(session, test_user, test_project
     assert result.iloc[0]["Answer Value"] == "option1"
     assert result.iloc[0]["User ID"] == test_user.id
 
+def test_compact_frame_downcasts_ids_and_categorizes_labels():
+    """Test _compact_frame compacts a populated frame in place and returns it."""
+    df = pd.DataFrame({"Video ID": [1, 2, 300], "Answer Value": ["yes", "no", "yes"]})
+    result = _compact_frame(df, id_columns=["Video ID"], category_columns=["Answer Value"])
+    assert result is df
+    assert result["Video ID"].dtype == "int16"
+    assert result["Video ID"].tolist() == [1, 2, 300]
+    assert isinstance(result["Answer Value"].dtype, pd.CategoricalDtype)
+    assert result["Answer Value"].tolist() == ["yes", "no", "yes"]
+
+def test_annotator_service_get_question_answers_compact_dtypes(session, test_user, test_project, test_video):
+    """Test populated question answer frames keep their rows with compact dtypes."""
+    annotator = AuthService.create_user(
+        user_id="compact_annotator",
+        email="compact_annotator@example.com",
+        password_hash="test_hash",
+        user_type="human",
+        session=session
+    )
+    ProjectService.add_user_to_project(test_project.id, annotator.id, "annotator", session)
+    group = QuestionGroupService.get_group_by_name("test_group_for_schema", session)
+    for user, value in [(test_user, "option1"), (annotator, "option2")]:
+        AnnotatorService.submit_answer_to_question_group(
+            video_id=test_video.id,
+            project_id=test_project.id,
+            user_id=user.id,
+            question_group_id=group.id,
+            answers={"test question for schema": value},
+            session=session
+        )
+    question = QuestionService.get_question_by_text("test question for schema", session)
+    
+    result = AnnotatorService.get_question_answers(question_id=question["id"], project_id=test_project.id, session=session)
+    assert isinstance(result, pd.DataFrame)
+    assert sorted(result["User ID"].tolist()) == sorted([test_user.id, annotator.id])
+    assert result["Video ID"].dtype == "int8"
+    assert result["User ID"].dtype == "int8"
+    assert isinstance(result["Answer Value"].dtype, pd.CategoricalDtype)
+    assert set(result["Answer Value"]) == {"option1", "option2"}
+
 def test_ground_truth_service_submit_ground_truth(session, test_user, test_project, test_video, test_question_group):
     """Test submitting ground truth answers."""
     answers = {
@@ -751,4 +791,50 @@ def test_ground_truth_service_submit_answer_review_single_choice(session, test_u
 def test_ground_truth_service_get_answer_review_nonexistent(session):
     """Test getting review for non-existent answer."""
     review_result = GroundTruthService.get_answer_review(999, session)
-    assert review_result is None
\ No newline at end of file
+    assert review_result is None
+
+
+def test_ground_truth_service_check_all_questions_have_ground_truth_for_group(session, test_user, test_project, test_video):
+    """Test the group completeness check counts ground truth against the group's questions."""
+    question_ids = [
+        QuestionService.add_question(
+            text=f"completeness question {i}",
+            qtype="description",
+            options=None,
+            default=None,
+            session=session
+        ).id
+        for i in (1, 2)
+    ]
+    group = QuestionGroupService.create_group(
+        title="completeness_group",
+        display_title="completeness_group",
+        description="test description",
+        is_reusable=False,
+        question_ids=question_ids,
+        verification_function=None,
+        session=session
+    )
+    
+    assert not GroundTruthService.check_all_questions_have_ground_truth_for_group(
+        test_video.id, test_project.id, group.id, session
+    )
+    
+    # Ground truth for only one of the two questions is still incomplete
+    session.add(ReviewerGroundTruth(
+        video_id=test_video.id, question_id=question_ids[0], project_id=test_project.id,
+        reviewer_id=test_user.id, answer_type="description", answer_value="a", original_answer_value="a"
+    ))
+    session.commit()
+    assert not GroundTruthService.check_all_questions_have_ground_truth_for_group(
+        test_video.id, test_project.id, group.id, session
+    )
+    
+    session.add(ReviewerGroundTruth(
+        video_id=test_video.id, question_id=question_ids[1], project_id=test_project.id,
+        reviewer_id=test_user.id, answer_type="description", answer_value="b", original_answer_value="b"
+    ))
+    session.commit()
+    assert GroundTruthService.check_all_questions_have_ground_truth_for_group(
+        test_video.id, test_project.id, group.id, session
+    )
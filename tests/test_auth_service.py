@@ -1,5 +1,6 @@
 import pytest
 from label_pizza.services import AuthService, ProjectService
+from label_pizza.models import Project
 import pandas as pd
 
 def test_auth_service_create_user(session):
@@ -143,6 +144,14 @@ def test_auth_service_archive_user(session, test_user):
     assert user is not None
     assert user.is_archived
 
+def test_auth_service_get_user_counts(session, test_user):
+    """Test user counts derived from the grouped breakdown."""
+    AuthService.create_user(user_id="model_user", email=None, password_hash="test_hash", user_type="model", session=session)
+    AuthService.create_user(user_id="human_user", email="human@example.com", password_hash="test_hash", user_type="human", session=session)
+    AuthService.toggle_user_archived(test_user.id, session)
+    counts = AuthService.get_user_counts(session)
+    assert counts == {"total": 3, "active": 2, "archived": 1, "admin": 1, "human": 1, "model": 1}
+
 def test_auth_service_archive_user_not_found(session):
     """Test archiving a non-existent user."""
     with pytest.raises(ValueError, match="User with ID 999 not found"):
@@ -343,6 +352,27 @@ def test_auth_service_get_project_assignments(session, test_user, test_project):
     assert len(df) == 3 # 1 admin, 1 annotator, 1 reviewer
 
 
+def test_auth_service_get_project_assignments_compact_dtypes(session, test_user, test_project):
+    """Test populated assignment frames keep their rows with compact ID and role dtypes."""
+    annotator = AuthService.create_user(
+        user_id="compact_user",
+        email="compact@example.com",
+        password_hash="test_hash",
+        user_type="human",
+        session=session
+    )
+    ProjectService.add_user_to_project(test_project.id, annotator.id, "annotator", session)
+    
+    df = AuthService.get_project_assignments(session)
+    assert isinstance(df, pd.DataFrame)
+    annotator_rows = df[df["User ID"] == annotator.id]
+    assert annotator_rows["Role"].tolist() == ["annotator"]
+    assert (df["Project ID"] == test_project.id).all()
+    assert df["Project ID"].dtype == "int8"
+    assert df["User ID"].dtype == "int8"
+    assert isinstance(df["Role"].dtype, pd.CategoricalDtype)
+
+
 def test_auth_service_get_project_assignments_with_archived(session, test_user, test_project):
     """Test getting project assignments including archived ones."""
     # Add user to project
@@ -427,4 +457,28 @@ def test_auth_service_update_user_email_model_user(session):
 def test_auth_service_update_user_email_to_none(session, test_user):
     """Test that human/admin users cannot have their email set to None."""
     with pytest.raises(ValueError, match="Email is required for human and admin users"):
-        AuthService.update_user_email(test_user.id, None, session) 
\ No newline at end of file
+        AuthService.update_user_email(test_user.id, None, session) 
+
+
+def test_auth_service_bulk_remove_users_from_projects(session, test_project):
+    """Test bulk removal verifies every pair against the prefetched assignments."""
+    users = [
+        AuthService.create_user(
+            user_id=f"bulk_user_{i}",
+            email=f"bulk{i}@example.com",
+            password_hash="test_hash",
+            user_type="human",
+            session=session
+        )
+        for i in range(2)
+    ]
+    user_ids = [u.id for u in users]
+    ProjectService.add_user_to_project(test_project.id, user_ids[0], "reviewer", session)
+    
+    # The second user has no assignment, so the whole batch is rejected
+    with pytest.raises(ValueError, match="bulk_user_1 → test_project"):
+        AuthService.bulk_remove_users_from_projects(user_ids, [test_project.id], "reviewer", session)
+    
+    assert AuthService.bulk_remove_users_from_projects(user_ids[:1], [test_project.id], "reviewer", session) == 1
+    with pytest.raises(ValueError, match="No active assignments"):
+        AuthService.bulk_remove_users_from_projects(user_ids[:1], [test_project.id], "reviewer", session)
@@ -1,5 +1,5 @@
 import pytest
-from label_pizza.services import ProjectService, SchemaService, QuestionService, QuestionGroupService, VideoService
+from label_pizza.services import ProjectService, SchemaService, QuestionService, QuestionGroupService, VideoService, GroundTruthService
 import pandas as pd
 
 def test_project_service_create_project(session, test_schema, test_video):
@@ -137,4 +137,34 @@ def test_project_service_get_project_schema_archived(session, test_project):
     project = ProjectService.get_project_by_id(test_project.id, session)
     assert project.is_archived
     schema = SchemaService.get_schema_by_id(project.schema_id, session)
-    assert schema.id == test_project.schema_id 
\ No newline at end of file
+    assert schema.id == test_project.schema_id 
+
+
+def test_project_service_get_bulk_project_completion_data(session, test_user, test_project, test_video):
+    """Test bulk completion data counts videos, schema questions and ground truth per project."""
+    VideoService.add_video(video_uid="second.mp4", url="http://example.com/second.mp4", session=session)
+    second_video = VideoService.get_video_by_uid("second.mp4", session)
+    ProjectService.create_project(
+        name="second_project",
+        description="test description",
+        schema_id=test_project.schema_id,
+        video_ids=[test_video.id, second_video.id],
+        session=session
+    )
+    second_project = ProjectService.get_project_by_name("second_project", session)
+    group = QuestionGroupService.get_group_by_name("test_group_for_schema", session)
+    GroundTruthService.submit_ground_truth_to_question_group(
+        video_id=test_video.id,
+        project_id=second_project.id,
+        reviewer_id=test_user.id,
+        question_group_id=group.id,
+        answers={"test question for schema": "option1"},
+        session=session
+    )
+    
+    result = ProjectService.get_bulk_project_completion_data([test_project.id, second_project.id], session)
+    first, second = result[test_project.id], result[second_project.id]
+    assert (first["video_count"], first["question_count"], first["gt_count"]) == (1, 1, 0)
+    assert not first["has_full_ground_truth"]
+    assert (second["video_count"], second["question_count"], second["gt_count"]) == (2, 1, 1)
+    assert second["completion_percentage"] == 50.0
@@ -120,6 +120,13 @@ def test_question_service_get_question_by_text_not_found(session):
     with pytest.raises(ValueError, match="Question with text 'non_existent_question' not found"):
         QuestionService.get_question_by_text("non_existent_question", session)
 
+def test_question_service_get_question_types_by_texts(session, test_question):
+    """Test getting question types for several texts at once."""
+    question_types = QuestionService.get_question_types_by_texts(
+        ["test question", "non_existent_question"], session
+    )
+    assert question_types == {"test question": "single"}
+
 def test_question_service_archive_question(session, test_question):
     """Test archiving a question."""
     QuestionService.archive_question(test_question["id"], session)
@@ -292,4 +299,33 @@ def test_question_service_edit_question_single_choice_invalid_default(session, t
             new_opts=["option1", "option2"],
             new_default="invalid",
             session=session
-        )
\ No newline at end of file
+        )
+
+def test_question_service_search_questions_paginates_with_total(session):
+    """Test search pages carry the full match count, including past the last page."""
+    for i in range(5):
+        QuestionService.add_question(
+            text=f"paged question {i}",
+            qtype="description",
+            options=None,
+            default=None,
+            session=session
+        )
+    
+    first_page = QuestionService.search_questions(search_term="paged", page=0, page_size=2, session=session)
+    assert len(first_page["questions"]) == 2
+    assert first_page["total_count"] == 5
+    assert first_page["total_pages"] == 3
+    
+    last_page = QuestionService.search_questions(search_term="paged", page=2, page_size=2, session=session)
+    assert len(last_page["questions"]) == 1
+    assert last_page["total_count"] == 5
+    
+    past_last_page = QuestionService.search_questions(search_term="paged", page=5, page_size=2, session=session)
+    assert past_last_page["questions"].empty
+    assert past_last_page["total_count"] == 5
+    
+    no_match = QuestionService.search_questions(search_term="missing", page=0, page_size=2, session=session)
+    assert no_match["questions"].empty
+    assert no_match["total_count"] == 0
+    assert no_match["total_pages"] == 1
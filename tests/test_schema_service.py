@@ -157,6 +157,11 @@ def test_schema_service_get_schema_questions_not_found(session):
     with pytest.raises(ValueError, match="Schema with ID 999 not found"):
         SchemaService.get_schema_questions(999, session)
 
+def test_schema_service_get_schema_question_types(session, test_schema):
+    """Test getting question text -> type for a schema."""
+    question_types = SchemaService.get_schema_question_types(test_schema.id, session)
+    assert question_types == {"test question for schema": "single"}
+
 def test_schema_service_get_question_group_order(test_schema, session):
     """Test getting question group order in a schema."""
     # Get the order of question groups
@@ -447,4 +447,14 @@ def test_video_service_get_all_videos_with_review(session, test_video, test_user
     assert progress["total_questions"] == 2
     assert progress["total_answers"] == 2
     assert progress["ground_truth_answers"] == 2  # Both questions have ground truth
-    assert progress["completion_percentage"] == 100.0  # All questions have ground truth 
\ No newline at end of file
+    assert progress["completion_percentage"] == 100.0  # All questions have ground truth 
+
+def test_video_service_search_videos_paginates_with_total(session):
+    """Test video search returns one page together with the full match count."""
+    for i in range(3):
+        VideoService.add_video(video_uid=f"paged_{i}.mp4", url=f"http://example.com/paged_{i}.mp4", session=session)
+    
+    result = VideoService.search_videos(search_term="paged", page=1, page_size=2, session=session)
+    assert len(result["videos"]) == 1
+    assert result["total_count"] == 3
+    assert result["total_pages"] == 2